@@ -0,0 +1,140 @@
+"""
+Traduction SID <-> nom de compte des titulaires des droits utilisateur (AccountNameCache) :
+un seul lot par exécution, aucune nouvelle requête pour les comptes connus, repli hors ligne
+sur les SID bien connus et fichier --sid-cache.
+"""
+import json
+
+import pytest
+
+from win11cis import core
+from win11cis.cli import parse_arguments
+from win11cis.core import (
+    SID_ADMINISTRATORS, SID_BACKUP_OPERATORS, SID_GUESTS, AccountNameCache, PowerShellError, ScanRun,
+    format_accounts, parse_user_rights, user_right_holders,
+)
+
+ALICE = "S-1-5-21-1-2-3-1001"
+SVC_BACKUP = "S-1-5-21-1-2-3-1002"
+ORPHAN = "S-1-5-21-9-9-9-1500"
+
+# Traductions connues du poste audité
+HOST_ACCOUNTS = {ALICE: "POSTE\\alice", "POSTE\\svc_backup": SVC_BACKUP}
+
+POLICY = {"Privilege Rights": {
+    "SeNetworkLogonRight": f"*{SID_ADMINISTRATORS},*{ALICE}",
+    "SeBackupPrivilege": f"*{SID_BACKUP_OPERATORS},POSTE\\svc_backup",
+    # Nom localisé bien connu, SID orphelin et compte supprimé
+    "SeDenyNetworkLogonRight": f"Invités,BUILTIN\\Administrators,*{ORPHAN},POSTE\\fantome",
+}}
+
+UNKNOWN = [ALICE, ORPHAN, "POSTE\\fantome", "POSTE\\svc_backup"]
+
+
+class FakeLookup:
+    """
+    Remplace le worker PowerShell : enregistre chaque script et répond comme ACCOUNT_LOOKUP_SCRIPT.
+    """
+
+    def __init__(self, error=None):
+        self.commands = []
+        self.error = error
+
+    def accounts(self, command):
+        return sorted(account for account in UNKNOWN if "'" + account + "'" in command)
+
+    def __call__(self, command):
+        self.commands.append(command)
+        if self.error:
+            raise self.error
+        return [{"account": account, "translation": HOST_ACCOUNTS.get(account)} for account in self.accounts(command)]
+
+
+def accounts_of(policy):
+    return {account for holders in user_right_holders(policy).values() for account in holders}
+
+
+def test_unknown_accounts_are_translated_in_one_lookup():
+    cache = AccountNameCache()
+    lookup = FakeLookup()
+    cache.resolve(accounts_of(POLICY), lookup)
+    assert len(lookup.commands) == 1
+    # Seuls les comptes inconnus sont demandés, les SID et noms bien connus ne le sont pas
+    assert lookup.accounts(lookup.commands[0]) == sorted(UNKNOWN)
+    assert SID_ADMINISTRATORS not in lookup.commands[0] and "Invités" not in lookup.commands[0]
+    rights = parse_user_rights(POLICY, cache)
+    assert rights["SeNetworkLogonRight"] == {SID_ADMINISTRATORS, ALICE}
+    assert rights["SeBackupPrivilege"] == {SID_BACKUP_OPERATORS, SVC_BACKUP}
+    assert rights["SeDenyNetworkLogonRight"] == {SID_GUESTS, SID_ADMINISTRATORS, ORPHAN, "POSTE\\fantome"}
+    assert format_accounts(rights["SeBackupPrivilege"], cache) == "Backup Operators, POSTE\\svc_backup"
+    assert format_accounts(rights["SeNetworkLogonRight"], cache) == "Administrators, POSTE\\alice"
+
+
+@pytest.mark.parametrize("error", [None, PowerShellError("refusé"), OSError("worker arrêté")])
+def test_known_accounts_are_not_looked_up_again(error):
+    cache = AccountNameCache()
+    cache.resolve(accounts_of(POLICY), FakeLookup(error))
+    # Les comptes non traduits (ou dont la traduction a échoué) sont mémorisés aussi
+    lookup = FakeLookup()
+    cache.resolve(accounts_of(POLICY), lookup)
+    assert lookup.commands == []
+
+
+def test_offline_uses_well_known_accounts():
+    cache = AccountNameCache()
+    cache.resolve(accounts_of(POLICY), None)
+    rights = parse_user_rights(POLICY, cache)
+    assert rights["SeDenyNetworkLogonRight"] == {SID_GUESTS, SID_ADMINISTRATORS, ORPHAN, "POSTE\\fantome"}
+    # Noms inconnus hors ligne : conservés tels quels, SID affichés bruts
+    assert rights["SeBackupPrivilege"] == {SID_BACKUP_OPERATORS, "POSTE\\svc_backup"}
+    assert format_accounts(rights["SeNetworkLogonRight"], cache) == f"Administrators, {ALICE}"
+    # Les comptes restent à traduire lors d'une analyse en direct
+    lookup = FakeLookup()
+    cache.resolve(accounts_of(POLICY), lookup)
+    assert lookup.accounts(lookup.commands[0]) == sorted(UNKNOWN)
+
+
+def test_sid_cache_round_trip(tmp_path):
+    path = str(tmp_path / "sids.json")
+    assert parse_arguments(["--sid-cache", path]).sid_cache == path
+    cache = AccountNameCache(path)
+    cache.resolve(accounts_of(POLICY), FakeLookup())
+    cache.save()
+    # Les SID inconnus du poste ne sont pas enregistrés
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {ALICE: "POSTE\\alice", SVC_BACKUP: "POSTE\\svc_backup"}
+
+    reloaded = AccountNameCache(path)
+    lookup = FakeLookup()
+    reloaded.resolve([ALICE, "POSTE\\svc_backup", SID_GUESTS], lookup)
+    assert lookup.commands == []
+    assert parse_user_rights(POLICY, reloaded)["SeBackupPrivilege"] == {SID_BACKUP_OPERATORS, SVC_BACKUP}
+    assert reloaded.name(ALICE) == "POSTE\\alice"
+
+
+class FakeWorker:
+    def __init__(self, lookup):
+        self.request = lookup
+
+
+def live_user_rights(run, lookup, monkeypatch):
+    """
+    Droits utilisateur d'une exécution « en direct » : export secedit collecté, puis traduction
+    par un worker PowerShell factice.
+    """
+    run.source("secedit")
+    with monkeypatch.context() as patch:
+        patch.setattr(core.os, "name", "nt")
+        patch.setattr(run, "powershell", lambda: FakeWorker(lookup))
+        return run.user_rights()
+
+
+def test_later_run_reuses_translations(monkeypatch):
+    monkeypatch.setitem(core.COLLECTORS, "secedit", lambda run: POLICY)
+    cache = AccountNameCache()
+    lookup = FakeLookup()
+    first = live_user_rights(ScanRun([], accounts=cache), lookup, monkeypatch)
+    second = live_user_rights(ScanRun([], accounts=cache), lookup, monkeypatch)
+    assert len(lookup.commands) == 1
+    assert first == second
+    assert second["SeNetworkLogonRight"] == {SID_ADMINISTRATORS, ALICE}
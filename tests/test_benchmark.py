@@ -0,0 +1,39 @@
+"""
+Banc d'essai synthétique : les hôtes générés sont évaluables par tous les contrôles.
+"""
+import random
+
+import pytest
+
+from win11cis.benchmark import generate_host_snapshot
+from win11cis.core import CollectionPlan, RegistrySnapshot, ScanRun, ServiceInventory, Status
+from win11cis.sections import load_checks
+
+
+def synthetic_run(seed, compliance, missing_rate, check_list, plan):
+    security_policy, audit_policy, registry, services = generate_host_snapshot(
+        random.Random(seed), compliance, missing_rate, check_list, plan)
+    run = ScanRun(check_list)
+    run.sources.update(secedit=security_policy, auditpol=audit_policy,
+                       registry=RegistrySnapshot.from_dict(registry), services=ServiceInventory.from_dict(services))
+    return run.run(report=False)
+
+
+@pytest.mark.parametrize("compliance, missing_rate", [(0.7, 0.1), (1.0, 0.0), (0.0, 0.0), (0.5, 0.5)])
+def test_synthetic_hosts_have_no_errors(compliance, missing_rate):
+    check_list = load_checks()
+    plan = CollectionPlan(check_list)
+    for seed in range(10):
+        results = synthetic_run(seed, compliance, missing_rate, check_list, plan)
+        assert len(results) == len(check_list)
+        errors = [result for result in results if result.status in (Status.ERROR, Status.TIMEOUT)]
+        assert not errors, errors
+
+
+def test_composite_samples_follow_compliance():
+    check_list = load_checks()
+    plan = CollectionPlan(check_list)
+    composite = ("2.3.10.7", "2.3.10.8", "18.9.7.1.5", "18.9.7.1.6")
+    for compliance, status in ((1.0, Status.COMPLIANT), (0.0, Status.NON_COMPLIANT)):
+        results = {result.cis_id: result for result in synthetic_run(0, compliance, 0.0, check_list, plan)}
+        assert [results[cis_id].status for cis_id in composite] == [status] * len(composite)
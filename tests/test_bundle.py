@@ -0,0 +1,98 @@
+"""
+Évaluation hors ligne d'un bundle de collecte (secedit, auditpol, registre et services).
+"""
+import json
+import os
+
+import pytest
+
+from win11cis.core import (
+    BUNDLE_AUDITPOL, BUNDLE_REGISTRY, BUNDLE_SECEDIT, BUNDLE_SERVICES, ScanRun, SnapshotBundle, Status,
+    format_audit_policy, format_security_policy,
+)
+from win11cis.sections import select_checks
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "bundle.json")
+
+# Contrôles évalués, par collecteur
+SECEDIT_CHECKS = ["1.1.1", "1.1.4", "2.2.1", "2.2.2"]
+AUDITPOL_CHECKS = ["17.1.1", "17.2.1"]
+REGISTRY_CHECKS = ["1.1.6", "1.1.7", "1.2.3"]
+SERVICE_CHECKS = ["5.1", "5.2", "5.3"]
+
+EXPECTED = {
+    "1.1.1": Status.COMPLIANT,
+    "1.1.4": Status.NON_COMPLIANT,
+    "2.2.1": Status.NON_COMPLIANT,
+    "2.2.2": Status.COMPLIANT,
+    "17.1.1": Status.COMPLIANT,
+    "17.2.1": Status.NON_COMPLIANT,
+    "1.1.6": Status.COMPLIANT,
+    "1.1.7": Status.NON_COMPLIANT,
+    "1.2.3": Status.NON_COMPLIANT,
+    "5.1": Status.COMPLIANT,
+    "5.2": Status.NON_COMPLIANT,
+    "5.3": Status.COMPLIANT,
+}
+
+# Fichier du bundle -> (entrée du fixture, sérialisation)
+SERIALIZERS = {
+    BUNDLE_SECEDIT: ("secedit", format_security_policy),
+    BUNDLE_AUDITPOL: ("auditpol", format_audit_policy),
+    BUNDLE_REGISTRY: ("registry", json.dumps),
+    BUNDLE_SERVICES: ("services", json.dumps),
+}
+
+
+def write_fixture_bundle(directory, omit=()):
+    """
+    Écrit le bundle du fixture dans `directory`, sans les fichiers `omit`.
+    """
+    with open(FIXTURE, encoding="utf-8") as f:
+        data = json.load(f)
+    for name, (entry, serialize) in SERIALIZERS.items():
+        if name not in omit:
+            with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+                f.write(serialize(data[entry]))
+    return SnapshotBundle(str(directory))
+
+
+def evaluate(bundle):
+    checks = select_checks(only=list(EXPECTED))
+    run = ScanRun(checks, bundle=bundle)
+    run.collect()
+    run.evaluate()
+    return run, {cis_id: result.status for cis_id, result in run.results.items()}
+
+
+def test_bundle_statuses(tmp_path):
+    run, statuses = evaluate(write_fixture_bundle(tmp_path))
+    assert statuses == EXPECTED
+    assert run.results["1.2.3"].message_key == "value_missing"
+    assert run.results["5.3"].message_key == "not_installed"
+    assert run.host == os.path.basename(str(tmp_path))
+
+
+@pytest.mark.parametrize("omitted, failing", [
+    (BUNDLE_AUDITPOL, AUDITPOL_CHECKS),
+    (BUNDLE_SECEDIT, SECEDIT_CHECKS),
+    (BUNDLE_SERVICES, SERVICE_CHECKS),
+])
+def test_absent_collector(tmp_path, omitted, failing):
+    run, statuses = evaluate(write_fixture_bundle(tmp_path, omit=(omitted,)))
+    for cis_id in failing:
+        assert statuses[cis_id] is Status.ERROR, cis_id
+        assert omitted in str(run.results[cis_id].observed)
+    # Les contrôles des autres collecteurs ne sont pas affectés
+    assert {cis_id: status for cis_id, status in statuses.items() if cis_id not in failing} == {
+        cis_id: status for cis_id, status in EXPECTED.items() if cis_id not in failing
+    }
+
+
+def test_absent_registry(tmp_path):
+    # Les types de démarrage des services viennent de services.json : seules les règles de registre échouent
+    run, statuses = evaluate(write_fixture_bundle(tmp_path, omit=(BUNDLE_REGISTRY,)))
+    for cis_id in REGISTRY_CHECKS:
+        assert statuses[cis_id] is Status.ERROR, cis_id
+    for cis_id in SECEDIT_CHECKS + AUDITPOL_CHECKS + SERVICE_CHECKS:
+        assert statuses[cis_id] is EXPECTED[cis_id], cis_id
@@ -0,0 +1,44 @@
+"""
+Cache disque des collecteurs : désactivé sauf --cache-dir, entrées valides pendant leur durée de validité.
+"""
+import asyncio
+import os
+
+from win11cis.cli import parse_arguments
+from win11cis.core import CollectorCache
+
+
+def fetch(cache, name, data):
+    calls = []
+
+    async def produce():
+        calls.append(name)
+        return data
+
+    return asyncio.run(cache.fetch(name, produce)), len(calls)
+
+
+def test_cache_is_opt_in():
+    assert parse_arguments([]).cache_dir is None
+    cache = CollectorCache()
+    assert fetch(cache, "secedit", b"first") == (b"first", 1)
+    assert fetch(cache, "secedit", b"second") == (b"second", 1)
+
+
+def test_cached_data_is_reused_within_ttl(tmp_path):
+    cache = CollectorCache(str(tmp_path / "cache"), {"secedit": 300, "auditpol": 0})
+    assert fetch(cache, "secedit", b"first") == (b"first", 1)
+    assert fetch(cache, "secedit", b"second") == (b"first", 0)
+    # Durée de validité nulle : pas de cache pour la source
+    assert fetch(cache, "auditpol", b"first") == (b"first", 1)
+    assert fetch(cache, "auditpol", b"second") == (b"second", 1)
+    if os.name == "posix":
+        assert os.stat(tmp_path / "cache").st_mode & 0o777 == 0o700
+
+
+def test_tampered_entry_is_collected_again(tmp_path):
+    cache = CollectorCache(str(tmp_path))
+    fetch(cache, "secedit", b"first")
+    with open(tmp_path / "secedit", "wb") as f:
+        f.write(b"tampered")
+    assert fetch(cache, "secedit", b"second") == (b"second", 1)
@@ -0,0 +1,123 @@
+"""
+Commandes externes (CommandRunner) : sortie, code de retour, délai, annulation et concurrence,
+testées avec des processus Python.
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from test_bundle import AUDITPOL_CHECKS, EXPECTED, write_fixture_bundle
+
+from win11cis import core
+from win11cis.core import CommandRunner, CommandTimeout, ScanRun, Status, parse_audit_policy
+from win11cis.sections import select_checks
+
+
+def python(code, *args):
+    return [sys.executable, "-c", code, *args]
+
+
+def sleeper(pid_file, seconds=60):
+    # Processus qui enregistre son PID puis attend
+    return python(f"import os, sys, time; open(sys.argv[1], 'w').write(str(os.getpid())); time.sleep({seconds})",
+                  str(pid_file))
+
+
+def wait_for_pid(pid_file):
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        if os.path.exists(pid_file) and open(pid_file).read():
+            return int(open(pid_file).read())
+        time.sleep(0.01)
+    raise AssertionError("processus non démarré")
+
+
+def assert_terminated(pid):
+    if os.name == "posix":
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+def test_output():
+    output = asyncio.run(CommandRunner().run(python("import sys; sys.stdout.buffer.write(b'Succ\\x8as\\r\\n')")))
+    assert output == b"Succ\x8as\r\n"
+
+
+def test_non_zero_exit():
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        asyncio.run(CommandRunner().run(python("import sys; sys.exit(3)")))
+    assert excinfo.value.returncode == 3
+
+
+def test_timeout_kills_the_process(tmp_path):
+    pid_file = tmp_path / "pid"
+    started = time.monotonic()
+    with pytest.raises(CommandTimeout) as excinfo:
+        asyncio.run(CommandRunner(timeout=0.5).run(sleeper(pid_file)))
+    assert time.monotonic() - started < 10
+    assert excinfo.value.timeout == 0.5
+    assert_terminated(wait_for_pid(pid_file))
+
+
+def test_cancel_kills_the_process(tmp_path):
+    pid_file = tmp_path / "pid"
+
+    async def cancel():
+        task = asyncio.ensure_future(CommandRunner().run(sleeper(pid_file)))
+        await asyncio.get_running_loop().run_in_executor(None, wait_for_pid, pid_file)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+    assert_terminated(wait_for_pid(pid_file))
+
+
+def test_grandchild_does_not_block_completion(tmp_path):
+    # La commande se termine en laissant un petit-enfant qui hérite de sa sortie standard
+    pid_file = tmp_path / "pid"
+    code = ("import subprocess, sys; subprocess.Popen([sys.executable, '-c', "
+            "'import os, sys, time; open(sys.argv[1], \"w\").write(str(os.getpid())); time.sleep(60)', sys.argv[1]]); "
+            "print('fini')")
+    started = time.monotonic()
+    try:
+        assert asyncio.run(CommandRunner(timeout=30).run(python(code, str(pid_file)))).strip() == b"fini"
+        assert time.monotonic() - started < 10
+    finally:
+        pid = wait_for_pid(pid_file)
+        if os.name == "posix":
+            os.kill(pid, 9)
+
+
+def test_max_concurrency():
+    code = "import time, sys; print(time.monotonic()); time.sleep(0.3); print(time.monotonic())"
+
+    async def run_all():
+        runner = CommandRunner(max_concurrency=2)
+        return await asyncio.gather(*(runner.run(python(code)) for _ in range(4)))
+
+    intervals = [tuple(map(float, output.split())) for output in asyncio.run(run_all())]
+    for start, _ in intervals:
+        # Au plus deux commandes en cours à chaque démarrage
+        assert sum(1 for other_start, other_end in intervals if other_start <= start < other_end) <= 2
+
+
+def test_collector_timeout_only_affects_its_checks(tmp_path, monkeypatch):
+    async def hung_audit_policy(run):
+        return parse_audit_policy((await run.commands.run(sleeper(tmp_path / "pid"))).decode())
+
+    monkeypatch.setitem(core.COLLECTORS, "auditpol", hung_audit_policy)
+    run = ScanRun(select_checks(only=list(EXPECTED)), bundle=write_fixture_bundle(tmp_path),
+                  commands=CommandRunner(timeout=0.5))
+    started = time.monotonic()
+    statuses = {result.cis_id: result.status for result in run.run(report=False)}
+    assert time.monotonic() - started < 10
+    for cis_id in AUDITPOL_CHECKS:
+        assert statuses[cis_id] is Status.TIMEOUT, cis_id
+        assert run.results[cis_id].message_key == "timeout"
+    assert {cis_id: status for cis_id, status in statuses.items() if cis_id not in AUDITPOL_CHECKS} == {
+        cis_id: status for cis_id, status in EXPECTED.items() if cis_id not in AUDITPOL_CHECKS}
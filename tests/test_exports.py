@@ -0,0 +1,54 @@
+"""
+Décodage des exports Windows : UTF-16 (secedit), UTF-8, ou page de codes de la console (auditpol).
+"""
+import pytest
+
+from win11cis import core
+from win11cis.core import (
+    AUDIT_FAILURE, AUDIT_NONE, AUDIT_SUCCESS, AUDIT_SUCCESS_AND_FAILURE, CollectorCache, ScanRun, Status,
+    decode_export, parse_audit_policy,
+)
+from win11cis.sections import select_checks
+
+# Sortie de `auditpol /get /category:* /r` sur un poste français
+AUDITPOL_OUTPUT = (
+    "Nom de l'ordinateur,Cible de stratégie,Sous-catégorie,Subcategory GUID,Inclusion Setting,Exclusion Setting\r\n"
+    "POSTE,Système,Validation des informations d'identification,{0CCE923F-69AE-11D9-BED3-505054503030},"
+    "Succès et échec,\r\n"
+    "POSTE,Système,Gestion des groupes d'applications,{0CCE9239-69AE-11D9-BED3-505054503030},Succès,\r\n"
+    "POSTE,Système,Gestion des groupes de sécurité,{0CCE9237-69AE-11D9-BED3-505054503030},Échec,\r\n"
+    "POSTE,Système,Gestion des comptes d'utilisateur,{0CCE9235-69AE-11D9-BED3-505054503030},Pas d'audit,\r\n"
+)
+EXPECTED = {
+    "{0CCE923F-69AE-11D9-BED3-505054503030}": AUDIT_SUCCESS_AND_FAILURE,
+    "{0CCE9239-69AE-11D9-BED3-505054503030}": AUDIT_SUCCESS,
+    "{0CCE9237-69AE-11D9-BED3-505054503030}": AUDIT_FAILURE,
+    "{0CCE9235-69AE-11D9-BED3-505054503030}": AUDIT_NONE,
+}
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-8", "utf-8-sig"])
+def test_unicode_exports(encoding):
+    assert parse_audit_policy(decode_export(AUDITPOL_OUTPUT.encode(encoding))) == EXPECTED
+
+
+@pytest.mark.parametrize("encoding", ["cp850", "cp1252"])
+def test_code_page_auditpol_output(monkeypatch, encoding):
+    monkeypatch.setattr(core, "console_encodings", lambda: [encoding])
+    assert parse_audit_policy(decode_export(AUDITPOL_OUTPUT.encode(encoding))) == EXPECTED
+
+
+def test_undecodable_output_does_not_raise(monkeypatch):
+    monkeypatch.setattr(core, "console_encodings", lambda: ["utf-8"])
+    policy = parse_audit_policy(decode_export(AUDITPOL_OUTPUT.encode("cp850")))
+    assert set(policy) == set(EXPECTED)
+
+
+def test_cached_code_page_output(tmp_path, monkeypatch):
+    # Le cache conserve les octets bruts d'auditpol : le décodage s'applique à la relecture
+    monkeypatch.setattr(core, "console_encodings", lambda: ["cp850"])
+    cache = CollectorCache(str(tmp_path))
+    cache.store("auditpol", AUDITPOL_OUTPUT.encode("cp850"))
+    run = ScanRun(select_checks(only=["17.1.1", "17.2.1", "17.2.2"]), cache=cache)
+    statuses = {result.cis_id: result.status for result in run.run(report=False)}
+    assert statuses == {"17.1.1": Status.COMPLIANT, "17.2.1": Status.NON_COMPLIANT, "17.2.2": Status.NON_COMPLIANT}
@@ -0,0 +1,44 @@
+"""
+fleet-eval : enregistrements au même schéma que les sorties d'une analyse locale.
+"""
+import json
+
+from test_bundle import EXPECTED, write_fixture_bundle
+
+from win11cis.core import RECORD_FIELDS, ScanRun, SnapshotBundle, Status, result_record
+from win11cis.fleet import fleet_eval
+from win11cis.sections import load_checks
+
+
+def test_fleet_records_follow_record_fields(tmp_path):
+    bundles = tmp_path / "bundles"
+    for host in ("host1", "host2"):
+        (bundles / host).mkdir(parents=True)
+        write_fixture_bundle(bundles / host)
+    output = tmp_path / "fleet.jsonl"
+    fleet_eval(str(bundles), str(output), processes=2, sqlite_output=str(tmp_path / "fleet.db"))
+
+    with open(output, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert all(tuple(record) == RECORD_FIELDS for record in records)
+    assert {record["status"] for record in records} <= {status.name for status in Status}
+    # Une exécution par hôte
+    run_ids = {}
+    for record in records:
+        run_ids.setdefault(record["host"], set()).add(record["run_id"])
+    assert sorted(run_ids) == ["host1", "host2"]
+    assert all(len(ids) == 1 for ids in run_ids.values())
+
+    # Mêmes enregistrements qu'une analyse locale du bundle, hors run_id et durée
+    run = ScanRun(load_checks(), bundle=SnapshotBundle(str(bundles / "host1")))
+    single = [result_record(run, result) for result in run.run(report=False)]
+    fleet = [record for record in records if record["host"] == "host1"]
+
+    def comparable(record):
+        return {name: record[name] for name in ("host", "cis_id", "status", "expected", "observed")}
+
+    assert sorted(map(json.dumps, map(comparable, fleet))) == sorted(
+        json.dumps(comparable(record), default=str) for record in single)
+    statuses = {record["cis_id"]: record["status"] for record in fleet}
+    assert {cis_id: statuses[cis_id] for cis_id in EXPECTED} == {
+        cis_id: status.name for cis_id, status in EXPECTED.items()}
@@ -0,0 +1,59 @@
+"""
+Diff de deux exécutions enregistrées dans l'historique SQLite.
+"""
+import sqlite3
+
+import pytest
+
+from win11cis.core import SqliteSink
+from win11cis.history import stored_run_diff
+
+BEFORE = {"1.1.1": ("COMPLIANT", 24), "1.1.2": ("COMPLIANT", 60), "1.1.3": ("NON_COMPLIANT", 0),
+          "2.3.1.1": ("COMPLIANT", "Désactivé"), "9.1.1": ("COMPLIANT", 1)}
+AFTER = {"1.1.1": ("COMPLIANT", 24), "1.1.2": ("COMPLIANT", 90), "1.1.3": ("COMPLIANT", 1),
+         "2.3.1.1": ("COMPLIANT", "Désactivé"), "18.1.1": ("NON_COMPLIANT", None)}
+CHANGES = [
+    ("1.1.2", ("COMPLIANT", 60), ("COMPLIANT", 90)),
+    ("1.1.3", ("NON_COMPLIANT", 0), ("COMPLIANT", 1)),
+    ("9.1.1", ("COMPLIANT", 1), None),
+    ("18.1.1", None, ("NON_COMPLIANT", None)),
+]
+
+
+def store(database, run_id, results):
+    sink = SqliteSink(str(database), "catalogue")
+    for cis_id, (status, observed) in results.items():
+        sink.write({"host": "poste", "run_id": run_id, "cis_id": cis_id, "status": status,
+                    "expected": None, "observed": observed, "duration_ms": 1.0}, None)
+    sink.close()
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = tmp_path / "history.db"
+    store(database, "a" * 32, BEFORE)
+    store(database, "b" * 32, AFTER)
+    # Exécution sans aucune différence avec la précédente
+    store(database, "c" * 32, AFTER)
+    return database
+
+
+def test_stored_run_diff(database):
+    _, _, changes = stored_run_diff(str(database), ["a", "b"])
+    assert changes == CHANGES
+
+
+def test_identical_runs(database):
+    assert stored_run_diff(str(database), ["b", "c"])[2] == []
+    assert stored_run_diff(str(database), host="poste")[2] == []
+
+
+def test_results_without_fingerprints(database):
+    # Résultats enregistrés avant l'ajout des empreintes : comparés sur le statut et la valeur relevée
+    with sqlite3.connect(str(database)) as connection:
+        connection.execute("UPDATE results SET fingerprint = NULL WHERE run_id IN (?, ?)", ("a" * 32, "b" * 32))
+        connection.execute("UPDATE runs SET digest = NULL")
+    assert stored_run_diff(str(database), ["a", "b"])[2] == CHANGES
+    with sqlite3.connect(str(database)) as connection:
+        connection.execute("UPDATE results SET fingerprint = NULL WHERE run_id = ?", ("c" * 32,))
+    assert stored_run_diff(str(database), ["b", "c"])[2] == []
@@ -0,0 +1,50 @@
+"""
+Import à la demande des modules de section : la ligne de commande et les sous-commandes
+n'importent que les sections sélectionnées.
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Exécuté dans un processus neuf : les autres tests importent toutes les sections
+SCRIPT = r"""
+import json, sys
+sys.path.insert(0, sys.argv[1])
+
+def loaded():
+    return sorted(name for name in sys.modules if name.startswith("win11cis.sections."))
+
+import win11cis.cli
+from win11cis.cli import parse_arguments
+from win11cis.sections import load_checks, select_checks
+steps = {}
+parse_arguments([])
+steps["cli"] = loaded()
+load_checks(["1"])
+steps["1"] = loaded()
+load_checks(["1", "17"])
+steps["1,17"] = loaded()
+select_checks(only=["9.*"])
+steps["9.*"] = loaded()
+print(json.dumps(steps))
+"""
+
+
+def test_sections_are_imported_on_demand():
+    output = subprocess.run([sys.executable, "-c", SCRIPT, ROOT], capture_output=True, text=True, check=True).stdout
+    steps = json.loads(output)
+    assert steps["cli"] == []
+    assert steps["1"] == ["win11cis.sections.accounts"]
+    assert steps["1,17"] == ["win11cis.sections.accounts", "win11cis.sections.audit"]
+    assert steps["9.*"] == ["win11cis.sections.accounts", "win11cis.sections.audit", "win11cis.sections.firewall"]
+
+
+def test_help_loads_no_section():
+    output = subprocess.run([sys.executable, "-X", "importtime", os.path.join(ROOT, "Win11-CIS3.0Check.py"), "--help"],
+                            capture_output=True, text=True, cwd=ROOT)
+    assert output.returncode == 0
+    assert "win11cis.cli" in output.stderr
+    assert "win11cis.sections." not in output.stderr
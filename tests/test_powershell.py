@@ -0,0 +1,96 @@
+"""
+Protocole du worker PowerShell, testé contre un processus Python qui renvoie les requêtes.
+"""
+import sys
+import time
+
+import pytest
+
+from win11cis.core import CommandTimeout, PowerShellError, PowerShellWorker, Status, compliance_check
+
+# Processus de test : renvoie chaque commande avec le PID du processus. Commandes spéciales :
+# "crash" arrête le processus sans répondre ("crash-once" seulement au premier appel, repéré par
+# le fichier passé en argument), "hang" ne répond jamais, "fail" retourne une erreur et "noise"
+# émet une réponse d'une autre requête et une ligne vide avant la sienne.
+STUB = r"""
+import json, os, sys, time
+marker = sys.argv[1]
+for line in sys.stdin:
+    request = json.loads(line)
+    command = request["command"]
+    if command == "crash" or (command == "crash-once" and not os.path.exists(marker)):
+        open(marker, "w").close()
+        sys.exit(1)
+    if command == "hang":
+        time.sleep(60)
+    if command == "fail":
+        print(json.dumps({"id": request["id"], "ok": False, "error": "échec de " + command}), flush=True)
+        continue
+    if command == "noise":
+        print(json.dumps({"id": request["id"] - 1, "ok": True, "output": "réponse périmée"}))
+        print("", flush=True)
+    output = {"command": command, "pid": os.getpid()}
+    print(json.dumps({"id": request["id"], "ok": True, "output": output}), flush=True)
+"""
+
+
+@pytest.fixture
+def worker(tmp_path):
+    worker = PowerShellWorker([sys.executable, "-c", STUB, str(tmp_path / "crashed")], timeout=10.0)
+    yield worker
+    worker.close(kill=True)
+
+
+def test_responses_match_requests(worker):
+    outputs = [worker.request(f"Get-Item {index}") for index in range(5)]
+    assert [output["command"] for output in outputs] == [f"Get-Item {index}" for index in range(5)]
+    # Un seul processus pour toutes les requêtes
+    assert len({output["pid"] for output in outputs}) == 1
+
+
+def test_stale_responses_are_ignored(worker):
+    assert worker.request("noise")["command"] == "noise"
+    assert worker.request("after")["command"] == "after"
+
+
+def test_error_response(worker):
+    with pytest.raises(PowerShellError, match="échec de fail"):
+        worker.request("fail")
+    # Le worker reste utilisable
+    assert worker.request("after")["command"] == "after"
+
+
+def test_restart_after_crash_mid_request(worker):
+    first = worker.request("before")["pid"]
+    output = worker.request("crash-once")
+    assert output["command"] == "crash-once"
+    assert output["pid"] != first
+    assert worker.request("after")["pid"] == output["pid"]
+
+
+def test_repeated_crash_is_reported(worker):
+    with pytest.raises(OSError):
+        worker.request("crash")
+    assert worker.request("after")["command"] == "after"
+
+
+def test_hung_worker_times_out(worker):
+    started = time.monotonic()
+    with pytest.raises(CommandTimeout):
+        worker.request("hang", timeout=0.5)
+    assert time.monotonic() - started < 5
+    # Le processus bloqué est arrêté et relancé à la requête suivante
+    assert worker.request("after")["command"] == "after"
+
+
+def test_hung_worker_gives_timeout_status(worker):
+    @compliance_check("99.1", "Contrôle PowerShell bloqué")
+    def check_hung():
+        return worker.request("hang", timeout=0.5)
+
+    started = time.monotonic()
+    result = check_hung()
+    assert time.monotonic() - started < 5
+    assert result.status is Status.TIMEOUT
+    assert result.message_key == "timeout"
+    assert result.cis_id == "99.1"
@@ -0,0 +1,137 @@
+"""
+Moteur du catalogue REGISTRY_RULES, évalué contre un cliché de registre en mémoire.
+"""
+import pytest
+
+from win11cis.core import HKLM, OPERATORS, RegistryRule, RegistrySnapshot, ScanRun, Status
+from win11cis.sections import load_checks
+
+KEY = r"SOFTWARE\Policies\Microsoft\Windows\Test"
+OTHER_KEY = r"SOFTWARE\Policies\Microsoft\Windows\Absent"
+
+
+def evaluate(rules, values, keys=None):
+    """
+    Évalue une table de règles sur un cliché {KEY: values} et retourne {identifiant CIS: CheckResult}.
+    """
+    registry = {KEY: values}
+    registry.update(keys or {})
+    run = ScanRun(rules, registry_snapshot=RegistrySnapshot.from_dict({HKLM: registry}))
+    return {result.cis_id: result for result in run.run(report=False)}
+
+
+def rule(cis_id, name, op, expected, path=KEY, missing_ok=False):
+    return RegistryRule(cis_id, f"Règle {cis_id}", HKLM, path, name, op, expected, "L1", missing_ok)
+
+
+# Opérateur -> (valeur attendue, valeur conforme, valeur non conforme)
+OPERATOR_CASES = {
+    "eq": (1, 1, 0),
+    "ne": (0, 1, 0),
+    "in": ([1, 2], 2, 3),
+    "not_in": ([0], 1, 0),
+    "ge": (14, 24, 7),
+    "le": (900, 600, 1200),
+    "range": ((1, 60), 30, 0),
+    "truthy": (None, 1, 0),
+    "falsy": (None, 0, 1),
+    "contains": ("Kerberos", "Kerberos,NTLM", "NTLM"),
+    "contains_all": (["A", "B"], ["A", "B", "C"], ["A", "C"]),
+    "contains_any": (["A", "B"], ["B"], ["C"]),
+}
+
+
+def test_operator_cases_cover_every_operator():
+    assert set(OPERATOR_CASES) == set(OPERATORS)
+
+
+@pytest.mark.parametrize("op", sorted(OPERATOR_CASES))
+def test_operator(op):
+    expected, compliant, non_compliant = OPERATOR_CASES[op]
+    results = evaluate(
+        [rule("1.1", "Compliant", op, expected), rule("1.2", "NonCompliant", op, expected)],
+        {"Compliant": compliant, "NonCompliant": non_compliant},
+    )
+    assert results["1.1"].status is Status.COMPLIANT
+    assert results["1.1"].message_key == "compliant"
+    assert results["1.1"].observed == compliant
+    assert results["1.2"].status is Status.NON_COMPLIANT
+    assert results["1.2"].message_key == "non_compliant"
+    assert results["1.2"].observed == non_compliant
+
+
+def test_key_missing():
+    results = evaluate(
+        [rule("2.1", "Value", "eq", 1, path=OTHER_KEY),
+         rule("2.2", "Value", "eq", 1, path=OTHER_KEY, missing_ok=True)],
+        {}, {OTHER_KEY: None},
+    )
+    assert results["2.1"].status is Status.NON_COMPLIANT
+    assert results["2.1"].message_key == "key_missing"
+    assert results["2.2"].status is Status.COMPLIANT
+    assert results["2.2"].message_key == "missing_default"
+
+
+def test_key_not_in_snapshot_is_missing():
+    results = evaluate([rule("2.3", "Value", "eq", 1, path=OTHER_KEY)], {})
+    assert results["2.3"].message_key == "key_missing"
+
+
+def test_value_missing():
+    results = evaluate(
+        [rule("3.1", "Absent", "eq", 1), rule("3.2", "Absent", "eq", 1, missing_ok=True),
+         rule("3.3", "Present", "eq", 1)],
+        {"Present": 1},
+    )
+    assert results["3.1"].status is Status.NON_COMPLIANT
+    assert results["3.1"].message_key == "value_missing"
+    assert results["3.2"].status is Status.COMPLIANT
+    assert results["3.2"].message_key == "missing_default"
+    assert results["3.3"].status is Status.COMPLIANT
+
+
+def test_value_names_are_case_insensitive():
+    results = evaluate([rule("3.4", "enablelua", "eq", 1)], {"EnableLUA": 1})
+    assert results["3.4"].status is Status.COMPLIANT
+
+
+def test_wrong_type():
+    # Une chaîne (REG_SZ) là où un entier (REG_DWORD) est attendu
+    results = evaluate(
+        [rule("4.1", "Value", "eq", 1), rule("4.2", "Value", "ge", 1), rule("4.3", "Value", "range", (1, 5))],
+        {"Value": "1"},
+    )
+    assert results["4.1"].status is Status.NON_COMPLIANT
+    assert results["4.1"].observed == "1"
+    # Une comparaison d'ordre impossible devient un résultat Erreur, sans interrompre les autres règles
+    assert results["4.2"].status is Status.ERROR
+    assert results["4.2"].message_key == "error"
+    assert results["4.3"].status is Status.ERROR
+
+
+def test_results_keep_rule_order():
+    rules = [rule("5.2", "B", "eq", 1, path=OTHER_KEY), rule("5.1", "A", "eq", 1), rule("5.3", "C", "eq", 1)]
+    results = evaluate(rules, {"A": 1, "C": 0}, {OTHER_KEY: {"B": 1}})
+    assert list(results) == ["5.2", "5.1", "5.3"]
+    assert [results[cis_id].title for cis_id in results] == ["Règle 5.2", "Règle 5.1", "Règle 5.3"]
+
+
+def test_catalogue_rules_use_known_operators():
+    for check in load_checks():
+        if isinstance(check, RegistryRule):
+            assert check.op in OPERATORS, check
+            assert check.level in ("L1", "L2", "BL"), check
+
+
+def test_numbered_policy_list():
+    # 18.9.7.1.5 : une classe par valeur numérotée, dans un ordre quelconque, parmi d'autres classes
+    from win11cis.sections.admin_templates import (
+        DENY_DEVICE_CLASSES_KEY, IEEE1394_DEVICE_CLASSES, check_prevent_device_installation_ieee1394,
+    )
+    other = "{e0cbf06c-cd8b-4647-bb8a-263b43f0f974}"
+    configured = {"1": other, **{str(index + 2): guid for index, guid in enumerate(reversed(IEEE1394_DEVICE_CLASSES))}}
+    incomplete = {"1": other, "2": IEEE1394_DEVICE_CLASSES[0]}
+    for values, status in ((configured, Status.COMPLIANT), (incomplete, Status.NON_COMPLIANT)):
+        run = ScanRun([check_prevent_device_installation_ieee1394],
+                      registry_snapshot=RegistrySnapshot.from_dict({HKLM: {DENY_DEVICE_CLASSES_KEY: values}}))
+        assert run.run(report=False)[0].status is status
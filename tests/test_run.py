@@ -0,0 +1,72 @@
+"""
+Exécution d'un scan : collecte à la demande partagée par les workers.
+"""
+import threading
+import time
+
+from win11cis import core
+from win11cis.core import CheckResult, ScanRun, Status, compliance_check, current_run
+
+
+def counting_collector(calls):
+    def collect(run):
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return {"System Access": {"PasswordHistorySize": "24"}}
+    return collect
+
+
+def test_concurrent_source_collects_once(monkeypatch):
+    calls = []
+    monkeypatch.setitem(core.COLLECTORS, "secedit", counting_collector(calls))
+    run = ScanRun([])
+    barrier = threading.Barrier(8)
+    policies = []
+
+    def read():
+        barrier.wait()
+        policies.append(run.source("secedit"))
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len(policies) == 8 and all(policy is policies[0] for policy in policies)
+
+
+def test_undeclared_source_is_collected_once_with_workers(monkeypatch):
+    calls = []
+    monkeypatch.setitem(core.COLLECTORS, "secedit", counting_collector(calls))
+
+    def make_check(index):
+        # Contrôle sans donnée déclarée : le collecteur est lancé à la première lecture
+        @compliance_check(f"99.{index}", f"Contrôle {index}")
+        def check():
+            value = current_run().source("secedit")["System Access"]["PasswordHistorySize"]
+            return CheckResult(Status.COMPLIANT, "24", value, "compliant")
+        return check
+
+    run = ScanRun([make_check(index) for index in range(16)], workers=8)
+    results = run.run(report=False)
+    assert len(calls) == 1
+    assert [result.status for result in results] == [Status.COMPLIANT] * 16
+
+
+def test_profile_reports_collector_wall_time_and_phase_cpu(monkeypatch):
+    monkeypatch.setitem(core.COLLECTORS, "secedit", counting_collector([]))
+
+    @compliance_check("99.1", "Contrôle", requires=[("secedit", "System Access", "PasswordHistorySize")])
+    def check():
+        return CheckResult(Status.COMPLIANT, "24", current_run().source("secedit"), "compliant")
+
+    run = ScanRun([check], profile=True)
+    run.run(report=False)
+    timings = {(kind, name): (wall, cpu) for kind, name, _, wall, cpu in run.profiler.timings}
+    # Collecteur : temps réel seul (la collecte attend sans consommer de CPU)
+    assert timings["collector", "secedit"][0] >= 0.05
+    assert timings["collector", "secedit"][1] is None
+    assert timings["phase", "collect"][1] is not None
+    assert timings["phase", "evaluate"][1] is not None
+    assert timings["check", "99.1"][1] is not None
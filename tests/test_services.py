@@ -0,0 +1,119 @@
+"""
+Inventaire des services : export .reg de la clé des services (services.reg) et repli sur
+registry.json / services.json pour les bundles antérieurs.
+"""
+import json
+
+import pytest
+
+from test_bundle import EXPECTED, evaluate, write_fixture_bundle
+
+from win11cis.core import (
+    BUNDLE_REGISTRY, BUNDLE_SERVICES, BUNDLE_SERVICES_REG, HKLM, SERVICES_KEY, ServiceInventory, SnapshotBundle,
+    decode_export,
+)
+
+# Export `reg export` d'une ruche SYSTEM chargée hors ligne (UTF-16 avec BOM, fins de ligne CRLF)
+REG_EXPORT = "\r\n".join([
+    "Windows Registry Editor Version 5.00",
+    "",
+    r"[HKEY_LOCAL_MACHINE\OFFLINE\ControlSet001\Services]",
+    "",
+    r"[HKEY_LOCAL_MACHINE\OFFLINE\ControlSet001\Services\.NET CLR Data]",
+    "",
+    r"[HKEY_LOCAL_MACHINE\OFFLINE\ControlSet001\Services\.NET CLR Data\Performance]",
+    '"Start"=dword:00000002',
+    "",
+    r"[HKEY_LOCAL_MACHINE\OFFLINE\ControlSet001\Services\BTAGService]",
+    '"DisplayName"="@%SystemRoot%\\\\System32\\\\BTAGService.dll,-101"',
+    '"DelayedAutoStart"=dword:00000001',
+    '"Start"=dword:00000004',
+    "",
+    r"[HKEY_LOCAL_MACHINE\OFFLINE\ControlSet001\Services\BTAGService\Parameters]",
+    '"Start"=dword:00000002',
+    "",
+    r"[HKEY_LOCAL_MACHINE\OFFLINE\ControlSet001\Services\bthserv]",
+    '"Start"=dword:00000003',
+    "",
+    "",
+])
+
+
+def reg_export_bytes(text=REG_EXPORT):
+    return ("\ufeff" + text).encode("utf-16-le")
+
+
+def test_from_reg_export():
+    inventory = ServiceInventory.from_reg_export(decode_export(reg_export_bytes()))
+    # La valeur Start de la sous-clé Parameters n'écrase pas celle du service
+    assert inventory.to_dict() == {"BTAGService": 4, "bthserv": 3}
+    assert inventory.start_type("btagservice") == (4, True)
+    # Sous-clé sans valeur Start : pas un service
+    assert inventory.start_type(".NET CLR Data") == (None, False)
+    assert inventory.start_type("Performance") == (None, False)
+    assert inventory.start_type("Parameters") == (None, False)
+    assert inventory.start_type("Browser") == (None, False)
+
+
+def test_from_reg_export_current_control_set():
+    text = REG_EXPORT.replace(r"OFFLINE\ControlSet001", r"SYSTEM\CurrentControlSet")
+    assert ServiceInventory.from_reg_export(text).to_dict() == {"BTAGService": 4, "bthserv": 3}
+
+
+def write_bundle_files(directory, files):
+    for name, content in files.items():
+        with open(directory / name, "wb") as f:
+            f.write(content if isinstance(content, bytes) else json.dumps(content).encode("utf-8"))
+    return SnapshotBundle(str(directory))
+
+
+def registry(paths):
+    return {HKLM: {SERVICES_KEY + "\\" + path: values for path, values in paths.items()}}
+
+
+def test_services_reg_takes_precedence(tmp_path):
+    bundle = write_bundle_files(tmp_path, {
+        BUNDLE_SERVICES_REG: reg_export_bytes(),
+        BUNDLE_SERVICES: {"BTAGService": 2, "Browser": 2},
+        BUNDLE_REGISTRY: registry({"bthserv": {"Start": 2}}),
+    })
+    assert bundle.service_inventory().to_dict() == {"BTAGService": 4, "bthserv": 3}
+
+
+def test_legacy_registry_json(tmp_path):
+    bundle = write_bundle_files(tmp_path, {BUNDLE_REGISTRY: registry({
+        "BTAGService": {"Start": 4},
+        "BTAGService\\Parameters": {"Start": 2},
+        "bthserv": {"start": 3},
+        # Clé présente mais nulle : service non installé
+        "Browser": None,
+        # Sous-clé sans valeur Start
+        ".NET CLR Data": {},
+    })})
+    inventory = bundle.service_inventory()
+    assert inventory.to_dict() == {"BTAGService": 4, "bthserv": 3}
+    assert inventory.start_type("Browser") == (None, False)
+    assert inventory.start_type(".NET CLR Data") == (None, False)
+
+
+def test_services_json_overrides_registry_json(tmp_path):
+    bundle = write_bundle_files(tmp_path, {
+        BUNDLE_REGISTRY: registry({"BTAGService": {"Start": 4}, "bthserv": {"Start": 2}, "Browser": {"Start": 2}}),
+        BUNDLE_SERVICES: {"bthserv": 3, "browser": None},
+    })
+    assert bundle.service_inventory().to_dict() == {"BTAGService": 4, "bthserv": 3}
+
+
+def test_no_service_source(tmp_path):
+    bundle = write_bundle_files(tmp_path, {BUNDLE_REGISTRY: {HKLM: {}}})
+    with pytest.raises(FileNotFoundError):
+        bundle.service_inventory()
+
+
+def test_bundle_with_services_reg(tmp_path):
+    # services.reg remplace services.json dans l'évaluation d'un bundle complet
+    bundle = write_fixture_bundle(tmp_path, omit=(BUNDLE_SERVICES,))
+    write_bundle_files(tmp_path, {BUNDLE_SERVICES_REG: reg_export_bytes()})
+    run, statuses = evaluate(bundle)
+    assert statuses == EXPECTED
+    assert run.results["5.3"].message_key == "not_installed"
@@ -0,0 +1,89 @@
+"""
+Analyse incrémentale (--state) : reprise des résultats des règles dont la donnée n'a pas changé.
+"""
+import json
+
+from win11cis.core import (
+    BUNDLE_REGISTRY, BUNDLE_SERVICES, HKLM, REGISTRY_LAST_WRITE, RegistryRule, ScanRun, ScanState,
+    ServiceRule, SnapshotBundle, Status,
+)
+
+KEY = r"SOFTWARE\Policies\Microsoft\Windows\Test"
+OTHER_KEY = r"SOFTWARE\Policies\Microsoft\Windows\Other"
+
+RULES = [
+    RegistryRule("1.1", "A", HKLM, KEY, "A", "eq", 1, "L1"),
+    RegistryRule("1.2", "B", HKLM, KEY, "B", "eq", 1, "L1"),
+    RegistryRule("1.3", "C", HKLM, OTHER_KEY, "C", "eq", 1, "L1"),
+    ServiceRule("5.1", "Service 1", "Svc1", "eq", 4, "L1"),
+    ServiceRule("5.2", "Service 2", "Svc2", "eq", 4, "L1"),
+]
+SERVICE_RULES = [rule for rule in RULES if isinstance(rule, ServiceRule)]
+
+
+def write_bundle(directory, registry=None, services=None):
+    """
+    Bundle registre et services ; les dates de dernière modification des clés suivent leurs valeurs.
+    """
+    registry = registry or {KEY: {"A": 1, "B": 0}, OTHER_KEY: {"C": 1}}
+    stamps = {path: 100 + sum(values.values()) for path, values in registry.items()}
+    with open(directory / BUNDLE_REGISTRY, "w", encoding="utf-8") as f:
+        json.dump({HKLM: registry, REGISTRY_LAST_WRITE: {HKLM: stamps}}, f)
+    with open(directory / BUNDLE_SERVICES, "w", encoding="utf-8") as f:
+        json.dump(services or {"Svc1": 4, "Svc2": 3}, f)
+    return SnapshotBundle(str(directory))
+
+
+def scan(bundle, state_path, rules=RULES):
+    run = ScanRun(rules, bundle=bundle, state=ScanState(str(state_path)))
+    run.run(report=False)
+    run.state.save(run)
+    return run
+
+
+def test_unchanged_run_reuses_every_rule(tmp_path):
+    bundle = write_bundle(tmp_path)
+    first = scan(bundle, tmp_path / "state.json")
+    assert first.reused == 0
+    second = scan(bundle, tmp_path / "state.json")
+    assert second.reused == len(RULES)
+    assert {cis_id: result.status for cis_id, result in second.results.items()} == {
+        cis_id: result.status for cis_id, result in first.results.items()
+    }
+
+
+def test_changed_registry_value_reevaluates_one_rule(tmp_path):
+    scan(write_bundle(tmp_path), tmp_path / "state.json")
+    run = scan(write_bundle(tmp_path, registry={KEY: {"A": 1, "B": 0}, OTHER_KEY: {"C": 0}}),
+               tmp_path / "state.json")
+    assert run.reused == len(RULES) - 1
+    assert run.results["1.3"].status is Status.NON_COMPLIANT
+    assert run.results["1.3"].observed == 0
+
+
+def test_changed_service_reevaluates_one_rule(tmp_path):
+    scan(write_bundle(tmp_path), tmp_path / "state.json")
+    run = scan(write_bundle(tmp_path, services={"Svc1": 4, "Svc2": 4}), tmp_path / "state.json")
+    assert run.reused == len(RULES) - 1
+    assert run.results["5.2"].status is Status.COMPLIANT
+
+
+def test_services_only_run_does_not_collect_registry(tmp_path):
+    bundle = write_bundle(tmp_path)
+    scan(bundle, tmp_path / "state.json", SERVICE_RULES)
+    run = scan(bundle, tmp_path / "state.json", SERVICE_RULES)
+    assert run.reused == len(SERVICE_RULES)
+    assert "registry" not in run.sources
+    # Les résultats des règles de registre d'une exécution précédente sont conservés
+    scan(bundle, tmp_path / "state.json")
+    assert scan(bundle, tmp_path / "state.json", SERVICE_RULES).reused == len(SERVICE_RULES)
+    assert scan(bundle, tmp_path / "state.json").reused == len(RULES)
+
+
+def test_changed_rule_definition_is_reevaluated(tmp_path):
+    bundle = write_bundle(tmp_path)
+    scan(bundle, tmp_path / "state.json")
+    rules = RULES[:1] + [RegistryRule("1.2", "B", HKLM, KEY, "B", "eq", 0, "L1")] + RULES[2:]
+    run = scan(bundle, tmp_path / "state.json", rules)
+    assert run.reused == len(RULES) - 1
+    assert run.results["1.2"].status is Status.COMPLIANT
@@ -0,0 +1,6 @@
+"""
+Vérification de conformité CIS Benchmark 3.0 pour Windows 11.
+
+core : moteur (collecteurs, évaluation, sorties) ; sections : catalogue des contrôles,
+un module par section CIS importé à la demande ; cli : ligne de commande.
+"""
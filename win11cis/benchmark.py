@@ -0,0 +1,200 @@
+"""
+Banc d'essai synthétique : hôtes générés aléatoirement, évalués sur tout le catalogue.
+"""
+import os
+import random
+import functools
+import datetime
+import json
+import time
+
+from .core import (
+    AUDIT_NONE, AUDIT_SUBCATEGORY_GUIDS, AUDIT_SUCCESS_AND_FAILURE, CollectionPlan, GREEN, HKLM, ORANGE, peak_rss,
+    RegistryRule, RegistrySnapshot, RESET, ScanRun, ServiceInventory, ServiceRule, SID_ADMINISTRATORS, write_bundle,
+)
+from .sections import load_checks
+
+# Classe de périphériques hors recommandation (Bluetooth), pour les listes non conformes
+OTHER_DEVICE_CLASS = "{e0cbf06c-cd8b-4647-bb8a-263b43f0f974}"
+
+
+@functools.lru_cache(maxsize=None)
+def registry_samples():
+    """
+    Valeurs synthétiques (conforme, non conforme) des valeurs de registre lues par les contrôles composés
+    qui ne sont pas des entiers : (ruche, clé, valeur) en minuscules -> valeurs.
+    Construites à la première demande : les modules de section ne sont importés que par le banc d'essai.
+    """
+    from .sections.admin_templates import DENY_DEVICE_CLASSES_KEY, DENY_DEVICE_CLASSES_SLOTS, IEEE1394_DEVICE_CLASSES
+    from .sections.local_policies import REMOTELY_ACCESSIBLE_EXACT_PATHS, REMOTELY_ACCESSIBLE_PATHS
+
+    return {
+        # Listes REG_MULTI_SZ (2.3.10.7, 2.3.10.8)
+        **{(HKLM, r"system\currentcontrolset\control\securepipeservers\winreg", name.lower()):
+           (list(expected), list(expected[:-1]))
+           for name, expected in (("AllowedExactPaths", REMOTELY_ACCESSIBLE_EXACT_PATHS),
+                                  ("AllowedPaths", REMOTELY_ACCESSIBLE_PATHS))},
+        # Listes de stratégie en valeurs numérotées REG_SZ (18.9.7.1.5)
+        **{(HKLM, DENY_DEVICE_CLASSES_KEY.lower(), slot):
+           (IEEE1394_DEVICE_CLASSES[index] if index < len(IEEE1394_DEVICE_CLASSES) else OTHER_DEVICE_CLASS,
+            OTHER_DEVICE_CLASS)
+           for index, slot in enumerate(DENY_DEVICE_CLASSES_SLOTS)},
+    }
+
+
+def sample_rule_value(rule, compliant, rng):
+    """
+    Valeur de registre synthétique conforme (ou non) à une règle du catalogue.
+    """
+    op, expected = rule.op, rule.expected
+    if op in ("eq", "ge", "le"):
+        if compliant:
+            return expected
+        if isinstance(expected, int):
+            return expected - 1 if op == "ge" else expected + 1
+        return f"non-{expected}"
+    if op == "in":
+        return rng.choice(expected) if compliant else (-1 if isinstance(expected[0], int) else "non-conforme")
+    if op == "not_in":
+        return "Personnalisé" if compliant else expected[0]
+    if op == "ne":
+        return (expected + 1 if isinstance(expected, int) else f"non-{expected}") if compliant else expected
+    if op == "range":
+        return rng.randint(*expected) if compliant else expected[1] + 1
+    if op == "truthy":
+        return 1 if compliant else 0
+    if op == "falsy":
+        return 0 if compliant else 1
+    if op == "contains":
+        return [expected] if compliant else []
+    if op in ("contains_all", "contains_any"):
+        return list(expected) if compliant else []
+    raise ValueError(f"Opérateur inconnu : {op}")
+
+
+def generate_host_snapshot(rng, compliance, missing_rate, check_list, plan):
+    """
+    Données synthétiques d'un hôte couvrant toutes les entrées du plan de collecte `plan` :
+    (politique de sécurité, politique d'audit, registre au format de RegistrySnapshot.from_dict,
+    services au format de ServiceInventory.from_dict). `compliance` est la probabilité qu'une valeur
+    soit conforme, `missing_rate` celle qu'une clé de registre, une entrée secedit/auditpol ou un
+    service soit absent. Les valeurs des contrôles composés et de la politique de sécurité,
+    sans valeur attendue déclarative, sont tirées au hasard : entiers 0/1, ou listes de
+    registry_samples() pour les valeurs multi-chaînes.
+    """
+    rules = {(rule.hive, rule.path.lower(), rule.name.lower()): rule
+             for rule in check_list if isinstance(rule, RegistryRule)}
+    samples = registry_samples()
+    registry = {}
+    missing_keys = set()
+    for hive, path, name in plan.registry_triples():
+        paths = registry.setdefault(hive, {})
+        key_id = (hive, path.lower())
+        if key_id not in missing_keys and path not in paths and rng.random() < missing_rate:
+            missing_keys.add(key_id)
+        if key_id in missing_keys:
+            paths[path] = None
+            continue
+        triple = (hive, path.lower(), name.lower())
+        rule = rules.get(triple)
+        compliant = rng.random() < compliance
+        if rule:
+            value = sample_rule_value(rule, compliant, rng)
+        elif triple in samples:
+            value = samples[triple][0 if compliant else 1]
+        else:
+            value = int(compliant)
+        paths.setdefault(path, {})[name] = value
+
+    security_policy = {}
+    for section, key in sorted(plan.secedit):
+        if rng.random() >= missing_rate:
+            # Titulaires des droits utilisateur exportés en SID, comme par secedit
+            value = f"*{SID_ADMINISTRATORS}" if section == "Privilege Rights" else str(rng.randint(0, 30))
+            security_policy.setdefault(section, {})[key] = value
+
+    audit_policy = {
+        AUDIT_SUBCATEGORY_GUIDS[subcategory]: AUDIT_SUCCESS_AND_FAILURE if rng.random() < compliance else AUDIT_NONE
+        for subcategory in plan.auditpol
+        if rng.random() >= missing_rate
+    }
+    service_rules = {rule.service: rule for rule in check_list if isinstance(rule, ServiceRule)}
+    services = {
+        service: None if rng.random() < missing_rate else sample_rule_value(service_rules[service],
+                                                                            rng.random() < compliance, rng)
+        for service in plan.services
+    }
+    return security_policy, audit_policy, registry, services
+
+
+def percentile(sorted_values, fraction):
+    """
+    Percentile par rang le plus proche d'une liste triée.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def run_benchmark(hosts, compliance, missing_rate, seed, baseline, bundles_dir=None):
+    """
+    Banc d'essai synthétique : génère `hosts` hôtes, évalue tous les contrôles sur chacun
+    et mesure contrôles/s, hôtes/s, latences p50/p99 par hôte et pic mémoire.
+    Le résultat est ajouté au fichier de référence (JSON Lines) et comparé à la mesure précédente.
+    """
+    check_list = load_checks()
+    plan = CollectionPlan(check_list)
+    if bundles_dir:
+        os.makedirs(bundles_dir, exist_ok=True)
+
+    latencies = []
+    evaluated = 0
+    for index in range(hosts):
+        rng = random.Random(seed * 1_000_003 + index)
+        security_policy, audit_policy, registry, services = generate_host_snapshot(
+            rng, compliance, missing_rate, check_list, plan)
+        run = ScanRun(check_list)
+        run.sources.update(secedit=security_policy, auditpol=audit_policy,
+                           registry=RegistrySnapshot.from_dict(registry), services=ServiceInventory.from_dict(services))
+        started = time.perf_counter()
+        evaluated += len(run.run(report=False))
+        latencies.append(time.perf_counter() - started)
+        if bundles_dir:
+            write_bundle(os.path.join(bundles_dir, f"host{index:06d}.zip"), run, verbose=False)
+
+    total = sum(latencies)
+    latencies.sort()
+    record = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "hosts": hosts,
+        "compliance": compliance,
+        "missing_rate": missing_rate,
+        "seed": seed,
+        "checks": evaluated,
+        "checks_per_sec": evaluated / total if total else 0.0,
+        "hosts_per_sec": hosts / total if total else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_rss_mb": (peak_rss() or 0) / (1024 * 1024),
+    }
+
+    previous = None
+    if os.path.exists(baseline):
+        with open(baseline, encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+        if lines:
+            previous = json.loads(lines[-1])
+    with open(baseline, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+    print(f"{ORANGE}Banc d'essai : {hosts} hôtes, {evaluated} contrôles évalués{RESET}")
+    for metric, label in (("checks_per_sec", "contrôles/s"), ("hosts_per_sec", "hôtes/s"),
+                          ("p50_ms", "p50 par hôte (ms)"), ("p99_ms", "p99 par hôte (ms)"),
+                          ("peak_rss_mb", "pic mémoire (Mo)")):
+        line = f"  {label:<20} {record[metric]:12.2f}"
+        if previous and previous.get(metric):
+            line += f"   ({(record[metric] - previous[metric]) / previous[metric] * 100:+.1f} % / mesure précédente)"
+        print(line)
+    print(f"{GREEN}Mesure ajoutée au fichier de référence : {os.path.abspath(baseline)}{RESET}")
+    return record
@@ -0,0 +1,257 @@
+"""
+Ligne de commande : analyse du poste local ou d'un bundle et sous-commandes
+(fleet-eval, history, diff, benchmark).
+"""
+import sys
+import argparse
+import contextlib
+
+from .core import (
+    AccountNameCache, CACHE_TTLS, CollectionPlan, CollectorCache, CommandRunner, CsvSink, JsonLinesSink, ORANGE,
+    output_path, RED, RESET, SarifSink, ScanRun, ScanState, SnapshotBundle, SqliteSink, write_bundle,
+)
+from .benchmark import run_benchmark
+from .fleet import fleet_eval
+from .history import bundle_diff, print_check_history, print_drift, print_failing_hosts, stored_run_diff
+from .sections import IMPORT_TIMINGS, LEVELS, SECTIONS, catalog_version, select_checks
+
+
+def probability(text):
+    value = float(text)
+    if not 0.0 <= value <= 1.0:
+        raise argparse.ArgumentTypeError("doit être compris entre 0 et 1")
+    return value
+
+
+def cache_ttl(text):
+    name, separator, seconds = text.partition("=")
+    if not separator or name not in CACHE_TTLS:
+        raise argparse.ArgumentTypeError(f"attendu SOURCE=SECONDES avec SOURCE parmi {', '.join(CACHE_TTLS)}")
+    try:
+        return name, float(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"durée invalide : {seconds}") from None
+
+
+def positive_float(text):
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError("doit être strictement positif")
+    return value
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("doit être un entier supérieur ou égal à 1")
+    return value
+
+
+def section_list(text):
+    sections = [section.strip() for section in text.split(",") if section.strip()]
+    unknown = [section for section in sections if section not in SECTIONS]
+    if not sections or unknown:
+        raise argparse.ArgumentTypeError(f"sections attendues parmi {', '.join(SECTIONS)}")
+    return sections
+
+
+def pattern_list(text):
+    patterns = [pattern.strip() for pattern in text.split(",") if pattern.strip()]
+    if not patterns:
+        raise argparse.ArgumentTypeError("attendu un ou plusieurs identifiants ou motifs séparés par des virgules")
+    return patterns
+
+
+def level_list(text):
+    levels = [level.strip().upper() for level in text.split(",") if level.strip()]
+    if not levels or any(level not in LEVELS for level in levels):
+        raise argparse.ArgumentTypeError(f"niveaux attendus parmi {', '.join(LEVELS)}")
+    return levels
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Vérification de conformité CIS Benchmark 3.0 pour Windows 11"
+    )
+    parser.add_argument("--sections", metavar="N[,N...]", type=section_list,
+                        help="ne vérifier que les sections CIS indiquées, par exemple 1,17 "
+                             f"(sections : {', '.join(SECTIONS)} ; défaut : toutes)")
+    parser.add_argument("--only", metavar="MOTIFS", type=pattern_list, action="append", default=[],
+                        help="ne vérifier que les contrôles correspondant aux identifiants ou motifs indiqués, "
+                             "par exemple 9.*,2.3.10.* ou 2.3.10 (groupe entier)")
+    parser.add_argument("--skip", metavar="MOTIFS", type=pattern_list, action="append", default=[],
+                        help="exclure les contrôles correspondant aux identifiants ou motifs indiqués")
+    parser.add_argument("--level", metavar="NIVEAU", type=level_list,
+                        help="ne vérifier que les contrôles d'un profil CIS : L1, L2 (L1 et L2) ou BL (BitLocker) ; "
+                             "plusieurs profils séparés par des virgules")
+    parser.add_argument("--explain-plan", action="store_true",
+                        help="afficher le plan de collecte des contrôles sélectionnés (collecteurs lancés, "
+                             "entrées secedit, sous-catégories d'audit, clés et valeurs de registre, services) "
+                             "sans analyser")
+    parser.add_argument("--secedit-inf", metavar="FICHIER",
+                        help="export secedit (.inf) existant à utiliser au lieu de lancer secedit")
+    parser.add_argument("--auditpol-csv", metavar="FICHIER",
+                        help="export CSV de 'auditpol /get /category:* /r' à utiliser au lieu de lancer auditpol")
+    parser.add_argument("--services-reg", metavar="FICHIER",
+                        help="export .reg de la clé des services (poste ou ruche SYSTEM hors ligne) à utiliser "
+                             "au lieu d'énumérer le registre local")
+    parser.add_argument("--bundle", metavar="CHEMIN",
+                        help="évaluer hors ligne un bundle de collecte (répertoire ou .zip) au lieu du poste local")
+    parser.add_argument("--save-bundle", metavar="CHEMIN",
+                        help="enregistrer les données collectées dans un bundle (répertoire ou .zip)")
+    parser.add_argument("--cache-dir", metavar="REPERTOIRE",
+                        help="activer le cache des exports secedit/auditpol et de l'inventaire des services dans "
+                             "ce répertoire (désactivé par défaut) : les données reprises peuvent dater de la "
+                             "durée de validité de leur source")
+    parser.add_argument("--cache-ttl", metavar="SOURCE=SECONDES", type=cache_ttl, action="append", default=[],
+                        help="durée de validité du cache d'une source ("
+                             + ", ".join(f"{name} : {ttl} s" for name, ttl in CACHE_TTLS.items())
+                             + " par défaut ; 0 désactive le cache de la source)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ignorer le cache de --cache-dir et relancer toutes les collectes")
+    parser.add_argument("--jsonl", metavar="FICHIER",
+                        help="écrire les résultats au fil de l'eau en JSON Lines")
+    parser.add_argument("--csv", metavar="FICHIER",
+                        help="écrire les résultats au fil de l'eau en CSV")
+    parser.add_argument("--sarif", metavar="FICHIER",
+                        help="écrire les résultats au fil de l'eau en SARIF 2.1.0")
+    parser.add_argument("--sqlite", metavar="FICHIER",
+                        help="ajouter l'exécution et ses résultats à une base SQLite d'historique")
+    parser.add_argument("--state", metavar="FICHIER",
+                        help="analyse incrémentale : reprendre les résultats des clés de registre non modifiées "
+                             "depuis l'exécution enregistrée dans ce fichier, puis le mettre à jour")
+    parser.add_argument("--sid-cache", metavar="FICHIER",
+                        help="conserver dans ce fichier les traductions SID <-> nom de compte des droits utilisateur "
+                             "entre deux exécutions")
+    parser.add_argument("--command-timeout", metavar="SECONDES", type=positive_float, default=120.0,
+                        help="délai maximal de chaque commande externe (défaut : 120 s)")
+    parser.add_argument("--max-commands", metavar="N", type=positive_int, default=4,
+                        help="nombre maximal de commandes externes simultanées (défaut : 4)")
+    parser.add_argument("--workers", metavar="N", type=positive_int, default=1,
+                        help="nombre de contrôles évalués en parallèle (défaut : 1)")
+    parser.add_argument("--profile", metavar="N", type=positive_int, nargs="?", const=20,
+                        help="mesurer chaque contrôle, collecteur et import de section, afficher les N plus lents "
+                             "(défaut : 20) et écrire compliance_profile.json à côté du rapport")
+
+    commands = parser.add_subparsers(dest="command", metavar="COMMANDE")
+    fleet = commands.add_parser("fleet-eval", help="évaluer un répertoire de bundles de collecte (parc de postes)")
+    fleet.add_argument("directory", metavar="REPERTOIRE", help="répertoire contenant les bundles (répertoires ou .zip)")
+    fleet.add_argument("--output", metavar="FICHIER", default="fleet_results.jsonl",
+                       help="fichier JSON Lines des résultats (défaut : fleet_results.jsonl)")
+    fleet.add_argument("--processes", metavar="N", type=positive_int,
+                       help="nombre de processus (défaut : nombre de processeurs)")
+    fleet.add_argument("--chunksize", metavar="N", type=positive_int, default=8,
+                       help="bundles transmis à un worker par envoi (défaut : 8)")
+    fleet.add_argument("--html", metavar="FICHIER",
+                       help="rapport HTML consolidé (une ligne par contrôle et par hôte)")
+    fleet.add_argument("--sqlite", metavar="FICHIER",
+                       help="ajouter une exécution par hôte à une base SQLite d'historique")
+
+    history = commands.add_parser("history", help="interroger une base SQLite d'historique")
+    history.add_argument("database", metavar="BASE", help="base SQLite alimentée par --sqlite")
+    query = history.add_mutually_exclusive_group(required=True)
+    query.add_argument("--check", metavar="ID", help="historique d'un contrôle et date de début de l'échec en cours")
+    query.add_argument("--failing", metavar="PREFIXE",
+                       help="hôtes dont la dernière exécution échoue sur les contrôles commençant par PREFIXE")
+    history.add_argument("--host", metavar="HOTE", help="limiter --check à un hôte")
+
+    diff = commands.add_parser("diff", help="différences entre deux exécutions enregistrées ou deux bundles")
+    diff.add_argument("references", metavar="REFERENCE", nargs="*",
+                      help="deux bundles, ou deux identifiants d'exécution (préfixes acceptés) avec --database")
+    diff.add_argument("--database", metavar="BASE", help="base SQLite alimentée par --sqlite")
+    diff.add_argument("--host", metavar="HOTE", help="avec --database : comparer les deux dernières exécutions de l'hôte")
+
+    bench = commands.add_parser("benchmark", help="banc d'essai sur des hôtes synthétiques")
+    bench.add_argument("--hosts", metavar="N", type=positive_int, default=200,
+                       help="nombre d'hôtes synthétiques (défaut : 200)")
+    bench.add_argument("--compliance", metavar="RATIO", type=probability, default=0.7,
+                       help="proportion de valeurs conformes (défaut : 0.7)")
+    bench.add_argument("--missing-rate", metavar="RATIO", type=probability, default=0.1,
+                       help="proportion de clés et d'entrées absentes (défaut : 0.1)")
+    bench.add_argument("--seed", metavar="N", type=int, default=0,
+                       help="graine du générateur (défaut : 0)")
+    bench.add_argument("--baseline", metavar="FICHIER", default="benchmark_baseline.jsonl",
+                       help="fichier de référence auquel la mesure est ajoutée (défaut : benchmark_baseline.jsonl)")
+    bench.add_argument("--write-bundles", metavar="REPERTOIRE",
+                       help="enregistrer aussi les hôtes générés comme bundles .zip (pour fleet-eval)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    if args.command == "fleet-eval":
+        fleet_eval(args.directory, args.output, args.processes, args.chunksize, args.html, args.sqlite)
+        return
+    if args.command == "diff":
+        if args.database and (len(args.references) == 2 or (args.host and not args.references)):
+            try:
+                print_drift(*stored_run_diff(args.database, args.references, args.host))
+            except ValueError as e:
+                print(f"{RED}{e}{RESET}")
+        elif not args.database and len(args.references) == 2:
+            print_drift(*bundle_diff(*args.references))
+        else:
+            print(f"{RED}diff attend deux bundles, ou --database avec deux identifiants d'exécution ou --host{RESET}")
+        return
+    if args.command == "history":
+        if args.check:
+            print_check_history(args.database, args.check, args.host)
+        else:
+            print_failing_hosts(args.database, args.failing)
+        return
+    if args.command == "benchmark":
+        run_benchmark(args.hosts, args.compliance, args.missing_rate, args.seed, args.baseline, args.write_bundles)
+        return
+
+    try:
+        checks = select_checks(args.sections, [pattern for patterns in args.only for pattern in patterns],
+                               [pattern for patterns in args.skip for pattern in patterns], args.level)
+    except ValueError as e:
+        print(f"{RED}{e}{RESET}")
+        return
+    if args.explain_plan:
+        CollectionPlan(checks).print_summary()
+        return
+
+    print(f"{ORANGE}Lancement du script de vérification de conformité CIS Benchmark 3.0 pour Windows 11{RESET}")
+    print(f"{ORANGE}Un rapport sera généré à la fin, dans le répertoire d'exécution du script{RESET}")
+    print(f"{ORANGE}Merci de patienter...{RESET}")
+
+    if args.sections or args.only or args.skip or args.level:
+        print(f"{ORANGE}{len(checks)} contrôles sélectionnés{RESET}")
+    with contextlib.ExitStack() as stack:
+        sinks = []
+        for sink_class, path in ((JsonLinesSink, args.jsonl), (CsvSink, args.csv), (SarifSink, args.sarif)):
+            if path:
+                sinks.append(sink_class(path))
+                stack.callback(sinks[-1].close)
+        if args.sqlite:
+            sinks.append(SqliteSink(args.sqlite, catalog_version(checks)))
+            stack.callback(sinks[-1].close)
+        run = ScanRun(checks, secedit_inf=args.secedit_inf, auditpol_csv=args.auditpol_csv,
+                      services_reg=args.services_reg, workers=args.workers,
+                      bundle=SnapshotBundle(args.bundle) if args.bundle else None, profile=bool(args.profile),
+                      commands=CommandRunner(args.max_commands, args.command_timeout),
+                      state=ScanState(args.state) if args.state else None,
+                      cache=CollectorCache(None if args.no_cache else args.cache_dir, dict(args.cache_ttl)),
+                      sinks=sinks, accounts=AccountNameCache(args.sid_cache) if args.sid_cache else None)
+        if run.profiler:
+            run.profiler.timings.extend(("import", f"sections.{name}", None, wall, cpu)
+                                        for name, (wall, cpu) in IMPORT_TIMINGS.items())
+        run.run()
+    if run.state:
+        print(f"{ORANGE}Analyse incrémentale : {run.reused} contrôles repris, "
+              f"{len(run.results) - run.reused} réévalués{RESET}")
+        run.state.save(run)
+    if args.sid_cache:
+        run.accounts.save()
+    if run.profiler:
+        run.profiler.print_summary(args.profile)
+        run.profiler.write_json(output_path("compliance_profile.json"))
+    if args.save_bundle:
+        write_bundle(args.save_bundle, run)
+
+    print("Le programme est terminé.")
+    if sys.stdin.isatty():
+        input("Appuyez sur Entrée pour fermer...")
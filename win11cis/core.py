@@ -0,0 +1,2553 @@
+"""
+Moteur de vérification : collecteurs (secedit, auditpol, registre), évaluation des contrôles,
+sorties (rapport HTML, JSON Lines, CSV, SARIF, SQLite) et bundles de collecte.
+Les contrôles eux-mêmes sont définis dans les modules de win11cis.sections.
+"""
+import asyncio
+import base64
+import os
+import shutil
+import subprocess
+import sys
+import contextlib
+import datetime
+import enum
+import functools
+import hashlib
+import html
+import csv
+import json
+import locale
+import queue
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# Définir les codes ANSI pour les couleurs
+RED = "\033[91m" # red
+ORANGE = "\033[93m"  # Jaune
+GREEN = "\033[92m" # Green
+RESET = "\033[0m"  # Réinitialiser les couleurs
+
+class Profiler:
+    """
+    Mesures d'une exécution lancée avec --profile : temps réel et temps CPU par contrôle,
+    par collecteur et par phase, nombre de processus lancés, de clés de registre ouvertes
+    et d'octets lus. Le temps CPU d'un contrôle est celui de son thread (time.thread_time) ;
+    celui d'une phase est celui du processus (time.process_time), tous threads confondus.
+    Les collecteurs se recouvrent sur la boucle asyncio et les threads de l'exécuteur :
+    seul leur temps réel est mesuré.
+    """
+
+    def __init__(self):
+        # (type, identifiant, titre, temps réel, temps CPU ou None) en secondes
+        self.timings = []
+        self.counters = {"subprocess_spawns": 0, "registry_opens": 0, "bytes_read": 0, "account_lookups": 0}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def measure(self, kind, name, title=None, clock=time.thread_time):
+        """
+        Mesure le bloc : temps réel et temps CPU selon `clock` (aucun avec None).
+        """
+        wall, cpu = time.perf_counter(), clock() if clock else None
+        try:
+            yield
+        finally:
+            self.timings.append((kind, name, title, time.perf_counter() - wall,
+                                 clock() - cpu if clock else None))
+
+    def count(self, counter, amount=1):
+        with self._lock:
+            self.counters[counter] += amount
+
+    def print_summary(self, top):
+        """
+        Affiche les `top` éléments les plus lents, les totaux par type et les compteurs.
+        """
+        print(f"{ORANGE}Top {top} des éléments les plus lents (temps réel / CPU) :{RESET}")
+        for kind, name, title, wall, cpu in sorted(self.timings, key=lambda t: t[3], reverse=True)[:top]:
+            label = f"{name} {title}" if title else name
+            cpu_label = "-" if cpu is None else f"{cpu * 1000:.2f} ms"
+            print(f"  {wall * 1000:9.2f} ms  {cpu_label:>12}  [{kind}] {label}")
+        collectors = [t for t in self.timings if t[0] == "collector"]
+        if collectors:
+            print("  Temps réel par collecteur : "
+                  + ", ".join(f"{name} {wall * 1000:.2f} ms" for _, name, _, wall, _ in collectors))
+        for kind in sorted({t[0] for t in self.timings}):
+            entries = [t for t in self.timings if t[0] == kind]
+            print(f"  Total {kind} : {len(entries)} éléments, {sum(t[3] for t in entries) * 1000:.2f} ms")
+        print("  " + ", ".join(f"{name} = {value}" for name, value in self.counters.items()))
+
+    def write_json(self, path):
+        data = {
+            "counters": self.counters,
+            "timings": [
+                {"kind": kind, "id": name, "title": title, "wall_ms": wall * 1000,
+                 "cpu_ms": None if cpu is None else cpu * 1000}
+                for kind, name, title, wall, cpu in self.timings
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, ensure_ascii=False)
+        print(f"{GREEN}Profil enregistré : {path}{RESET}")
+
+
+def active_profiler():
+    """
+    Profiler de l'exécution en cours, ou None si --profile n'est pas demandé.
+    """
+    return _current_run.profiler if _current_run is not None else None
+
+
+def profile_count(counter, amount=1):
+    profiler = active_profiler()
+    if profiler is not None:
+        profiler.count(counter, amount)
+
+
+class Status(enum.Enum):
+    """
+    Statut d'un contrôle ; la valeur est le libellé affiché dans le rapport.
+    """
+    COMPLIANT = "Conforme"
+    NON_COMPLIANT = "Non conforme"
+    ERROR = "Erreur"
+    TIMEOUT = "Délai dépassé"
+    UNKNOWN = "Inconnu"
+
+
+class CheckResult:
+    """
+    Résultat structuré d'un contrôle. Le texte du rapport est construit à partir de
+    `message_key` lors du rendu : les contrôles ne produisent plus de texte.
+    """
+    __slots__ = ("cis_id", "title", "status", "expected", "observed", "message_key", "duration")
+
+    def __init__(self, status, expected=None, observed=None, message_key=None, cis_id=None, title=None):
+        self.cis_id = cis_id
+        self.title = title
+        self.status = status
+        self.expected = expected
+        self.observed = observed
+        self.message_key = message_key
+        # Durée d'évaluation du contrôle en secondes (None pour un résultat repris d'une exécution précédente)
+        self.duration = None
+
+    def __repr__(self):
+        return f"CheckResult({self.cis_id!r}, {self.status.name}, observed={self.observed!r})"
+
+
+# Messages du rapport, indexés par `message_key`
+MESSAGES = {
+    "compliant": "Conforme (Valeur Relevée: {observed})",
+    "non_compliant": "Non conforme (Valeur Relevée: {observed} - attendu : {expected})",
+    "not_found": "Non conforme (Valeur Relevée: Introuvable - attendu : {expected})",
+    "key_missing": "Non conforme (Clé de registre introuvable - attendu : {expected})",
+    "value_missing": "Non conforme (Valeur de registre introuvable - attendu : {expected})",
+    "missing_default": "Conforme (Non configuré - la valeur par défaut est conforme)",
+    "not_installed": "Conforme (Service non installé)",
+    "error": "Erreur lors de l'exécution du contrôle : {observed}",
+    "timeout": "Délai dépassé : {observed}",
+    "unknown": "Statut inconnu",
+}
+
+# Opérateurs de comparaison entre la valeur relevée et la valeur attendue
+OPERATORS = {
+    "eq": lambda value, expected: value == expected,
+    "ne": lambda value, expected: value != expected,
+    "in": lambda value, expected: value in expected,
+    "not_in": lambda value, expected: value not in expected,
+    "ge": lambda value, expected: value >= expected,
+    "le": lambda value, expected: value <= expected,
+    "range": lambda value, expected: expected[0] <= value <= expected[1],
+    "truthy": lambda value, expected: bool(value),
+    "falsy": lambda value, expected: not value,
+    "contains": lambda value, expected: expected in value,
+    "contains_all": lambda value, expected: all(item in value for item in expected),
+    "contains_any": lambda value, expected: any(item in value for item in expected),
+}
+
+# Libellés des valeurs attendues, par opérateur
+OPERATOR_LABELS = {
+    "eq": "{}",
+    "ne": "différent de {}",
+    "in": "{}",
+    "not_in": "autre que {}",
+    "ge": "{} ou plus",
+    "le": "{} ou moins",
+    "contains": "contient {}",
+    "contains_all": "contient {}",
+    "contains_any": "contient {}",
+}
+
+
+def format_value(value, separator=", "):
+    """
+    Représentation lisible d'une valeur relevée ou attendue.
+    """
+    if value is None:
+        return "Introuvable"
+    if isinstance(value, dict):
+        return ", ".join(f"{name}={format_value(item)}" for name, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return separator.join(str(item) for item in value)
+    return str(value)
+
+
+def describe_expected(op, expected):
+    """
+    Libellé de la valeur attendue pour un opérateur donné.
+    """
+    if op == "range":
+        return f"entre {expected[0]} et {expected[1]}"
+    if op == "truthy":
+        return "Activé"
+    if op == "falsy":
+        return "Désactivé"
+    separator = " ou " if op in ("in", "not_in", "contains_any") else ", "
+    return OPERATOR_LABELS[op].format(format_value(expected, separator))
+
+
+def compare_result(value, op, expected):
+    """
+    Compare une valeur relevée à la valeur attendue et retourne le CheckResult correspondant.
+    """
+    compliant = OPERATORS[op](value, expected)
+    return CheckResult(
+        Status.COMPLIANT if compliant else Status.NON_COMPLIANT,
+        expected=describe_expected(op, expected),
+        observed=value,
+        message_key="compliant" if compliant else "non_compliant",
+    )
+
+
+def render_details(result):
+    """
+    Texte du rapport pour un résultat : "<id> <titre>: <message>".
+    """
+    message = MESSAGES.get(result.message_key, MESSAGES["unknown"]).format(
+        observed=format_value(result.observed),
+        expected=result.expected,
+    )
+    return f"{result.cis_id} {result.title}: {message}"
+
+
+def error_result(error):
+    """
+    Résultat d'un contrôle interrompu par une exception : Délai dépassé si une commande
+    externe n'a pas répondu à temps, Erreur sinon.
+    """
+    if isinstance(error, CommandTimeout):
+        return CheckResult(Status.TIMEOUT, observed=str(error), message_key="timeout")
+    return CheckResult(Status.ERROR, observed=str(error), message_key="error")
+
+
+def compliance_check(cis_id, title, level="L1", requires=()):
+    """
+    Décorateur déclarant l'identifiant CIS, le titre, le niveau de profil (L1, L2 ou BL)
+    et les données lues par un contrôle (voir CollectionPlan) :
+    ("secedit", section, clé), ("auditpol", sous-catégorie), ("registry", ruche, clé, valeur)
+    ou ("service", nom). Une donnée non déclarée est lue à la demande, à la première lecture.
+    Le contrôle retourne un CheckResult ; une exception devient un résultat au statut Erreur.
+    """
+    def decorator(func):
+        def call(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                return error_result(e)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = active_profiler()
+            started = time.perf_counter()
+            if profiler is None:
+                result = call(*args, **kwargs)
+            else:
+                with profiler.measure("check", cis_id, title):
+                    result = call(*args, **kwargs)
+            result.duration = time.perf_counter() - started
+            result.cis_id = cis_id
+            result.title = title
+            return result
+        wrapper.cis_id = cis_id
+        wrapper.title = title
+        wrapper.level = level
+        wrapper.requires = tuple(requires)
+        return wrapper
+    return decorator
+
+
+class CommandTimeout(Exception):
+    """
+    Commande externe interrompue faute de réponse dans le délai imparti.
+    """
+
+    def __init__(self, args, timeout):
+        super().__init__(f"la commande « {' '.join(args)} » n'a pas répondu en {timeout:g} s")
+        self.args_list = args
+        self.timeout = timeout
+
+
+class CommandRunner:
+    """
+    Exécution asynchrone des commandes externes (secedit, auditpol...) : sans shell,
+    au plus `max_concurrency` processus simultanés et un délai par commande au-delà
+    duquel le processus est tué et CommandTimeout levée.
+    """
+
+    def __init__(self, max_concurrency=4, timeout=120.0):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        # Un sémaphore par boucle asyncio (une exécution peut en créer plusieurs)
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self):
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def run(self, args, timeout=None):
+        """
+        Lance `args` (liste, sans shell) et retourne sa sortie standard (bytes).
+        Lève CommandTimeout après `timeout` secondes (défaut du runner) et
+        subprocess.CalledProcessError si le code de retour est non nul.
+        L'annulation de la tâche tue également le processus.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        # Sortie dans un fichier temporaire plutôt qu'un pipe : un processus petit-enfant
+        # qui hériterait du pipe ne peut pas bloquer la fin de la commande après son arrêt.
+        with tempfile.TemporaryFile() as stdout:
+            async with self._semaphore():
+                profile_count("subprocess_spawns")
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdout=stdout,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                try:
+                    await asyncio.wait_for(process.wait(), timeout)
+                except asyncio.TimeoutError:
+                    raise CommandTimeout(args, timeout) from None
+                finally:
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+            if process.returncode:
+                raise subprocess.CalledProcessError(process.returncode, args)
+            stdout.seek(0)
+            return stdout.read()
+
+
+# Durée de validité par défaut (secondes) des sorties brutes conservées dans le cache de collecte
+CACHE_TTLS = {
+    "secedit": 300,
+    "auditpol": 300,
+    "services": 300,
+}
+
+
+class CollectorCache:
+    """
+    Cache disque des sorties brutes des collecteurs coûteux (export secedit, CSV auditpol...) :
+    pour chaque source, un fichier de données et un fichier .json portant sa date de création
+    et son empreinte SHA-256. Une entrée expirée (durée de validité propre à chaque source),
+    dont l'empreinte ne correspond plus ou illisible est recollectée : une donnée reprise
+    peut donc dater de la durée de validité de sa source.
+    Sans répertoire (`directory` None : par défaut, sans --cache-dir), chaque collecte est exécutée.
+    Le répertoire est créé accessible à son seul propriétaire.
+    """
+
+    def __init__(self, directory=None, ttls=None):
+        self.directory = directory
+        self.ttls = {**CACHE_TTLS, **(ttls or {})}
+
+    def _paths(self, name):
+        data_path = os.path.join(self.directory, name)
+        return data_path, data_path + ".json"
+
+    def load(self, name):
+        """
+        Retourne le contenu en cache d'une source s'il est valide, None sinon.
+        """
+        if self.directory is None or self.ttls.get(name, 0) <= 0:
+            return None
+        data_path, meta_path = self._paths(name)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if time.time() - meta["created"] > self.ttls[name]:
+                return None
+            with open(data_path, "rb") as f:
+                data = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        if hashlib.sha256(data).hexdigest() != meta.get("sha256"):
+            return None
+        profile_count("bytes_read", len(data))
+        print(f"{ORANGE}{name} : données reprises du cache ({int(time.time() - meta['created'])} s){RESET}")
+        return data
+
+    def store(self, name, data):
+        if self.directory is None or self.ttls.get(name, 0) <= 0:
+            return
+        data_path, meta_path = self._paths(name)
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            # Écriture dans des fichiers temporaires renommés : jamais d'entrée à moitié écrite
+            for path, content in ((data_path, data),
+                                  (meta_path, json.dumps({"created": time.time(),
+                                                          "sha256": hashlib.sha256(data).hexdigest()}).encode())):
+                with open(path + ".tmp", "wb") as f:
+                    f.write(content)
+                os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"{ORANGE}{name} non enregistré dans le cache : {e}{RESET}")
+
+    async def fetch(self, name, produce):
+        """
+        Contenu brut d'une source : depuis le cache s'il est valide, sinon via la coroutine
+        `produce()` dont le résultat est mis en cache.
+        """
+        data = self.load(name)
+        if data is None:
+            data = await produce()
+            self.store(name, data)
+        return data
+
+
+# Boucle du worker PowerShell : une requête JSON par ligne sur stdin, une réponse JSON par ligne sur stdout
+POWERSHELL_WORKER_SCRIPT = r"""
+$ErrorActionPreference = 'Stop'
+$ProgressPreference = 'SilentlyContinue'
+[Console]::InputEncoding = [Text.UTF8Encoding]::new($false)
+[Console]::OutputEncoding = [Text.UTF8Encoding]::new($false)
+while ($null -ne ($line = [Console]::In.ReadLine())) {
+    $id = $null
+    try {
+        $request = $line | ConvertFrom-Json
+        $id = $request.id
+        $output = @(Invoke-Expression $request.command)
+        $response = @{ id = $id; ok = $true; output = $output }
+    } catch {
+        $response = @{ id = $id; ok = $false; error = $_.Exception.Message }
+    }
+    [Console]::Out.WriteLine(($response | ConvertTo-Json -Compress -Depth 6))
+    [Console]::Out.Flush()
+}
+"""
+
+
+class PowerShellError(Exception):
+    """
+    Commande rejetée par le worker PowerShell (exception côté PowerShell ou réponse invalide).
+    """
+
+
+class PowerShellWorker:
+    """
+    Processus PowerShell persistant réutilisé pour toutes les commandes d'une exécution,
+    ce qui évite le démarrage de powershell.exe à chaque contrôle.
+
+    Protocole (une ligne JSON par message) :
+        requête  {"id": 1, "command": "Get-Service BTAGService"}
+        réponse  {"id": 1, "ok": true, "output": [...]} ou {"id": 1, "ok": false, "error": "..."}
+
+    `argv` remplace la commande lancée : tout processus qui respecte ce protocole convient,
+    par exemple un script Python qui renvoie les requêtes pour tester le protocole sous Linux.
+    Le processus est relancé automatiquement s'il s'est arrêté ; une requête qui dépasse son
+    délai tue le processus et lève CommandTimeout.
+    """
+
+    def __init__(self, argv=None, timeout=60.0):
+        if argv is None:
+            encoded = base64.b64encode(POWERSHELL_WORKER_SCRIPT.encode("utf-16-le")).decode("ascii")
+            argv = ["powershell.exe", "-NoLogo", "-NoProfile", "-NonInteractive",
+                    "-ExecutionPolicy", "Bypass", "-EncodedCommand", encoded]
+        self.argv = argv
+        self.timeout = timeout
+        self._process = None
+        self._lines = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _start(self):
+        profile_count("subprocess_spawns")
+        self._process = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace"
+        )
+        # Lecture de stdout sur un thread : permet d'attendre une réponse avec un délai
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read_lines, args=(self._process.stdout, self._lines), daemon=True).start()
+
+    @staticmethod
+    def _read_lines(stdout, lines):
+        for line in stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def _alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _send(self, request_id, command):
+        if not self._alive():
+            self.close()
+            self._start()
+        self._process.stdin.write(json.dumps({"id": request_id, "command": command}) + "\n")
+        self._process.stdin.flush()
+
+    def _receive(self, request_id, deadline):
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError from None
+            if line is None:
+                raise BrokenPipeError("le worker PowerShell s'est arrêté")
+            if not line.strip():
+                continue
+            try:
+                response = json.loads(line)
+            except ValueError:
+                raise PowerShellError(f"réponse invalide du worker PowerShell : {line.strip()}") from None
+            # Réponse d'une requête précédente (par exemple après une relance) : ignorée
+            if response.get("id") == request_id:
+                return response
+
+    def request(self, command, timeout=None):
+        """
+        Exécute `command` dans le worker et retourne sa sortie (désérialisée du JSON).
+        Si le worker s'arrête pendant la requête, il est relancé et la requête renvoyée une fois.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            for attempt in range(2):
+                self._next_id += 1
+                request_id = self._next_id
+                try:
+                    self._send(request_id, command)
+                    response = self._receive(request_id, time.monotonic() + timeout)
+                    break
+                except TimeoutError:
+                    self.close(kill=True)
+                    raise CommandTimeout(["powershell", command], timeout) from None
+                except (BrokenPipeError, OSError):
+                    self.close()
+                    if attempt:
+                        raise
+        if not response.get("ok"):
+            raise PowerShellError(response.get("error") or "erreur PowerShell inconnue")
+        return response.get("output")
+
+    def close(self, kill=False):
+        """
+        Arrête le processus worker (il sera relancé à la prochaine requête) : fermeture
+        de stdin, ou arrêt immédiat avec `kill` (processus bloqué).
+        """
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if not kill:
+            try:
+                process.stdin.close()
+                process.wait(timeout=2)
+                return
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        process.kill()
+        process.wait()
+
+
+def parse_security_policy(text):
+    """
+    Parse le contenu d'un fichier INF secedit en dictionnaire section -> clé -> valeur.
+    """
+    policy = {}
+    section = policy.setdefault("", {})
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(";"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            section = policy.setdefault(line[1:-1].strip(), {})
+            continue
+        key, sep, value = line.partition("=")
+        if sep:
+            section[key.strip()] = value.strip()
+    return policy
+
+
+def console_encodings():
+    """
+    Codages possibles de la sortie d'une commande console (auditpol...) : page de codes OEM
+    de la console sous Windows (cp850 sur un poste français), puis celle des paramètres régionaux.
+    """
+    encodings = []
+    if os.name == "nt":
+        # Import à la demande : ctypes.windll n'existe que sous Windows
+        import ctypes
+        encodings.append(f"cp{ctypes.windll.kernel32.GetOEMCP()}")
+    encodings.append(locale.getpreferredencoding(False))
+    return encodings
+
+
+def decode_export(data):
+    """
+    Décode un export Windows : UTF-16 avec BOM (format natif de secedit), UTF-8, ou à défaut
+    la page de codes de la console (sortie brute d'auditpol, telle qu'elle est aussi mise en cache).
+    """
+    if data.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return data.decode("utf-16")
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        pass
+    for encoding in console_encodings():
+        try:
+            return data.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            continue
+    # Aucun codage ne convient : chaque octet est conservé tel quel
+    return data.decode("latin-1")
+
+
+def read_security_policy_file(inf_path):
+    """
+    Lit un export secedit : UTF-16 (format natif de secedit) ou UTF-8 (export converti).
+    """
+    with open(inf_path, "rb") as f:
+        data = f.read()
+    profile_count("bytes_read", len(data))
+    return parse_security_policy(decode_export(data))
+
+
+def format_security_policy(policy):
+    """
+    Sérialise une politique de sécurité parsée au format INF de secedit.
+    """
+    lines = []
+    for section, entries in policy.items():
+        if not section:
+            continue
+        lines.append(f"[{section}]")
+        lines.extend(f"{key} = {value}" for key, value in entries.items())
+    return "\n".join(lines) + "\n"
+
+
+async def export_security_policy(runner=None):
+    """
+    Exporte la politique de sécurité via un unique `secedit /export` dans le répertoire
+    temporaire et retourne le contenu brut du fichier INF.
+    """
+    export_file = os.path.join(tempfile.gettempdir(), "SecurityPolicy.inf")
+    await (runner or CommandRunner()).run(["secedit", "/export", "/cfg", export_file])
+    if not os.path.exists(export_file):
+        raise FileNotFoundError("Impossible d'exporter les paramètres de sécurité.")
+    try:
+        with open(export_file, "rb") as f:
+            data = f.read()
+    finally:
+        os.remove(export_file)
+    profile_count("bytes_read", len(data))
+    return data
+
+
+async def load_security_policy(inf_path=None, runner=None, cache=None):
+    """
+    Charge la politique de sécurité depuis un fichier INF existant ou, à défaut,
+    depuis le cache de collecte ou un export secedit.
+    """
+    if inf_path:
+        return read_security_policy_file(inf_path)
+    data = await (cache or CollectorCache()).fetch("secedit", lambda: export_security_policy(runner))
+    return parse_security_policy(decode_export(data))
+
+
+def get_security_policy():
+    """
+    Retourne la politique de sécurité de l'exécution en cours (un seul export secedit par exécution).
+    """
+    return current_run().source("secedit")
+
+
+def get_security_policy_value(section, key):
+    """
+    Retourne la valeur brute de `key` dans `section` de la politique de sécurité, ou None si absente.
+    """
+    return get_security_policy().get(section, {}).get(key)
+
+
+def security_policy_result(section, key, op, expected):
+    """
+    Évalue une entrée de l'export secedit. La valeur est convertie en entier
+    lorsque la valeur attendue est numérique.
+    """
+    value = get_security_policy_value(section, key)
+    if value is None:
+        return CheckResult(Status.NON_COMPLIANT, describe_expected(op, expected), None, "not_found")
+    if op in ("ge", "le", "range") or isinstance(expected, int):
+        value = int(value)
+    return compare_result(value, op, expected)
+
+
+# SID des comptes et groupes cités par les contrôles d'attribution des droits utilisateur (section 2.2)
+SID_EVERYONE = "S-1-1-0"
+SID_SERVICE = "S-1-5-6"
+SID_LOCAL_SERVICE = "S-1-5-19"
+SID_NETWORK_SERVICE = "S-1-5-20"
+SID_LOCAL_ACCOUNT = "S-1-5-113"
+SID_ADMINISTRATORS = "S-1-5-32-544"
+SID_USERS = "S-1-5-32-545"
+SID_GUESTS = "S-1-5-32-546"
+SID_BACKUP_OPERATORS = "S-1-5-32-551"
+SID_REMOTE_DESKTOP_USERS = "S-1-5-32-555"
+SID_VIRTUAL_MACHINES = "S-1-5-83-0"
+SID_WINDOW_MANAGER_GROUP = "S-1-5-90-0"
+SID_WDI_SERVICE_HOST = "S-1-5-80-3139157870-2983391045-3678747466-658725712-1809340420"
+
+# SID bien connus -> noms (anglais, puis français) : affichage des résultats et résolution
+# des titulaires exportés par nom plutôt que par SID
+WELL_KNOWN_SIDS = {
+    SID_EVERYONE: ("Everyone", "Tout le monde"),
+    SID_SERVICE: ("SERVICE", "SERVICE"),
+    SID_LOCAL_SERVICE: ("LOCAL SERVICE", "SERVICE LOCAL"),
+    SID_NETWORK_SERVICE: ("NETWORK SERVICE", "SERVICE RÉSEAU"),
+    SID_LOCAL_ACCOUNT: ("Local account", "Compte local"),
+    SID_ADMINISTRATORS: ("Administrators", "Administrateurs"),
+    SID_USERS: ("Users", "Utilisateurs"),
+    SID_GUESTS: ("Guests", "Invités"),
+    SID_BACKUP_OPERATORS: ("Backup Operators", "Opérateurs de sauvegarde"),
+    SID_REMOTE_DESKTOP_USERS: ("Remote Desktop Users", "Utilisateurs du Bureau à distance"),
+    SID_VIRTUAL_MACHINES: ("NT VIRTUAL MACHINE\\Virtual Machines", "MACHINE VIRTUELLE NT\\Machines virtuelles"),
+    SID_WINDOW_MANAGER_GROUP: ("Window Manager\\Window Manager Group",
+                               "Gestionnaire de fenêtres\\Groupe du gestionnaire de fenêtres"),
+    SID_WDI_SERVICE_HOST: ("NT SERVICE\\WdiServiceHost", "NT SERVICE\\WdiServiceHost"),
+}
+
+# Nom de compte (sans casse) -> SID bien connu
+WELL_KNOWN_NAMES = {name.casefold(): sid for sid, names in WELL_KNOWN_SIDS.items() for name in names}
+
+# Droit attribué à personne (« No One ») : le droit est vide ou absent de l'export
+NO_ONE = frozenset()
+
+# Traduction d'un lot de titulaires par le worker PowerShell : SID -> nom de compte, nom -> SID
+# (traduction nulle si le compte est inconnu du poste)
+ACCOUNT_LOOKUP_SCRIPT = r"""
+foreach ($account in @(ACCOUNTS)) {
+    try {
+        if ($account -like 'S-1-*') {
+            $translation = ([Security.Principal.SecurityIdentifier]$account).Translate([Security.Principal.NTAccount]).Value
+        } else {
+            $translation = ([Security.Principal.NTAccount]$account).Translate([Security.Principal.SecurityIdentifier]).Value
+        }
+    } catch {
+        $translation = $null
+    }
+    @{ account = $account; translation = $translation }
+}
+"""
+
+
+def is_sid(account):
+    return account.upper().startswith("S-1-")
+
+
+class AccountNameCache:
+    """
+    Traduction SID <-> nom de compte des titulaires des droits utilisateur, mémorisée pour tout
+    le processus (ACCOUNT_NAMES) : les SID et noms inconnus d'une exécution sont traduits en un
+    seul lot, par une seule requête au worker PowerShell du poste audité. Hors ligne (bundle,
+    autre système) ou si la traduction échoue, les SID bien connus (WELL_KNOWN_SIDS) et les
+    traductions déjà connues servent de repli. Avec `path`, les traductions sont chargées depuis
+    un fichier JSON {SID: nom} et y sont enregistrées par save() pour les exécutions suivantes.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        # SID -> nom de compte (None : SID inconnu du poste)
+        self.names = {}
+        # Nom de compte (sans casse) -> SID (None : nom inconnu du poste)
+        self.sids = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for sid, name in json.load(f).items():
+                    self._remember(sid, name)
+
+    def _remember(self, sid, name):
+        self.names[sid] = name
+        if name:
+            self.sids[name.casefold()] = sid
+
+    def _known(self, account):
+        if is_sid(account):
+            return account in WELL_KNOWN_SIDS or account in self.names
+        name = account.casefold()
+        return name in WELL_KNOWN_NAMES or name.rpartition("\\")[2] in WELL_KNOWN_NAMES or name in self.sids
+
+    def resolve(self, accounts, lookup=None):
+        """
+        Traduit en un seul lot les titulaires de `accounts` (SID ou noms) qui ne sont ni bien connus
+        ni déjà traduits. `lookup` exécute une commande PowerShell et retourne sa sortie ; sans
+        `lookup` (évaluation hors ligne), seuls les SID bien connus et les traductions connues servent.
+        """
+        with self._lock:
+            pending = sorted({account for account in accounts if not self._known(account)})
+            if not pending or lookup is None:
+                return
+            profile_count("account_lookups", len(pending))
+            accounts_list = ", ".join("'" + account.replace("'", "''") + "'" for account in pending)
+            try:
+                output = lookup(ACCOUNT_LOOKUP_SCRIPT.replace("ACCOUNTS", accounts_list))
+            except (PowerShellError, CommandTimeout, OSError):
+                output = None
+            translations = {item.get("account"): item.get("translation")
+                            for item in output or () if isinstance(item, dict)}
+            # Les comptes non traduits sont mémorisés aussi : ils ne sont plus redemandés
+            for account in pending:
+                translation = translations.get(account)
+                if is_sid(account):
+                    self._remember(account, translation)
+                elif translation:
+                    self._remember(translation, account)
+                else:
+                    self.sids[account.casefold()] = None
+
+    def sid(self, account):
+        """
+        SID d'un titulaire exporté par secedit : « *S-1-5-32-544 », un nom de compte bien connu
+        (BUILTIN\\Administrators, Administrateurs...) ou un nom déjà traduit. Un nom inconnu est
+        conservé tel quel.
+        """
+        account = account.strip().lstrip("*")
+        if is_sid(account):
+            return account
+        name = account.casefold()
+        return (WELL_KNOWN_NAMES.get(name) or WELL_KNOWN_NAMES.get(name.rpartition("\\")[2])
+                or self.sids.get(name) or account)
+
+    def name(self, sid):
+        """
+        Nom lisible d'un SID : nom anglais d'un SID bien connu, traduction connue ou le SID lui-même.
+        """
+        if sid in WELL_KNOWN_SIDS:
+            return WELL_KNOWN_SIDS[sid][0]
+        return self.names.get(sid) or sid
+
+    def save(self):
+        """
+        Enregistre les traductions connues dans `path` (SID inconnus du poste exclus).
+        """
+        if not self.path:
+            return
+        with self._lock:
+            names = {sid: name for sid, name in sorted(self.names.items()) if name}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(names, f, indent=1, ensure_ascii=False)
+
+
+# Traductions partagées par toutes les exécutions du processus
+ACCOUNT_NAMES = AccountNameCache()
+
+
+def user_right_holders(policy):
+    """
+    Titulaires bruts de chaque droit utilisateur de la section [Privilege Rights] : privilège ->
+    liste des SID (sans le préfixe « * ») ou noms de compte exportés par secedit.
+    """
+    return {
+        privilege: [account.strip().lstrip("*") for account in value.split(",") if account.strip()]
+        for privilege, value in policy.get("Privilege Rights", {}).items()
+    }
+
+
+def parse_user_rights(policy, accounts=None):
+    """
+    Attribution des droits utilisateur d'une politique de sécurité parsée :
+    privilège -> frozenset des SID titulaires (section [Privilege Rights]).
+    """
+    accounts = accounts or ACCOUNT_NAMES
+    return {privilege: frozenset(accounts.sid(account) for account in holders)
+            for privilege, holders in user_right_holders(policy).items()}
+
+
+def format_accounts(sids, accounts=None):
+    """
+    Représentation lisible d'un ensemble de titulaires (noms des comptes, triés), sans traduction :
+    les SID de l'exécution ont été traduits en un seul lot lors de l'analyse des droits.
+    """
+    if not sids:
+        return "No One"
+    accounts = accounts or ACCOUNT_NAMES
+    return ", ".join(sorted(accounts.name(sid) for sid in sids))
+
+
+def get_user_rights():
+    """
+    Retourne l'attribution des droits utilisateur de l'exécution en cours (analysée une seule fois).
+    """
+    return current_run().user_rights()
+
+
+def user_right_result(privilege, op, expected):
+    """
+    Évalue l'attribution d'un droit utilisateur par comparaison d'ensembles de SID, indépendamment
+    de la langue du système et de l'ordre des titulaires : "eq" (exactement ces titulaires, NO_ONE
+    pour « No One »), "in" (l'un des ensembles admis) ou "contains_all" (au moins ces titulaires).
+    Un droit absent de l'export n'est attribué à personne.
+    """
+    run = current_run()
+    holders = run.user_rights().get(privilege, NO_ONE)
+    compliant = OPERATORS[op](holders, expected)
+    labels = ([format_accounts(sids, run.accounts) for sids in expected] if op == "in"
+              else format_accounts(expected, run.accounts))
+    return CheckResult(
+        Status.COMPLIANT if compliant else Status.NON_COMPLIANT,
+        expected=describe_expected(op, labels),
+        observed=format_accounts(holders, run.accounts),
+        message_key="compliant" if compliant else "non_compliant",
+    )
+
+
+# Indicateurs d'audit (identiques au champ "Setting Value" des exports auditpol)
+AUDIT_NONE = 0
+AUDIT_SUCCESS = 1
+AUDIT_FAILURE = 2
+AUDIT_SUCCESS_AND_FAILURE = AUDIT_SUCCESS | AUDIT_FAILURE
+
+# GUID des sous-catégories d'audit évaluées en section 17 (indépendants de la langue du système)
+AUDIT_SUBCATEGORY_GUIDS = {
+    "Credential Validation": "{0CCE923F-69AE-11D9-BED3-505054503030}",
+    "Application Group Management": "{0CCE9239-69AE-11D9-BED3-505054503030}",
+    "Security Group Management": "{0CCE9237-69AE-11D9-BED3-505054503030}",
+    "User Account Management": "{0CCE9235-69AE-11D9-BED3-505054503030}",
+    "PNP Activity": "{0CCE9248-69AE-11D9-BED3-505054503030}",
+    "Process Creation": "{0CCE922B-69AE-11D9-BED3-505054503030}",
+    "Account Lockout": "{0CCE9217-69AE-11D9-BED3-505054503030}",
+    "Group Membership": "{0CCE9249-69AE-11D9-BED3-505054503030}",
+    "Logoff": "{0CCE9216-69AE-11D9-BED3-505054503030}",
+    "Logon": "{0CCE9215-69AE-11D9-BED3-505054503030}",
+    "Other Logon/Logoff Events": "{0CCE921C-69AE-11D9-BED3-505054503030}",
+    "Special Logon": "{0CCE921B-69AE-11D9-BED3-505054503030}",
+    "Detailed File Share": "{0CCE9244-69AE-11D9-BED3-505054503030}",
+    "File Share": "{0CCE9224-69AE-11D9-BED3-505054503030}",
+    "Other Object Access Events": "{0CCE9227-69AE-11D9-BED3-505054503030}",
+    "Removable Storage": "{0CCE9245-69AE-11D9-BED3-505054503030}",
+    "Audit Policy Change": "{0CCE922F-69AE-11D9-BED3-505054503030}",
+    "Authentication Policy Change": "{0CCE9230-69AE-11D9-BED3-505054503030}",
+    "Authorization Policy Change": "{0CCE9231-69AE-11D9-BED3-505054503030}",
+    "MPSSVC Rule-Level Policy Change": "{0CCE9232-69AE-11D9-BED3-505054503030}",
+    "Other Policy Change Events": "{0CCE9234-69AE-11D9-BED3-505054503030}",
+    "Sensitive Privilege Use": "{0CCE9228-69AE-11D9-BED3-505054503030}",
+    "IPsec Driver": "{0CCE9213-69AE-11D9-BED3-505054503030}",
+    "Other System Events": "{0CCE9214-69AE-11D9-BED3-505054503030}",
+    "Security State Change": "{0CCE9210-69AE-11D9-BED3-505054503030}",
+    "Security System Extension": "{0CCE9211-69AE-11D9-BED3-505054503030}",
+    "System Integrity": "{0CCE9212-69AE-11D9-BED3-505054503030}",
+}
+
+def parse_audit_setting(label):
+    """
+    Convertit le libellé "Inclusion Setting" d'auditpol (anglais ou français) en indicateurs.
+    """
+    label = label.strip().lower()
+    flags = AUDIT_NONE
+    if "success" in label or "succès" in label:
+        flags |= AUDIT_SUCCESS
+    if "failure" in label or "échec" in label:
+        flags |= AUDIT_FAILURE
+    return flags
+
+
+def parse_audit_policy(text):
+    """
+    Parse la sortie CSV de `auditpol /get /category:* /r` en dictionnaire GUID -> indicateurs.
+    La colonne "Setting Value" (exports `auditpol /backup`) est utilisée si elle est présente.
+    """
+    policy = {}
+    rows = csv.DictReader(line for line in text.splitlines() if line.strip())
+    for row in rows:
+        guid = (row.get("Subcategory GUID") or "").strip().upper()
+        if not guid:
+            continue
+        setting_value = (row.get("Setting Value") or "").strip()
+        if setting_value.isdigit():
+            policy[guid] = int(setting_value)
+        else:
+            policy[guid] = parse_audit_setting(row.get("Inclusion Setting") or "")
+    return policy
+
+
+async def export_audit_policy(runner=None):
+    """
+    Exporte la politique d'audit via un unique `auditpol /get /category:* /r` (CSV brut).
+    """
+    output = await (runner or CommandRunner()).run(["auditpol", "/get", "/category:*", "/r"])
+    profile_count("bytes_read", len(output))
+    return output
+
+
+async def load_audit_policy(csv_path=None, runner=None, cache=None):
+    """
+    Charge la politique d'audit depuis un CSV existant ou, à défaut,
+    depuis le cache de collecte ou auditpol.
+    """
+    if csv_path:
+        with open(csv_path, "rb") as f:
+            data = f.read()
+        profile_count("bytes_read", len(data))
+        return parse_audit_policy(decode_export(data))
+
+    data = await (cache or CollectorCache()).fetch("auditpol", lambda: export_audit_policy(runner))
+    return parse_audit_policy(decode_export(data))
+
+
+def format_audit_policy(policy):
+    """
+    Sérialise une politique d'audit parsée en CSV relisible par parse_audit_policy.
+    """
+    lines = ["Subcategory GUID,Setting Value"]
+    lines.extend(f"{guid},{setting}" for guid, setting in policy.items())
+    return "\n".join(lines) + "\n"
+
+
+def get_audit_policy():
+    """
+    Retourne la politique d'audit de l'exécution en cours (un seul appel auditpol par exécution).
+    """
+    return current_run().source("auditpol")
+
+
+def get_audit_setting(subcategory):
+    """
+    Retourne les indicateurs d'audit de la sous-catégorie, ou None si elle est absente de l'export.
+    """
+    return get_audit_policy().get(AUDIT_SUBCATEGORY_GUIDS[subcategory])
+
+
+def audit_setting_includes(setting, required):
+    """
+    Vérifie que le paramètre relevé inclut au moins les indicateurs requis.
+    """
+    return setting is not None and setting & required == required
+
+
+def format_audit_setting(setting):
+    """
+    Libellé lisible d'un paramètre d'audit pour les messages de contrôle.
+    """
+    if setting is None:
+        return "Introuvable"
+    return {
+        AUDIT_NONE: "No Auditing",
+        AUDIT_SUCCESS: "Success",
+        AUDIT_FAILURE: "Failure",
+        AUDIT_SUCCESS_AND_FAILURE: "Success and Failure",
+    }[setting & AUDIT_SUCCESS_AND_FAILURE]
+
+
+def audit_policy_result(subcategory, required):
+    """
+    Évalue une sous-catégorie d'audit : le paramètre relevé doit inclure les indicateurs requis.
+    """
+    setting = get_audit_setting(subcategory)
+    expected = f"inclut {format_audit_setting(required)}"
+    if setting is None:
+        return CheckResult(Status.NON_COMPLIANT, expected, None, "not_found")
+    compliant = audit_setting_includes(setting, required)
+    return CheckResult(
+        Status.COMPLIANT if compliant else Status.NON_COMPLIANT,
+        expected=expected,
+        observed=format_audit_setting(setting),
+        message_key="compliant" if compliant else "non_compliant",
+    )
+
+
+# Ruches de registre utilisées par le cliché de registre et les exports hors ligne
+HKLM = "HKEY_LOCAL_MACHINE"
+HKU = "HKEY_USERS"
+
+
+class RegistryKeyMissing(FileNotFoundError):
+    """
+    La clé de registre n'existe pas.
+    """
+
+
+class RegistryValueMissing(FileNotFoundError):
+    """
+    La clé de registre existe mais la valeur demandée est absente.
+    """
+
+
+# Marqueur d'une clé ou d'une valeur qui n'a pas encore été lue
+_NOT_COLLECTED = object()
+
+# Entrée de registry.json portant les dates de dernière modification des clés {ruche: {clé: date}}
+REGISTRY_LAST_WRITE = "_last_write"
+
+
+def _read_registry_key(hive, path, names, previous=None):
+    """
+    Ouvre une clé une seule fois et lit toutes les valeurs demandées.
+    Retourne (valeurs, date de dernière modification) : valeurs vaut {nom en minuscules:
+    (valeur, type) ou None si absente}, None si la clé est absente (date 0), ou l'exception
+    rencontrée (accès refusé...) pour qu'elle soit relevée à la lecture (date None).
+    `previous` = (valeurs, date) d'une exécution précédente : si la clé n'a pas été modifiée
+    depuis (LastWriteTime identique), ses valeurs sont reprises sans être relues.
+    """
+    # Import à la demande : seule la collecte en direct (sous Windows) a besoin de winreg
+    import winreg
+
+    profile_count("registry_opens")
+    try:
+        handle = winreg.OpenKey(getattr(winreg, hive), path)
+    except FileNotFoundError:
+        return None, 0
+    except OSError as e:
+        return e, None
+    with handle:
+        last_write = winreg.QueryInfoKey(handle)[2]
+        values = {}
+        if previous is not None and previous[1] == last_write and isinstance(previous[0], dict):
+            values = dict(previous[0])
+        for name in names:
+            if name.lower() in values:
+                continue
+            try:
+                values[name.lower()] = winreg.QueryValueEx(handle, name)
+            except FileNotFoundError:
+                values[name.lower()] = None
+        return values, last_write
+
+
+class RegistrySnapshot:
+    """
+    Cliché des valeurs de registre lues par les contrôles.
+    Chaque clé distincte est ouverte une seule fois ; les contrôles sont ensuite servis
+    par recherche dans un dictionnaire, en distinguant clé absente et valeur absente.
+    """
+
+    def __init__(self, keys=None, live=False, last_write=None):
+        # (ruche, chemin en minuscules) -> {valeur en minuscules: (donnée, type) ou None}, None si clé absente
+        self._keys = keys if keys is not None else {}
+        # (ruche, chemin en minuscules) -> date de dernière modification (FILETIME, 0 si clé absente)
+        self._last_write = last_write if last_write is not None else {}
+        # En direct, une valeur non prélue est lue à la demande ; un cliché figé la considère absente
+        self._live = live
+
+    @staticmethod
+    def _key_id(hive, path):
+        return hive, path.strip("\\").lower()
+
+    @classmethod
+    def from_registry(cls, triples, previous=None):
+        """
+        Construit le cliché à partir du registre local pour les triplets (ruche, clé, valeur).
+        Avec le cliché `previous` d'une exécution précédente, les clés dont la date de
+        dernière modification n'a pas changé sont reprises sans relire leurs valeurs.
+        """
+        wanted = {}
+        for hive, path, name in triples:
+            wanted.setdefault(cls._key_id(hive, path), (hive, path, set()))[2].add(name)
+
+        snapshot = cls(live=True)
+        for key_id, (hive, path, names) in wanted.items():
+            prior = None
+            if previous is not None and key_id in previous._last_write:
+                prior = previous._keys.get(key_id), previous._last_write[key_id]
+            values, last_write = _read_registry_key(hive, path, names, prior)
+            snapshot._keys[key_id] = values
+            if last_write is not None:
+                snapshot._last_write[key_id] = last_write
+        return snapshot
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Construit un cliché figé depuis un dictionnaire {ruche: {clé: {valeur: donnée}}}.
+        Une clé associée à None est considérée comme absente. L'entrée facultative
+        "_last_write" {ruche: {clé: date}} porte les dates de dernière modification.
+        """
+        keys = {}
+        for hive, paths in data.items():
+            if hive == REGISTRY_LAST_WRITE:
+                continue
+            for path, values in paths.items():
+                if values is not None:
+                    values = {name.lower(): (value, None) for name, value in values.items()}
+                keys[cls._key_id(hive, path)] = values
+        last_write = {
+            cls._key_id(hive, path): stamp
+            for hive, paths in data.get(REGISTRY_LAST_WRITE, {}).items()
+            for path, stamp in paths.items()
+        }
+        return cls(keys, last_write=last_write)
+
+    def last_write(self, hive, path):
+        """
+        Date de dernière modification d'une clé (0 si absente), None si inconnue.
+        """
+        return self._last_write.get(self._key_id(hive, path))
+
+    def to_dict(self):
+        """
+        Exporte le cliché au format de from_dict ({ruche: {clé: {valeur: donnée}}}),
+        avec les dates de dernière modification connues.
+        Les clés illisibles (accès refusé...) ne sont pas exportées.
+        """
+        data = {}
+        for (hive, path), values in self._keys.items():
+            if isinstance(values, Exception):
+                continue
+            exported = None
+            if values is not None:
+                exported = {}
+                for name, entry in values.items():
+                    if entry is not None:
+                        # Les données binaires sont exportées en hexadécimal
+                        exported[name] = entry[0].hex() if isinstance(entry[0], bytes) else entry[0]
+            data.setdefault(hive, {})[path] = exported
+        for (hive, path), stamp in self._last_write.items():
+            if path in data.get(hive, {}):
+                data.setdefault(REGISTRY_LAST_WRITE, {}).setdefault(hive, {})[path] = stamp
+        return data
+
+    def key_values(self, hive, path):
+        key_id = self._key_id(hive, path)
+        values = self._keys.get(key_id, _NOT_COLLECTED)
+        if values is _NOT_COLLECTED:
+            values = None
+            if self._live:
+                values, last_write = _read_registry_key(hive, path, ())
+                if last_write is not None:
+                    self._last_write[key_id] = last_write
+            self._keys[key_id] = values
+        if values is None:
+            raise RegistryKeyMissing(f"Clé de registre absente : {hive}\\{path}")
+        if isinstance(values, Exception):
+            raise values
+        return values
+
+    def has_key(self, hive, path):
+        try:
+            self.key_values(hive, path)
+        except RegistryKeyMissing:
+            return False
+        return True
+
+    def query(self, hive, path, name):
+        """
+        Retourne (donnée, type) ; lève RegistryKeyMissing ou RegistryValueMissing.
+        """
+        values = self.key_values(hive, path)
+        entry = values.get(name.lower(), _NOT_COLLECTED)
+        if entry is _NOT_COLLECTED:
+            entry = None
+            if self._live:
+                entry, _ = _read_registry_key(hive, path, (name,))
+                entry = entry.get(name.lower()) if isinstance(entry, dict) else None
+            values[name.lower()] = entry
+        if entry is None:
+            raise RegistryValueMissing(f"Valeur de registre absente : {hive}\\{path}\\{name}")
+        return entry
+
+    def get(self, hive, path, name, default=None):
+        try:
+            return self.query(hive, path, name)[0]
+        except FileNotFoundError:
+            return default
+
+    def state(self, hive, path, name):
+        """
+        "present", "key_missing" ou "value_missing".
+        """
+        try:
+            self.query(hive, path, name)
+        except RegistryKeyMissing:
+            return "key_missing"
+        except RegistryValueMissing:
+            return "value_missing"
+        return "present"
+
+
+def get_registry_snapshot():
+    """
+    Retourne le cliché de registre de l'exécution en cours, construit en une seule passe.
+    """
+    return current_run().source("registry")
+
+
+def registry_value_result(hive, path, name, op, expected, missing_ok=False):
+    """
+    Évalue une valeur de registre. Avec `missing_ok`, une clé ou une valeur absente
+    est conforme (la valeur par défaut de Windows satisfait la recommandation).
+    """
+    try:
+        value, _ = get_registry_snapshot().query(hive, path, name)
+    except FileNotFoundError as e:
+        message_key = "key_missing" if isinstance(e, RegistryKeyMissing) else "value_missing"
+        return missing_registry_result(op, expected, missing_ok, message_key)
+    return compare_result(value, op, expected)
+
+
+def missing_registry_result(op, expected, missing_ok, message_key):
+    """
+    Résultat d'une clé ("key_missing") ou d'une valeur ("value_missing") de registre absente.
+    """
+    if missing_ok:
+        return CheckResult(Status.COMPLIANT, describe_expected(op, expected), None, "missing_default")
+    return CheckResult(Status.NON_COMPLIANT, describe_expected(op, expected), None, message_key)
+
+
+def registry_list_result(hive, path, names, op, expected):
+    """
+    Évalue une liste de stratégie enregistrée en valeurs numérotées ("1", "2"...) d'une clé :
+    les données des valeurs `names` présentes forment la liste comparée à la valeur attendue.
+    """
+    snapshot = get_registry_snapshot()
+    try:
+        snapshot.key_values(hive, path)
+    except RegistryKeyMissing:
+        return missing_registry_result(op, expected, False, "key_missing")
+    items = [value for value in (snapshot.get(hive, path, name) for name in names) if value is not None]
+    if not items:
+        return missing_registry_result(op, expected, False, "value_missing")
+    return compare_result(items, op, expected)
+
+
+def registry_values_result(conditions):
+    """
+    Évalue plusieurs valeurs de registre [(ruche, clé, valeur, opérateur, attendu), ...] :
+    le contrôle est conforme si toutes les conditions sont satisfaites.
+    """
+    names = [name for _, _, name, _, _ in conditions]
+    if len(set(names)) < len(names):
+        # Mêmes noms de valeur sous des clés différentes : libellé qualifié par le nom de la clé
+        names = [path.rsplit("\\", 1)[-1] + "\\" + name for _, path, name, _, _ in conditions]
+
+    observed, expected = {}, []
+    compliant, message_key = True, None
+    snapshot = get_registry_snapshot()
+    for label, (hive, path, name, op, wanted) in zip(names, conditions):
+        expected.append(f"{label} : {describe_expected(op, wanted)}")
+        try:
+            observed[label], _ = snapshot.query(hive, path, name)
+        except RegistryKeyMissing:
+            observed[label] = None
+            compliant, message_key = False, "key_missing"
+            continue
+        except RegistryValueMissing:
+            observed[label] = None
+            compliant, message_key = False, message_key or "value_missing"
+            continue
+        if not OPERATORS[op](observed[label], wanted):
+            compliant = False
+
+    if message_key is None:
+        message_key = "compliant" if compliant else "non_compliant"
+    return CheckResult(
+        Status.COMPLIANT if compliant else Status.NON_COMPLIANT,
+        expected=", ".join(expected),
+        observed=observed,
+        message_key=message_key,
+    )
+
+
+class RegistryRule:
+    """
+    Ligne du catalogue REGISTRY_RULES : une valeur de registre comparée à une valeur attendue.
+    Une règle s'appelle comme une fonction de contrôle et retourne un CheckResult.
+    """
+    __slots__ = ("cis_id", "title", "hive", "path", "name", "op", "expected", "level", "missing_ok")
+    # Collecteur des données lues par la règle
+    collector = "registry"
+
+    def __init__(self, cis_id, title, hive, path, name, op, expected, level, missing_ok=False):
+        self.cis_id = cis_id
+        self.title = title
+        self.hive = hive
+        self.path = path
+        self.name = name
+        self.op = op
+        self.expected = expected
+        self.level = level
+        self.missing_ok = missing_ok
+
+    def __repr__(self):
+        return f"RegistryRule({self.cis_id!r}, {self.hive}\\{self.path}\\{self.name})"
+
+    @property
+    def requires(self):
+        """
+        Donnée lue par la règle (voir compliance_check) : la valeur de registre.
+        """
+        return (("registry", self.hive, self.path, self.name),)
+
+    def __call__(self):
+        return evaluate_registry_rules([self])[self.cis_id]
+
+    def stamp(self, snapshot):
+        """
+        Empreinte de la donnée lue (analyse incrémentale) : date de dernière modification
+        de la clé de la règle, None si elle est inconnue.
+        """
+        return snapshot.last_write(self.hive, self.path)
+
+    def read_key(self):
+        """
+        (cliché de registre, valeurs de la clé de la règle ou None si la clé est absente).
+        """
+        snapshot = get_registry_snapshot()
+        try:
+            return snapshot, snapshot.key_values(self.hive, self.path)
+        except RegistryKeyMissing:
+            return snapshot, None
+
+    def evaluate(self, values, snapshot):
+        """
+        Évalue la règle à partir des valeurs déjà lues de sa clé (None si la clé est absente).
+        """
+        if values is None:
+            return missing_registry_result(self.op, self.expected, self.missing_ok, "key_missing")
+        entry = values.get(self.name.lower())
+        if entry is None:
+            # Valeur absente du cliché ou non prélue : recherche complète (lecture à la demande en direct)
+            try:
+                entry = snapshot.query(self.hive, self.path, self.name)
+            except RegistryValueMissing:
+                return missing_registry_result(self.op, self.expected, self.missing_ok, "value_missing")
+        return compare_result(entry[0], self.op, self.expected)
+
+    def evaluate_safely(self, values, snapshot, error=None):
+        """
+        Comme evaluate, mais une erreur de lecture de la clé ou de comparaison devient un résultat Erreur.
+        """
+        try:
+            if error is not None:
+                raise error
+            return self.evaluate(values, snapshot)
+        except Exception as e:
+            return error_result(e)
+
+
+def evaluate_registry_rules(rules, on_result=None):
+    """
+    Moteur du catalogue : regroupe les règles par clé, consulte chaque clé une seule fois
+    dans le cliché puis évalue toutes ses règles dans une même boucle.
+    Retourne {identifiant CIS: CheckResult} ; `on_result` reçoit chaque résultat dès son évaluation.
+    """
+    by_key = {}
+    for rule in rules:
+        by_key.setdefault(RegistrySnapshot._key_id(rule.hive, rule.path), []).append(rule)
+
+    results = {}
+    profiler = active_profiler()
+    for key_rules in by_key.values():
+        first = key_rules[0]
+        snapshot = values = error = None
+        try:
+            snapshot, values = first.read_key()
+        except Exception as e:
+            error = e
+        for rule in key_rules:
+            started = time.perf_counter()
+            if profiler is None:
+                result = rule.evaluate_safely(values, snapshot, error)
+            else:
+                with profiler.measure("check", rule.cis_id, rule.title):
+                    result = rule.evaluate_safely(values, snapshot, error)
+            result.duration = time.perf_counter() - started
+            result.cis_id = rule.cis_id
+            result.title = rule.title
+            results[rule.cis_id] = result
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+# Clé de registre des services (valeur "Start" : type de démarrage)
+SERVICES_KEY = r"SYSTEM\CurrentControlSet\Services"
+
+
+class ServiceInventory:
+    """
+    Inventaire des services d'un poste : nom -> type de démarrage (valeur Start), construit par
+    une seule énumération de la clé des services et servi à toutes les règles de la section 5.
+    Une sous-clé sans valeur Start n'est pas un service ; un service absent de l'inventaire
+    n'est pas installé.
+    """
+
+    def __init__(self, starts=None):
+        # Nom en minuscules -> (nom, type de démarrage)
+        self._starts = {name.lower(): (name, start) for name, start in (starts or {}).items()}
+
+    @classmethod
+    def from_registry(cls):
+        """
+        Énumère la clé des services du registre local et lit la valeur Start de chaque service.
+        """
+        # Import à la demande : seule la collecte en direct (sous Windows) a besoin de winreg
+        import winreg
+
+        starts = {}
+        profile_count("registry_opens")
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, SERVICES_KEY) as services:
+            for index in range(winreg.QueryInfoKey(services)[0]):
+                try:
+                    name = winreg.EnumKey(services, index)
+                except OSError:
+                    # Service supprimé pendant l'énumération
+                    break
+                profile_count("registry_opens")
+                try:
+                    with winreg.OpenKey(services, name) as handle:
+                        starts[name] = winreg.QueryValueEx(handle, "Start")[0]
+                except OSError:
+                    continue
+        return cls(starts)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Inventaire depuis un dictionnaire {service: Start, ou None si le service n'est pas installé}.
+        """
+        return cls({name: start for name, start in data.items() if start is not None})
+
+    @classmethod
+    def from_reg_export(cls, text):
+        """
+        Inventaire depuis un export .reg de la clé des services (`reg export HKLM\\SYSTEM\\CurrentControlSet\\Services`),
+        ou de celle d'une ruche SYSTEM hors ligne chargée avec `reg load` (ControlSet001\\Services) :
+        seules les sous-clés directes d'une clé Services sont retenues.
+        """
+        starts = {}
+        service = None
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if line.startswith("[") and line.endswith("]"):
+                parent, _, name = line[1:-1].rpartition("\\")
+                service = name if parent.rpartition("\\")[2].lower() == "services" else None
+            elif service and line.lower().startswith('"start"=dword:'):
+                starts[service] = int(line.partition(":")[2], 16)
+        return cls(starts)
+
+    def to_dict(self):
+        """
+        Exporte l'inventaire au format de services.json ({service: Start}).
+        """
+        return dict(self._starts.values())
+
+    def start_type(self, service):
+        """
+        (type de démarrage, installé) d'un service ; (None, False) s'il n'est pas installé.
+        """
+        entry = self._starts.get(service.lower())
+        return (None, False) if entry is None else (entry[1], True)
+
+
+def get_service_inventory():
+    """
+    Retourne l'inventaire des services de l'exécution en cours (une seule énumération par exécution).
+    """
+    return current_run().source("services")
+
+
+class ServiceRule(RegistryRule):
+    """
+    Ligne du catalogue de la section 5 : type de démarrage d'un service, lu dans l'inventaire
+    des services plutôt que sous sa clé. Un service non installé satisfait la recommandation
+    (« Disabled » ou « Not Installed ») et a son propre résultat ("not_installed").
+    """
+    __slots__ = ("service",)
+    collector = "services"
+
+    def __init__(self, cis_id, title, service, op, expected, level):
+        super().__init__(cis_id, title, HKLM, f"{SERVICES_KEY}\\{service}", "Start", op, expected, level)
+        self.service = service
+
+    def __repr__(self):
+        return f"ServiceRule({self.cis_id!r}, {self.service})"
+
+    @property
+    def requires(self):
+        """
+        Donnée lue par la règle (voir compliance_check) : le type de démarrage du service.
+        """
+        return (("service", self.service),)
+
+    def read_key(self):
+        """
+        (inventaire des services, (type de démarrage, installé)) du service de la règle.
+        """
+        inventory = get_service_inventory()
+        return inventory, inventory.start_type(self.service)
+
+    def stamp(self, inventory):
+        """
+        Empreinte de la donnée lue (analyse incrémentale) : [type de démarrage, installé].
+        """
+        return list(inventory.start_type(self.service))
+
+    def evaluate(self, values, inventory):
+        """
+        Évalue la règle à partir du (type de démarrage, installé) du service.
+        """
+        start, installed = values
+        if not installed:
+            return CheckResult(Status.COMPLIANT, describe_expected(self.op, self.expected), None, "not_installed")
+        return compare_result(start, self.op, self.expected)
+
+
+def output_path(filename):
+    """
+    Chemin d'un fichier produit par le script (rapport, profil), dans le répertoire d'exécution.
+    """
+    return os.path.join(os.getcwd(), filename)
+
+
+# Champs des sorties machine, dans l'ordre des colonnes CSV
+RECORD_FIELDS = ("host", "run_id", "cis_id", "status", "expected", "observed", "duration_ms")
+
+
+def result_record(run, result):
+    """
+    Enregistrement d'un résultat au schéma des sorties machine (RECORD_FIELDS).
+    Le statut est le nom stable du Status (COMPLIANT, NON_COMPLIANT...), pas son libellé.
+    """
+    return {
+        "host": run.host,
+        "run_id": run.run_id,
+        "cis_id": result.cis_id,
+        "status": result.status.name,
+        "expected": result.expected,
+        "observed": result.observed,
+        "duration_ms": None if result.duration is None else round(result.duration * 1000, 3),
+    }
+
+
+def result_fingerprint(status, observed):
+    """
+    Empreinte d'un résultat (nom du statut et valeur relevée mise en forme) : deux exécutions
+    se comparent par empreinte, sans comparer le texte des résultats.
+    """
+    return hashlib.blake2b(f"{status}\0{format_value(observed)}".encode(), digest_size=8).hexdigest()
+
+
+def combine_fingerprint(digest, cis_id, fingerprint):
+    """
+    Ajoute l'empreinte d'un contrôle au condensé d'une exécution (OU exclusif : indépendant
+    de l'ordre d'arrivée des résultats). Deux exécutions de même condensé sont identiques.
+    """
+    return digest ^ int.from_bytes(hashlib.blake2b(f"{cis_id}\0{fingerprint}".encode(), digest_size=8).digest(), "big")
+
+
+def json_default(value):
+    """
+    Sérialisation JSON des valeurs relevées non natives (données binaires en hexadécimal).
+    """
+    return value.hex() if isinstance(value, bytes) else str(value)
+
+
+class JsonLinesSink:
+    """
+    Sortie JSON Lines : un objet par contrôle, écrit dès que le contrôle est évalué.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8", buffering=1)
+
+    def write(self, record, result):
+        self.file.write(json.dumps(record, ensure_ascii=False, default=json_default) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class CsvSink:
+    """
+    Sortie CSV : colonnes RECORD_FIELDS, valeur relevée mise en forme comme dans le rapport.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=RECORD_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, record, result):
+        self.writer.writerow({**record, "observed": format_value(record["observed"])})
+
+    def close(self):
+        self.file.close()
+
+
+class SarifSink:
+    """
+    Sortie SARIF 2.1.0 : un résultat par contrôle (kind pass/fail, niveau warning pour les
+    erreurs et délais dépassés), écrit au fil de l'eau ;
+    l'enveloppe du document est écrite à l'ouverture et refermée par close().
+    """
+    LEVELS = {
+        Status.COMPLIANT: ("pass", "none"),
+        Status.NON_COMPLIANT: ("fail", "error"),
+        Status.ERROR: ("fail", "warning"),
+        Status.TIMEOUT: ("fail", "warning"),
+    }
+
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8")
+        self.count = 0
+        self.file.write(
+            '{"$schema": "https://json.schemastore.org/sarif-2.1.0.json", "version": "2.1.0", "runs": [{'
+            '"tool": {"driver": {"name": "Win11-CIS3.0Check", '
+            '"informationUri": "https://downloads.cisecurity.org/#/"}}, "results": [\n'
+        )
+
+    def write(self, record, result):
+        kind, level = self.LEVELS.get(result.status, ("review", "none"))
+        entry = {
+            "ruleId": record["cis_id"],
+            "kind": kind,
+            "level": level,
+            "message": {"text": render_details(result)},
+            "properties": record,
+        }
+        self.file.write(("" if not self.count else ",\n") + json.dumps(entry, ensure_ascii=False, default=json_default))
+        self.count += 1
+
+    def close(self):
+        self.file.write("\n]}]}\n")
+        self.file.close()
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    catalog_version TEXT NOT NULL,
+    checks INTEGER NOT NULL,
+    compliant INTEGER NOT NULL,
+    duration_ms REAL,
+    digest TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs (run_id),
+    host TEXT NOT NULL,
+    cis_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    expected TEXT,
+    observed TEXT,
+    duration_ms REAL,
+    fingerprint TEXT
+);
+CREATE INDEX IF NOT EXISTS results_check_status ON results (cis_id, status);
+CREATE INDEX IF NOT EXISTS results_host_run ON results (host, run_id);
+CREATE INDEX IF NOT EXISTS results_run_check ON results (run_id, cis_id);
+CREATE INDEX IF NOT EXISTS runs_host_started ON runs (host, started_at);
+"""
+
+
+class SqliteSink:
+    """
+    Historique SQLite des exécutions (table runs : hôte, dates, version du catalogue, durées)
+    et des résultats par contrôle (table results). Toutes les insertions d'une sortie
+    forment une seule transaction, validée par close() ; les lignes sont insérées par lots.
+    Plusieurs exécutions (fleet-eval) peuvent partager la même sortie ; `catalog_version`
+    est la version du catalogue évalué (voir sections.catalog_version).
+    """
+    BATCH_SIZE = 1000
+
+    def __init__(self, path, catalog_version):
+        self.catalog_version = catalog_version
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SQLITE_SCHEMA)
+        # Bases créées avant l'ajout des empreintes : colonnes ajoutées à la volée
+        for table, column in (("runs", "digest"), ("results", "fingerprint")):
+            if column not in {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}:
+                self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+        self.pending = []
+        # run_id -> [hôte, début, nombre de contrôles, conformes, durée cumulée en ms, condensé]
+        self.runs = {}
+
+    def write(self, record, result):
+        now = datetime.datetime.now().isoformat(timespec="milliseconds")
+        run = self.runs.setdefault(record["run_id"], [record["host"], now, 0, 0, 0.0, 0])
+        fingerprint = result_fingerprint(record["status"], record["observed"])
+        run[2] += 1
+        run[3] += record["status"] == Status.COMPLIANT.name
+        run[4] += record["duration_ms"] or 0.0
+        run[5] = combine_fingerprint(run[5], record["cis_id"], fingerprint)
+        self.pending.append((
+            record["run_id"], record["host"], record["cis_id"], record["status"],
+            None if record["expected"] is None else str(record["expected"]),
+            json.dumps(record["observed"], ensure_ascii=False, default=json_default),
+            record["duration_ms"], fingerprint,
+        ))
+        if len(self.pending) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        self.connection.executemany(
+            "INSERT INTO results (run_id, host, cis_id, status, expected, observed, duration_ms, fingerprint) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            self.pending,
+        )
+        self.pending.clear()
+
+    def close(self):
+        self.flush()
+        finished = datetime.datetime.now().isoformat(timespec="milliseconds")
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO runs (run_id, host, started_at, finished_at, catalog_version, checks, compliant, "
+            "duration_ms, digest) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(run_id, host, started, finished, self.catalog_version, count, compliant, duration, f"{digest:016x}")
+             for run_id, (host, started, count, compliant, duration, digest) in self.runs.items()],
+        )
+        self.connection.commit()
+        self.connection.close()
+
+
+# Classe CSS de chaque statut dans le rapport HTML
+STATUS_CLASSES = {
+    Status.COMPLIANT: "compliant",
+    Status.NON_COMPLIANT: "non-compliant",
+    Status.ERROR: "error",
+    Status.TIMEOUT: "error",
+}
+
+
+class HtmlReportWriter:
+    """
+    Rapport HTML écrit au fil de l'eau, en mémoire constante quel que soit le nombre de lignes :
+    les lignes (échappées) sont écrites dans un fichier temporaire à mesure qu'elles arrivent,
+    puis recopiées après l'en-tête, qui porte les totaux, à la fermeture.
+    Avec `host_column`, chaque ligne indique son hôte (rapport consolidé d'un parc).
+    """
+
+    def __init__(self, path, subject, host_column=False):
+        self.path = path
+        self.subject = subject
+        self.host_column = host_column
+        self.total = 0
+        self.compliant = 0
+        self._rows = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._rows.close()
+
+    def write_row(self, cis_id, status, details, host=None):
+        """
+        Ajoute une ligne ; `status` est un Status ou son libellé.
+        """
+        if not isinstance(status, Status):
+            status = Status(status)
+        self.total += 1
+        if status is Status.COMPLIANT:
+            self.compliant += 1
+        host_cell = f"<td>{html.escape(str(host))}</td>" if self.host_column else ""
+        self._rows.write(f"""
+        <tr>
+            {host_cell}<td>{html.escape(str(cis_id))}</td>
+            <td class="{STATUS_CLASSES.get(status, "non-compliant")}">{html.escape(status.value)}</td>
+            <td>{html.escape(details)}</td>
+        </tr>
+        """)
+
+    def close(self):
+        """
+        Écrit le fichier final : en-tête avec les totaux, lignes recopiées par blocs, annexe.
+        """
+        current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        compliance_percentage = (self.compliant / self.total) * 100 if self.total else 0.0
+        host_header = "<th>Hôte</th>\n                " if self.host_column else ""
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Compliance Report CIS Benchmark 3.0 for Windows 11</title>
+        <style>
+            body {{ font-family: Arial, sans-serif; margin: 20px; }}
+            table {{ border-collapse: collapse; width: 100%; }}
+            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+            th {{ background-color: #f4f4f4; }}
+            tr:nth-child(even) {{ background-color: #f9f9f9; }}
+            .compliant {{ color: green; }}
+            .non-compliant {{ color: red; }}
+            .error {{ color: orange; }}
+        </style>
+    </head>
+    <body>
+        <h1>Compliance Report CIS Benchmark 3.0 for Windows 11 - {current_date} - {html.escape(self.subject)}</h1>
+        <h2>Nombre total de conformités : {self.compliant} / {self.total} points soit : {compliance_percentage:.2f}%</h2>
+        <table>
+            <tr>
+                {host_header}<th>Contrôles</th>
+                <th>Status</th>
+                <th>Details</th>
+            </tr>
+    """)
+            self._rows.seek(0)
+            shutil.copyfileobj(self._rows, file)
+            file.write(r"""
+        </table>
+        <h1>Annexe : CIS Benchmark 3.0 for Windows 11</h1>
+        <a href="https://downloads.cisecurity.org/#/" target="OPTION">Télécharger le guide CIS 3.0 Benchmark pour Windows11</a>
+    </body>
+    </html>
+    """)
+        self._rows.close()
+
+
+def generate_html_report(results):
+    """
+    Génère un fichier HTML contenant les résultats des contrôles.
+    Supprime le fichier existant avant de le recréer.
+    """
+    html_file = output_path("compliance_report.html")
+    print(f"Chemin prévu pour le rapport : {html_file}")
+
+    # Supprimer le fichier HTML existant s'il est présent
+    if os.path.exists(html_file):
+        os.remove(html_file)
+
+    with HtmlReportWriter(html_file, socket.gethostname()) as report:
+        for result in results:
+            report.write_row(result.cis_id, result.status, render_details(result))
+
+    print(f"{GREEN}Rapport généré : {os.path.abspath('compliance_report.html')}{RESET}")
+
+
+# Fichiers d'un bundle de collecte
+BUNDLE_SECEDIT = "secedit.inf"
+BUNDLE_AUDITPOL = "auditpol.csv"
+BUNDLE_REGISTRY = "registry.json"
+BUNDLE_SERVICES = "services.json"
+BUNDLE_SERVICES_REG = "services.reg"
+
+
+def bundle_host(path):
+    """
+    Nom d'hôte d'un bundle : nom du répertoire ou de l'archive, sans l'extension .zip.
+    """
+    name = os.path.basename(os.path.normpath(path))
+    return name[:-4] if name.lower().endswith(".zip") else name
+
+
+class SnapshotBundle:
+    """
+    Bundle de données collectées sur un poste (répertoire ou archive .zip), évaluable
+    hors ligne sur n'importe quel système :
+      secedit.inf   export secedit
+      auditpol.csv  export `auditpol /get /category:* /r`
+      registry.json valeurs de registre {ruche: {clé: {valeur: donnée} ou null}}
+      services.json types de démarrage {service: Start ou null si absent} (facultatif)
+      services.reg  export .reg de la clé des services, à la place de services.json (facultatif)
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def read(self, name):
+        """
+        Retourne le contenu binaire d'un fichier du bundle ; lève FileNotFoundError s'il est absent.
+        """
+        if zipfile.is_zipfile(self.path):
+            with zipfile.ZipFile(self.path) as archive:
+                try:
+                    data = archive.read(name)
+                    profile_count("bytes_read", len(data))
+                    return data
+                except KeyError:
+                    pass
+        else:
+            file_path = os.path.join(self.path, name)
+            if os.path.isfile(file_path):
+                with open(file_path, "rb") as f:
+                    data = f.read()
+                profile_count("bytes_read", len(data))
+                return data
+        raise FileNotFoundError(f"Fichier absent du bundle {self.path} : {name}")
+
+    def has(self, name):
+        try:
+            self.read(name)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def security_policy(self):
+        return parse_security_policy(decode_export(self.read(BUNDLE_SECEDIT)))
+
+    def audit_policy(self):
+        return parse_audit_policy(decode_export(self.read(BUNDLE_AUDITPOL)))
+
+    def registry_snapshot(self):
+        """
+        Cliché figé : une valeur absente du bundle est considérée comme absente du poste.
+        """
+        return RegistrySnapshot.from_dict(json.loads(decode_export(self.read(BUNDLE_REGISTRY))))
+
+    def service_inventory(self):
+        """
+        Inventaire des services : services.reg s'il est présent ; sinon les valeurs Start des clés
+        de services de registry.json (bundles antérieurs), complétées ou remplacées par services.json.
+        """
+        if self.has(BUNDLE_SERVICES_REG):
+            return ServiceInventory.from_reg_export(decode_export(self.read(BUNDLE_SERVICES_REG)))
+        prefix = SERVICES_KEY.lower() + "\\"
+        # Service en minuscules -> (service, type de démarrage ou None si la clé du service est absente)
+        starts = {}
+        if self.has(BUNDLE_REGISTRY):
+            paths = json.loads(decode_export(self.read(BUNDLE_REGISTRY))).get(HKLM, {})
+            for path, values in paths.items():
+                service = path[len(prefix):]
+                if path.lower().startswith(prefix) and "\\" not in service:
+                    starts[service.lower()] = service, next((value for name, value in (values or {}).items()
+                                                             if name.lower() == "start"), None)
+        if self.has(BUNDLE_SERVICES):
+            starts.update((service.lower(), (service, start))
+                          for service, start in json.loads(decode_export(self.read(BUNDLE_SERVICES))).items())
+        elif not starts:
+            raise FileNotFoundError(f"Fichier absent du bundle {self.path} : {BUNDLE_SERVICES}")
+        return ServiceInventory.from_dict(dict(starts.values()))
+
+
+def write_bundle(path, run, verbose=True):
+    """
+    Enregistre les données collectées par une exécution dans un bundle
+    (archive .zip si le chemin se termine par .zip, répertoire sinon). Les sources
+    non collectées (analyse d'une sélection de contrôles) ne sont pas enregistrées.
+    """
+    serializers = {
+        BUNDLE_SECEDIT: ("secedit", format_security_policy),
+        BUNDLE_AUDITPOL: ("auditpol", format_audit_policy),
+        BUNDLE_REGISTRY: ("registry", lambda snapshot: json.dumps(snapshot.to_dict(), indent=1, ensure_ascii=False)),
+        BUNDLE_SERVICES: ("services", lambda inventory: json.dumps(inventory.to_dict(), indent=1, ensure_ascii=False)),
+    }
+    files = {}
+    for name, (source, serialize) in serializers.items():
+        if source not in run.sources:
+            continue
+        try:
+            files[name] = serialize(run.source(source))
+        except Exception as e:
+            print(f"{ORANGE}{name} non enregistré dans le bundle : {e}{RESET}")
+    if path.lower().endswith(".zip"):
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, content in files.items():
+                archive.writestr(name, content)
+    else:
+        os.makedirs(path, exist_ok=True)
+        for name, content in files.items():
+            with open(os.path.join(path, name), "w", encoding="utf-8") as f:
+                f.write(content)
+    if verbose:
+        print(f"{GREEN}Bundle de collecte enregistré : {os.path.abspath(path)}{RESET}")
+
+
+class ScanState:
+    """
+    État conservé entre deux exécutions (--state) pour les analyses incrémentales :
+    cliché de registre avec les dates de dernière modification des clés, et résultats
+    des règles du catalogue avec l'empreinte de la donnée lue (RegistryRule.stamp).
+    Une règle dont la donnée est inchangée dans son propre collecteur (date de dernière
+    modification de la clé, type de démarrage du service) et dont la définition est
+    inchangée reprend son résultat précédent.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.snapshot = None
+        self.results = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.snapshot = RegistrySnapshot.from_dict(data.get("registry", {}))
+            self.results = data.get("results", {})
+
+    @staticmethod
+    def _fingerprint(rule):
+        return json.dumps([rule.hive, rule.path, rule.name, rule.op, rule.expected, rule.missing_ok])
+
+    def reuse(self, rules, sources):
+        """
+        Sépare les règles en (résultats repris {identifiant CIS: CheckResult}, règles à réévaluer).
+        `sources` : données des collecteurs lus par les règles {collecteur: données} ; les règles
+        d'un collecteur absent (collecte en échec) sont réévaluées.
+        """
+        reused, remaining = {}, []
+        for rule in rules:
+            entry = self.results.get(rule.cis_id)
+            data = sources.get(rule.collector)
+            stamp = None if data is None else rule.stamp(data)
+            if (entry is not None and stamp is not None
+                    and entry["rule"] == self._fingerprint(rule)
+                    and entry.get("stamp") == stamp):
+                reused[rule.cis_id] = CheckResult(Status[entry["status"]], entry["expected"], entry["observed"],
+                                                  entry["message_key"], rule.cis_id, rule.title)
+            else:
+                remaining.append(rule)
+        return reused, remaining
+
+    def save(self, run):
+        """
+        Enregistre le cliché de registre et les résultats des règles de l'exécution. Seules les
+        données déjà collectées sont lues : le cliché et les résultats des règles que l'exécution
+        n'a pas évaluées (sélection de contrôles) sont conservés de l'état précédent.
+        """
+        results = dict(self.results)
+        for check in run.checks:
+            if not isinstance(check, RegistryRule) or check.cis_id not in run.results:
+                continue
+            data = run.sources.get(check.collector)
+            if data is None or isinstance(data, Exception):
+                results.pop(check.cis_id, None)
+                continue
+            result = run.results[check.cis_id]
+            results[check.cis_id] = {
+                "rule": self._fingerprint(check),
+                "stamp": check.stamp(data),
+                "status": result.status.name,
+                "expected": result.expected,
+                "observed": result.observed,
+                "message_key": result.message_key,
+            }
+        snapshot = run.sources.get("registry")
+        if snapshot is None or isinstance(snapshot, Exception):
+            snapshot = self.snapshot or RegistrySnapshot()
+        with open(self.path, "w", encoding="utf-8") as f:
+            # Les données binaires sont enregistrées en hexadécimal, comme dans les bundles
+            json.dump({"registry": snapshot.to_dict(), "results": results}, f, ensure_ascii=False,
+                      default=lambda value: value.hex() if isinstance(value, bytes) else str(value))
+        print(f"{GREEN}État enregistré : {os.path.abspath(self.path)}{RESET}")
+
+
+async def collect_security_policy(run):
+    """
+    Politique de sécurité : lue depuis le bundle, le fichier INF fourni ou un export secedit.
+    """
+    if run.bundle:
+        return run.bundle.security_policy()
+    return await load_security_policy(run.secedit_inf, run.commands, run.cache)
+
+
+async def collect_audit_policy(run):
+    """
+    Politique d'audit : lue depuis le bundle, le CSV fourni ou auditpol.
+    """
+    if run.bundle:
+        return run.bundle.audit_policy()
+    return await load_audit_policy(run.auditpol_csv, run.commands, run.cache)
+
+
+def export_services():
+    """
+    Inventaire des services du registre local, au format de services.json (contenu mis en cache).
+    """
+    data = json.dumps(ServiceInventory.from_registry().to_dict()).encode()
+    profile_count("bytes_read", len(data))
+    return data
+
+
+async def collect_services(run):
+    """
+    Inventaire des services : lu depuis le bundle, l'export .reg fourni ou par une énumération
+    de la clé des services (sur un thread, avec le cache de collecte comme secedit et auditpol).
+    """
+    if run.bundle:
+        return run.bundle.service_inventory()
+    if run.services_reg:
+        with open(run.services_reg, "rb") as f:
+            data = f.read()
+        profile_count("bytes_read", len(data))
+        return ServiceInventory.from_reg_export(decode_export(data))
+    data = await run.cache.fetch("services", lambda: asyncio.get_running_loop().run_in_executor(None, export_services))
+    return ServiceInventory.from_dict(json.loads(data))
+
+
+# Collecteurs de données : nom -> fonction de collecte (reçoit l'exécution en cours).
+# Les collecteurs asynchrones attendent des commandes externes ; les autres s'exécutent
+# sur un thread pour que leurs lectures se recouvrent avec ces commandes.
+COLLECTORS = {
+    "secedit": collect_security_policy,
+    "auditpol": collect_audit_policy,
+    "registry": lambda run: collect_registry(run),
+    "services": collect_services,
+}
+
+
+def collect_registry(run):
+    """
+    Cliché de registre : fourni par l'appelant, lu depuis le bundle ou construit depuis le registre local.
+    """
+    if run.registry_snapshot is not None:
+        return run.registry_snapshot
+    if run.bundle:
+        return run.bundle.registry_snapshot()
+    return RegistrySnapshot.from_registry(run.plan.registry_triples(), run.state.snapshot if run.state else None)
+
+
+class CollectionPlan:
+    """
+    Plan de collecte minimal d'une liste de contrôles, construit à partir des données qu'ils
+    déclarent (compliance_check, RegistryRule.requires) : les dépendances sont dédoublonnées,
+    les valeurs de registre regroupées par clé (une ouverture par clé) et les types de démarrage
+    des services lus dans l'inventaire des services (une énumération). Seuls les collecteurs
+    nécessaires sont exécutés, une seule fois, avant l'évaluation.
+    """
+
+    def __init__(self, check_list):
+        self.checks = len(check_list)
+        self.declared = 0
+        # (section, clé) -> identifiants des contrôles qui la lisent
+        self.secedit = {}
+        # sous-catégorie -> identifiants
+        self.auditpol = {}
+        # (ruche, chemin en minuscules) -> (ruche, chemin, {valeur en minuscules: valeur})
+        self.registry = {}
+        # service -> identifiants
+        self.services = {}
+        for check in check_list:
+            for dependency in check.requires:
+                self.add(check.cis_id, dependency)
+
+    def add(self, cis_id, dependency):
+        """
+        Ajoute une dépendance déclarée par un contrôle.
+        """
+        kind, *target = dependency
+        self.declared += 1
+        if kind == "secedit":
+            self.secedit.setdefault(tuple(target), []).append(cis_id)
+        elif kind == "auditpol":
+            self.auditpol.setdefault(target[0], []).append(cis_id)
+        elif kind == "registry":
+            self._add_registry_value(*target)
+        elif kind == "service":
+            self.services.setdefault(target[0], []).append(cis_id)
+        else:
+            raise ValueError(f"Dépendance inconnue pour {cis_id} : {dependency!r}")
+
+    def _add_registry_value(self, hive, path, name):
+        key = self.registry.setdefault(RegistrySnapshot._key_id(hive, path), (hive, path, {}))
+        key[2].setdefault(name.lower(), name)
+
+    @property
+    def sources(self):
+        """
+        Collecteurs à exécuter, dans l'ordre de COLLECTORS.
+        """
+        needed = {"secedit": self.secedit, "auditpol": self.auditpol, "registry": self.registry,
+                  "services": self.services}
+        return [name for name in COLLECTORS if needed.get(name)]
+
+    def registry_triples(self):
+        """
+        Triplets (ruche, clé, valeur) du cliché de registre, regroupés par clé.
+        """
+        return [(hive, path, name) for hive, path, names in self.registry.values() for name in names.values()]
+
+    def reads(self):
+        return (len(self.secedit) + len(self.auditpol) + len(self.services)
+                + sum(len(names) for _, _, names in self.registry.values()))
+
+    def print_summary(self):
+        """
+        Affiche le plan (--explain-plan) : collecteurs exécutés et données lues par chacun.
+        """
+        print(f"{ORANGE}Plan de collecte : {self.checks} contrôles, {self.declared} dépendances déclarées, "
+              f"{self.reads()} lectures après dédoublonnage{RESET}")
+        if self.secedit:
+            print(f"  secedit : 1 export, {len(self.secedit)} entrées")
+            for (section, key), cis_ids in sorted(self.secedit.items()):
+                print(f"    [{section}] {key}  ({', '.join(cis_ids)})")
+        if self.auditpol:
+            print(f"  auditpol : 1 appel, {len(self.auditpol)} sous-catégories")
+            for subcategory, cis_ids in self.auditpol.items():
+                print(f"    {subcategory}  ({', '.join(cis_ids)})")
+        if self.registry:
+            values = sum(len(names) for _, _, names in self.registry.values())
+            print(f"  registry : {len(self.registry)} clés ouvertes, {values} valeurs")
+            for hive, path, names in self.registry.values():
+                print(f"    {hive}\\{path} : {', '.join(names.values())}")
+        if self.services:
+            print(f"  services : 1 énumération de la clé des services, {len(self.services)} types de démarrage")
+            for service, cis_ids in self.services.items():
+                print(f"    {service}  ({', '.join(cis_ids)})")
+        if not self.sources:
+            print("  aucun collecteur")
+
+
+# Exécution en cours, utilisée par les contrôles pour accéder aux données collectées
+_current_run = None
+
+
+class ScanRun:
+    """
+    Exécution d'un scan en trois phases : collecte -> évaluation -> rapport.
+    Chaque collecteur et chaque contrôle est mémorisé par identifiant et ne s'exécute
+    qu'une seule fois par exécution.
+    """
+
+    def __init__(self, checks, secedit_inf=None, auditpol_csv=None, registry_snapshot=None, workers=1,
+                 bundle=None, profile=False, commands=None, state=None, cache=None, sinks=(), accounts=None,
+                 services_reg=None):
+        self.checks = checks
+        # Données lues par les contrôles, dédoublonnées et regroupées par collecteur
+        self.plan = CollectionPlan(checks)
+        self.workers = workers
+        self.secedit_inf = secedit_inf
+        self.auditpol_csv = auditpol_csv
+        self.services_reg = services_reg
+        self.registry_snapshot = registry_snapshot
+        # Bundle de collecte (SnapshotBundle) : évaluation hors ligne, sans accès au système local
+        self.bundle = bundle
+        # Identification des résultats dans les sorties machine
+        self.run_id = uuid.uuid4().hex
+        self.host = bundle_host(bundle.path) if bundle else socket.gethostname()
+        # Sorties au fil de l'eau (JsonLinesSink, CsvSink, SarifSink), fermées par l'appelant
+        self.sinks = list(sinks)
+        # Commandes externes : concurrence maximale et délai par commande
+        self.commands = commands or CommandRunner()
+        # Cache disque des sorties brutes des collecteurs (désactivé par défaut)
+        self.cache = cache or CollectorCache()
+        # État de l'exécution précédente (ScanState) : analyse incrémentale
+        self.state = state
+        self.reused = 0
+        # Droits utilisateur (privilège -> SID), analysés depuis secedit à la première demande,
+        # et traductions SID <-> nom de compte (partagées par le processus par défaut)
+        self._user_rights = None
+        self.accounts = accounts or ACCOUNT_NAMES
+        # Worker PowerShell partagé par les contrôles, démarré à la première requête
+        self._powershell = None
+        self._powershell_lock = threading.Lock()
+        # Mesures de --profile (None sans profilage)
+        self.profiler = Profiler() if profile else None
+        # Mémo de l'exécution : collecteur -> données (ou exception), contrôle -> résultat
+        self.sources = {}
+        self.results = {}
+        # Un verrou par collecteur : une collecte à la demande n'est lancée qu'une fois,
+        # même si plusieurs workers la demandent en même temps
+        self._source_locks = {name: threading.Lock() for name in COLLECTORS}
+
+    def source(self, name):
+        """
+        Retourne les données d'un collecteur ; la collecte (ou son échec) est mémorisée.
+        Les appels concurrents d'un même collecteur attendent la première collecte.
+        """
+        if name not in self.sources:
+            with self._source_locks[name]:
+                if name not in self.sources:
+                    asyncio.run(self._collect(name))
+        data = self.sources[name]
+        if isinstance(data, Exception):
+            raise data
+        return data
+
+    async def _collect(self, name):
+        collector = COLLECTORS[name]
+        # Temps réel seulement : les collecteurs se recouvrent (voir Profiler)
+        with self.profiler.measure("collector", name, clock=None) if self.profiler else contextlib.nullcontext():
+            try:
+                if asyncio.iscoroutinefunction(collector):
+                    self.sources[name] = await collector(self)
+                else:
+                    self.sources[name] = await asyncio.get_running_loop().run_in_executor(None, collector, self)
+            except Exception as e:
+                self.sources[name] = e
+
+    async def _collect_all(self, names):
+        await asyncio.gather(*(self._collect(name) for name in names))
+
+    def user_rights(self):
+        """
+        Attribution des droits utilisateur de l'exécution, analysée une seule fois depuis l'export secedit
+        (SID et noms inconnus traduits en un seul lot par le cache de traduction).
+        """
+        if self._user_rights is None:
+            policy = self.source("secedit")
+            # Les comptes inconnus de l'export sont traduits en un seul lot, sur le poste audité uniquement
+            live = self.bundle is None and os.name == "nt"
+            accounts = {account for holders in user_right_holders(policy).values() for account in holders}
+            self.accounts.resolve(accounts, (lambda command: self.powershell().request(command)) if live else None)
+            self._user_rights = parse_user_rights(policy, self.accounts)
+        return self._user_rights
+
+    def powershell(self):
+        """
+        Worker PowerShell de l'exécution (démarré à la première requête, arrêté en fin d'exécution).
+        """
+        with self._powershell_lock:
+            if self._powershell is None:
+                self._powershell = PowerShellWorker(timeout=self.commands.timeout)
+            return self._powershell
+
+    def collect(self):
+        """
+        Phase de collecte : exécute chaque collecteur une fois, en parallèle (les commandes
+        externes se recouvrent avec la lecture du registre). Les échecs, dont les délais
+        dépassés, sont reportés par les contrôles qui dépendent du collecteur concerné.
+        Seuls les collecteurs du plan de collecte (données déclarées par les contrôles) sont lancés.
+        """
+        names = [name for name in self.plan.sources if name not in self.sources]
+        if names:
+            asyncio.run(self._collect_all(names))
+
+    def evaluate(self):
+        """
+        Phase d'évaluation : exécute chaque contrôle une fois. Avec plusieurs workers,
+        les contrôles s'exécutent sur un pool de threads ; les résultats conservent
+        l'ordre de la liste des contrôles. Les contrôles lisent les données de cette
+        exécution (current_run), y compris lorsque la phase est appelée hors de run().
+        """
+        global _current_run
+        previous_run, _current_run = _current_run, self
+        try:
+            return self._evaluate()
+        finally:
+            _current_run = previous_run
+
+    def _evaluate(self):
+        pending = {}
+        for check in self.checks:
+            check_id = check.cis_id
+            if check_id not in self.results and check_id not in pending:
+                pending[check_id] = check
+
+        # Les règles du catalogue sont évaluées en un seul passage, regroupées par clé ; en incrémental,
+        # celles dont la donnée n'a pas changé dans leur collecteur reprennent leur résultat
+        rules = [check for check in pending.values() if isinstance(check, RegistryRule)]
+        outcomes = {}
+        if self.state is not None and rules:
+            sources = {}
+            for name in {rule.collector for rule in rules}:
+                try:
+                    sources[name] = self.source(name)
+                except Exception:
+                    pass
+            outcomes, rules = self.state.reuse(rules, sources)
+            self.reused += len(outcomes)
+            for result in outcomes.values():
+                self.emit(result)
+        outcomes.update(evaluate_registry_rules(rules, self.emit))
+        functions = [check for check in pending.values() if not isinstance(check, RegistryRule)]
+        if self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(check): check for check in functions}
+                for future in as_completed(futures):
+                    outcomes[futures[future].cis_id] = result = future.result()
+                    self.emit(result)
+        else:
+            for check in functions:
+                outcomes[check.cis_id] = result = check()
+                self.emit(result)
+
+        # Résultats dans l'ordre de la liste des contrôles
+        for check_id in pending:
+            self.results[check_id] = outcomes[check_id]
+        return list(self.results.values())
+
+    def emit(self, result):
+        """
+        Transmet un résultat aux sorties au fil de l'eau (--jsonl, --csv, --sarif) dès qu'il est connu.
+        """
+        if self.sinks:
+            record = result_record(self, result)
+            for sink in self.sinks:
+                sink.write(record, result)
+
+    def report(self):
+        """
+        Phase de rapport : génère le rapport HTML.
+        """
+        generate_html_report(list(self.results.values()))
+
+    def run(self, report=True):
+        global _current_run
+        previous_run, _current_run = _current_run, self
+        try:
+            for phase in ("collect", "evaluate", "report") if report else ("collect", "evaluate"):
+                # Temps CPU du processus : une phase s'étend sur plusieurs threads
+                with (self.profiler.measure("phase", phase, clock=time.process_time) if self.profiler
+                      else contextlib.nullcontext()):
+                    getattr(self, phase)()
+        finally:
+            _current_run = previous_run
+            if self._powershell is not None:
+                self._powershell.close()
+        return list(self.results.values())
+
+
+def current_run():
+    """
+    Retourne l'exécution en cours (une exécution par défaut, sur tout le catalogue,
+    est créée pour un appel direct d'un contrôle).
+    """
+    global _current_run
+    if _current_run is None:
+        from .sections import load_checks
+        _current_run = ScanRun(load_checks())
+    return _current_run
+
+
+def peak_rss():
+    """
+    Pic de mémoire résidente du processus courant, en octets (None si indisponible).
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss est en kilo-octets sous Linux, en octets sous macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+    return None
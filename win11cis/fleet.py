@@ -0,0 +1,82 @@
+"""
+Évaluation d'un parc de postes (fleet-eval) : un bundle de collecte par hôte, sur un pool de processus.
+"""
+import os
+import contextlib
+import multiprocessing
+import time
+
+from .core import (
+    error_result, GREEN, HtmlReportWriter, JsonLinesSink, peak_rss, render_details, RESET, result_record, ScanRun,
+    SnapshotBundle, SqliteSink, Status,
+)
+from .sections import catalog_version, load_checks
+
+
+def iter_bundles(directory):
+    """
+    Parcourt les bundles d'un répertoire (sous-répertoires et archives .zip) sans les lister en mémoire.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir() or entry.name.lower().endswith(".zip"):
+                yield entry.path
+
+
+def evaluate_bundle(path):
+    """
+    Tâche d'un worker de fleet-eval : évalue un bundle et retourne ses résultats
+    ([(enregistrement result_record, détails), ...], pid, pic mémoire) : même schéma que les
+    sorties d'une analyse locale (RECORD_FIELDS), l'hôte étant le nom du bundle. Les modules
+    de section sont importés une seule fois par processus, au premier bundle évalué.
+    """
+    run = ScanRun(load_checks(), bundle=SnapshotBundle(path))
+    try:
+        rows = [(result_record(run, result), render_details(result)) for result in run.run(report=False)]
+    except Exception as e:
+        result = error_result(e)
+        result.cis_id = ""
+        rows = [(result_record(run, result), str(e))]
+    return rows, os.getpid(), peak_rss()
+
+
+def fleet_eval(directory, output, processes=None, chunksize=8, html_output=None, sqlite_output=None):
+    """
+    Évalue tous les bundles d'un répertoire sur un pool de processus (un hôte par tâche).
+    Les résultats sont écrits au fil de l'eau en JSON Lines (une ligne par contrôle et par hôte,
+    au schéma des sorties d'une analyse locale : RECORD_FIELDS, une exécution run_id par hôte),
+    dans un rapport HTML consolidé si `html_output` est fourni et dans une base SQLite
+    (une exécution par hôte) si `sqlite_output` est fourni, sans être conservés en mémoire.
+    Affiche le débit (hôtes/s) et le pic mémoire de chaque worker.
+    """
+    started = time.perf_counter()
+    hosts = 0
+    worker_peaks = {}
+    with contextlib.ExitStack() as stack:
+        out = JsonLinesSink(output)
+        stack.callback(out.close)
+        report = stack.enter_context(HtmlReportWriter(html_output, "", host_column=True)) if html_output else None
+        store = None
+        if sqlite_output:
+            store = SqliteSink(sqlite_output, catalog_version(load_checks()))
+            stack.callback(store.close)
+        pool = stack.enter_context(multiprocessing.Pool(processes))
+        for rows, pid, peak in pool.imap_unordered(evaluate_bundle, iter_bundles(directory), chunksize):
+            for record, details in rows:
+                if report:
+                    report.write_row(record["cis_id"], Status[record["status"]], details, record["host"])
+                if store:
+                    store.write(record, None)
+                out.write(record, None)
+            hosts += 1
+            worker_peaks[pid] = max(worker_peaks.get(pid) or 0, peak or 0)
+        if report:
+            report.subject = f"{hosts} hôtes"
+
+    elapsed = time.perf_counter() - started
+    rate = hosts / elapsed if elapsed else 0.0
+    print(f"{GREEN}{hosts} hôtes évalués en {elapsed:.1f} s ({rate:.1f} hôtes/s) : {os.path.abspath(output)}{RESET}")
+    if html_output:
+        print(f"{GREEN}Rapport consolidé : {os.path.abspath(html_output)}{RESET}")
+    for pid, peak in sorted(worker_peaks.items()):
+        print(f"  worker {pid} : pic mémoire {peak / (1024 * 1024):.1f} Mo" if peak else f"  worker {pid} : pic mémoire indisponible")
@@ -0,0 +1,188 @@
+"""
+Historique SQLite des exécutions et comparaison (diff) de deux exécutions ou de deux bundles.
+"""
+import json
+import sqlite3
+
+from .core import format_value, GREEN, ORANGE, RED, RESET, result_fingerprint, ScanRun, SnapshotBundle, Status
+from .sections import load_checks
+
+
+def print_check_history(database, cis_id, host=None):
+    """
+    Historique d'un contrôle par hôte et date de début de l'échec en cours
+    (« depuis quand 2.3.7.4 échoue sur ce poste »).
+    """
+    connection = sqlite3.connect(database)
+    query = ("SELECT runs.host, runs.started_at, results.status FROM results "
+             "JOIN runs ON runs.run_id = results.run_id WHERE results.cis_id = ?")
+    parameters = [cis_id]
+    if host:
+        query += " AND results.host = ?"
+        parameters.append(host)
+    history = {}
+    for row_host, started_at, status in connection.execute(query + " ORDER BY runs.host, runs.started_at", parameters):
+        history.setdefault(row_host, []).append((started_at, status))
+    connection.close()
+
+    if not history:
+        print(f"{ORANGE}Aucun résultat enregistré pour {cis_id}{RESET}")
+    for row_host, entries in history.items():
+        print(f"{row_host} :")
+        for started_at, status in entries:
+            print(f"  {started_at}  {Status[status].value}")
+        failing_since = None
+        for started_at, status in entries:
+            if status == Status.COMPLIANT.name:
+                failing_since = None
+            elif failing_since is None:
+                failing_since = started_at
+        if failing_since:
+            print(f"  {RED}{cis_id} en échec depuis {failing_since}{RESET}")
+        else:
+            print(f"  {GREEN}{cis_id} conforme lors de la dernière exécution{RESET}")
+
+
+def print_failing_hosts(database, prefix):
+    """
+    Hôtes dont la dernière exécution échoue sur les contrôles commençant par `prefix`
+    (« tous les hôtes en échec sur 18.10.92.x »).
+    """
+    connection = sqlite3.connect(database)
+    rows = connection.execute(
+        "SELECT results.host, results.cis_id, results.status FROM results "
+        "JOIN (SELECT host, MAX(started_at) AS started_at FROM runs GROUP BY host) AS latest "
+        "ON latest.host = results.host "
+        "JOIN runs ON runs.run_id = results.run_id AND runs.started_at = latest.started_at "
+        # Plage de l'index (cis_id, status) plutôt qu'un LIKE
+        "WHERE results.cis_id >= ? AND results.cis_id < ? AND results.status != ? "
+        "ORDER BY results.host, results.cis_id",
+        (prefix, prefix + "\uffff", Status.COMPLIANT.name),
+    ).fetchall()
+    connection.close()
+    failing = {}
+    for host, cis_id, status in rows:
+        failing.setdefault(host, []).append(f"{cis_id} ({Status[status].value})")
+    for host, entries in failing.items():
+        print(f"{host} : {', '.join(entries)}")
+    print(f"{ORANGE}{len(failing)} hôtes en échec sur {prefix}*{RESET}")
+
+
+def resolve_run(connection, reference):
+    """
+    Exécution enregistrée désignée par son identifiant ou un préfixe non ambigu :
+    (run_id, hôte, début, condensé).
+    """
+    rows = connection.execute(
+        "SELECT run_id, host, started_at, digest FROM runs WHERE run_id >= ? AND run_id < ?",
+        (reference, reference + "\uffff"),
+    ).fetchall()
+    if len(rows) != 1:
+        raise ValueError(f"{'Aucune' if not rows else 'Plusieurs'} exécution(s) pour l'identifiant {reference}")
+    return rows[0]
+
+
+def stored_run_diff(database, references=(), host=None):
+    """
+    Compare deux exécutions enregistrées (identifiants, ou les deux dernières de `host`).
+    Retourne (libellé avant, libellé après, changements) ; voir fingerprint_diff.
+    """
+    connection = sqlite3.connect(database)
+    try:
+        if references:
+            before, after = (resolve_run(connection, reference) for reference in references)
+        else:
+            latest = connection.execute(
+                "SELECT run_id, host, started_at, digest FROM runs WHERE host = ? ORDER BY started_at DESC LIMIT 2",
+                (host,),
+            ).fetchall()
+            if len(latest) < 2:
+                raise ValueError(f"Moins de deux exécutions enregistrées pour {host}")
+            after, before = latest
+        labels = [f"{run[1]} {run[2]} ({run[0][:8]})" for run in (before, after)]
+        # Condensés identiques : aucune différence, sans lire les résultats
+        if before[3] is not None and before[3] == after[3]:
+            return labels[0], labels[1], []
+
+        # Comparaison dans SQLite : seuls les résultats modifiés, ajoutés ou supprimés sont lus.
+        # Une empreinte absente (résultats enregistrés avant l'ajout des empreintes) est
+        # recalculée pour les seuls contrôles candidats.
+        modified = connection.execute(
+            "SELECT a.cis_id, a.status, a.observed, a.fingerprint, b.status, b.observed, b.fingerprint "
+            "FROM results a JOIN results b ON b.run_id = ? AND b.cis_id = a.cis_id AND b.host = ? "
+            "WHERE a.run_id = ? AND a.host = ? "
+            "AND (a.fingerprint IS NOT b.fingerprint OR a.fingerprint IS NULL)",
+            (after[0], after[1], before[0], before[1]),
+        )
+        changes = {}
+        for cis_id, old_status, old_observed, old_fingerprint, new_status, new_observed, new_fingerprint in modified:
+            old = (old_status, json.loads(old_observed) if old_observed else None)
+            new = (new_status, json.loads(new_observed) if new_observed else None)
+            if (old_fingerprint or result_fingerprint(*old)) != (new_fingerprint or result_fingerprint(*new)):
+                changes[cis_id] = (old, new)
+        # Contrôles présents dans une seule des deux exécutions
+        for run, other, side in ((before, after, 0), (after, before, 1)):
+            for cis_id, status, observed in connection.execute(
+                    "SELECT a.cis_id, a.status, a.observed FROM results a WHERE a.run_id = ? AND a.host = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM results b WHERE b.run_id = ? AND b.cis_id = a.cis_id "
+                    "AND b.host = ?)", (run[0], run[1], other[0], other[1])):
+                entry = (status, json.loads(observed) if observed else None)
+                changes[cis_id] = (entry, None) if side == 0 else (None, entry)
+        return labels[0], labels[1], [(cis_id, *changes[cis_id]) for cis_id in sorted(changes, key=cis_order)]
+    finally:
+        connection.close()
+
+
+def bundle_diff(before_path, after_path):
+    """
+    Compare deux bundles de collecte, évalués hors ligne.
+    Retourne (libellé avant, libellé après, changements) ; voir fingerprint_diff.
+    """
+    check_list = load_checks()
+    evaluated = []
+    for path in (before_path, after_path):
+        results = ScanRun(check_list, bundle=SnapshotBundle(path)).run(report=False)
+        evaluated.append({r.cis_id: (r.status.name, r.observed) for r in results})
+    before, after = evaluated
+    changed = changed_fingerprints(
+        {cis_id: result_fingerprint(*entry) for cis_id, entry in before.items()},
+        {cis_id: result_fingerprint(*entry) for cis_id, entry in after.items()},
+    )
+    return before_path, after_path, [(cis_id, before.get(cis_id), after.get(cis_id)) for cis_id in changed]
+
+
+def changed_fingerprints(before, after):
+    """
+    Identifiants CIS dont l'empreinte diffère entre deux exécutions {identifiant: empreinte},
+    y compris les contrôles présents d'un seul côté, dans l'ordre du référentiel.
+    """
+    changed = {cis_id for cis_id, fingerprint in after.items() if before.get(cis_id) != fingerprint}
+    changed.update(cis_id for cis_id in before if cis_id not in after)
+    return sorted(changed, key=cis_order)
+
+
+def cis_order(cis_id):
+    """
+    Clé de tri d'un identifiant CIS dans l'ordre du référentiel (identifiant vide ou invalide toléré).
+    """
+    return tuple(int(part) if part.isdigit() else 0 for part in cis_id.split("."))
+
+
+def print_drift(before_label, after_label, changes):
+    """
+    Affiche les contrôles dont le statut ou la valeur relevée a changé.
+    """
+    print(f"{ORANGE}Différences entre {before_label} et {after_label} :{RESET}")
+    flipped = 0
+    for cis_id, before, after in changes:
+        def describe(entry):
+            if entry is None:
+                return "absent"
+            return f"{Status[entry[0]].value} ({format_value(entry[1])})"
+        if before is None or after is None or before[0] != after[0]:
+            flipped += 1
+            colour = GREEN if after is not None and after[0] == Status.COMPLIANT.name else RED
+        else:
+            colour = ORANGE
+        print(f"  {colour}{cis_id}{RESET} : {describe(before)} -> {describe(after)}")
+    print(f"{len(changes)} contrôles modifiés, dont {flipped} changements de statut")
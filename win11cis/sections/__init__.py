@@ -0,0 +1,137 @@
+"""
+Catalogue des contrôles, réparti en un module par section du référentiel CIS.
+Les modules de section ne sont importés qu'à la demande, lorsqu'une section sélectionnée
+en a besoin : l'aide de la ligne de commande et les sous-commandes qui n'évaluent
+aucun contrôle ne chargent aucun d'entre eux.
+"""
+import fnmatch
+import hashlib
+import importlib
+import time
+
+from ..core import RegistryRule, ScanState
+
+
+# Section CIS (premier composant de l'identifiant) -> module qui la définit
+SECTIONS = {
+    "1": "accounts",
+    "2": "local_policies",
+    "5": "services",
+    "9": "firewall",
+    "17": "audit",
+    "18": "admin_templates",
+    "19": "admin_templates",
+}
+
+# Niveau de profil demandé -> niveaux des contrôles retenus (le profil L2 inclut le profil L1)
+LEVELS = {"L1": ("L1",), "L2": ("L1", "L2"), "BL": ("BL",)}
+
+# Version du référentiel CIS couvert par le catalogue
+CIS_BENCHMARK_VERSION = "3.0.0"
+
+# Durée d'import de chaque module de section chargé : module -> (temps réel, temps CPU) en secondes
+IMPORT_TIMINGS = {}
+
+
+def cis_sort_key(check):
+    """
+    Clé de tri dans l'ordre du référentiel CIS (1.2.10 après 1.2.9).
+    """
+    return tuple(int(part) for part in check.cis_id.split("."))
+
+
+def load_section_module(name):
+    """
+    Importe un module de section (une seule fois par processus) et mesure la durée de son import.
+    """
+    qualified = f"{__name__}.{name}"
+    if name not in IMPORT_TIMINGS:
+        wall, cpu = time.perf_counter(), time.process_time()
+        importlib.import_module(qualified)
+        IMPORT_TIMINGS[name] = (time.perf_counter() - wall, time.process_time() - cpu)
+    return importlib.import_module(qualified)
+
+
+def load_checks(sections=None):
+    """
+    Contrôles des sections demandées (toutes par défaut), dans l'ordre du référentiel :
+    fonctions et règles du catalogue. Seuls les modules des sections demandées sont importés.
+    """
+    sections = list(SECTIONS) if sections is None else sections
+    unknown = [section for section in sections if section not in SECTIONS]
+    if unknown:
+        raise ValueError(f"Section(s) inconnue(s) : {', '.join(unknown)} (sections : {', '.join(SECTIONS)})")
+    selected = []
+    for name in dict.fromkeys(SECTIONS[section] for section in sections):
+        module = load_section_module(name)
+        selected.extend(
+            check for check in module.CHECK_FUNCTIONS + module.REGISTRY_RULES
+            if check.cis_id.split(".")[0] in sections
+        )
+    return sorted(selected, key=cis_sort_key)
+
+
+def pattern_sections(pattern):
+    """
+    Sections pouvant contenir les contrôles d'un motif d'identifiants (toutes si la section est un joker).
+    """
+    section = pattern.split(".")[0]
+    if any(char in section for char in "*?["):
+        return [name for name in SECTIONS if fnmatch.fnmatchcase(name, section)]
+    return [section] if section in SECTIONS else []
+
+
+def match_pattern(index, pattern):
+    """
+    Identifiants de l'index correspondant à un motif : identifiant exact, motif glob (9.*, 2.3.1?.*)
+    ou préfixe de groupe (2.3.10 sélectionne 2.3.10.1, 2.3.10.2...).
+    """
+    matched = [pattern] if pattern in index else []
+    return matched + [cis_id for cis_id in index
+                      if cis_id != pattern and (fnmatch.fnmatchcase(cis_id, pattern)
+                                                or fnmatch.fnmatchcase(cis_id, pattern + ".*"))]
+
+
+def select_checks(sections=None, only=None, skip=None, levels=None):
+    """
+    Contrôles sélectionnés, dans l'ordre du référentiel : sections demandées (toutes par défaut),
+    restreintes aux motifs `only`, privées des motifs `skip` et limitées aux niveaux de profil `levels`
+    (voir LEVELS). Les motifs sont résolus sur un index identifiant CIS -> contrôle, construit
+    sur les seules sections concernées : seuls leurs modules sont importés.
+    """
+    sections = list(SECTIONS) if sections is None else sections
+    if only:
+        wanted = {section for pattern in only for section in pattern_sections(pattern)}
+        sections = [section for section in sections if section in wanted]
+    index = {check.cis_id: check for check in load_checks(sections)}
+    if only:
+        selected = {}
+        for pattern in only:
+            matched = match_pattern(index, pattern)
+            if not matched:
+                raise ValueError(f"Aucun contrôle sélectionné ne correspond à « {pattern} »")
+            selected.update((cis_id, index[cis_id]) for cis_id in matched)
+    else:
+        selected = dict(index)
+    for pattern in skip or ():
+        for cis_id in match_pattern(selected, pattern):
+            del selected[cis_id]
+    if levels:
+        allowed = {level for name in levels for level in LEVELS[name]}
+        selected = {cis_id: check for cis_id, check in selected.items() if check.level in allowed}
+    if not selected:
+        raise ValueError("Aucun contrôle ne correspond à la sélection")
+    return sorted(selected.values(), key=cis_sort_key)
+
+
+def catalog_version(check_list):
+    """
+    Version du catalogue enregistrée avec chaque exécution : version du référentiel
+    et empreinte des contrôles (identifiants et définitions des règles).
+    """
+    digest = hashlib.sha256()
+    for check in check_list:
+        digest.update(check.cis_id.encode())
+        if isinstance(check, RegistryRule):
+            digest.update(ScanState._fingerprint(check).encode())
+    return f"{CIS_BENCHMARK_VERSION}+{digest.hexdigest()[:12]}"
@@ -0,0 +1,109 @@
+"""
+Section 1 : Account Policies (mots de passe et verrouillage des comptes).
+"""
+from ..core import HKLM, compliance_check, RegistryRule, security_policy_result
+
+
+@compliance_check("1.1.1", "Enforce password history", "L1",
+                  requires=[("secedit", "System Access", "PasswordHistorySize")])
+# Contrôle 1.1.1 : Vérifier l'historique des mots de passe
+def check_password_history():
+    """
+    Vérifie si l'historique des mots de passe Windows est configuré à 24 mots de passe ou plus.
+    """
+    return security_policy_result("System Access", "PasswordHistorySize", "ge", 24)
+
+
+@compliance_check("1.1.2", "Maximum password age", "L1", requires=[("secedit", "System Access", "MaximumPasswordAge")])
+# Contrôle 1.1.2 : Vérifier la politique "Maximum password age"
+def check_maximum_password_age():
+    """
+    Vérifie si la politique 'Maximum password age' est configurée à 365 jours ou moins, mais pas 0.
+    """
+    return security_policy_result("System Access", "MaximumPasswordAge", "range", (1, 365))
+
+
+@compliance_check("1.1.3", "Minimum password age", "L1", requires=[("secedit", "System Access", "MinimumPasswordAge")])
+# Contrôle 1.1.3 : Vérifier la politique "Minimum password age"
+def check_minimum_password_age():
+    """
+    Vérifie si la politique 'Minimum password age' est configurée à 1 jour ou plus.
+    """
+    return security_policy_result("System Access", "MinimumPasswordAge", "ge", 1)
+
+
+@compliance_check("1.1.4", "Minimum password length", "L1",
+                  requires=[("secedit", "System Access", "MinimumPasswordLength")])
+# Contrôle 1.1.4 : Vérifier la politique "Minimum password length"
+def check_minimum_password_length():
+    """
+    Vérifie si la politique 'Minimum password length' est configurée à 14 caractères ou plus.
+    """
+    return security_policy_result("System Access", "MinimumPasswordLength", "ge", 14)
+
+
+@compliance_check("1.1.5", "Password must meet complexity requirements", "L1",
+                  requires=[("secedit", "System Access", "PasswordComplexity")])
+# Contrôle 1.1.5 : Vérifier si la politique "Password must meet complexity requirements" est activée
+def check_password_complexity():
+    """
+    Vérifie si la politique 'Password must meet complexity requirements' est activée.
+    """
+    return security_policy_result("System Access", "PasswordComplexity", "eq", 1)
+
+
+@compliance_check("1.2.1", "Account lockout duration", "L1", requires=[("secedit", "System Access", "LockoutDuration")])
+# Contrôle 1.2.1 : Vérifier la politique "Account lockout duration"
+def check_account_lockout_duration():
+    """
+    Vérifie si la politique 'Account lockout duration' est configurée à 15 minutes ou plus.
+    """
+    return security_policy_result("System Access", "LockoutDuration", "ge", 15)
+
+
+@compliance_check("1.2.2", "Account lockout threshold", "L1",
+                  requires=[("secedit", "System Access", "LockoutBadCount")])
+# Contrôle 1.2.2 : Vérifier la politique "Account lockout threshold"
+def check_account_lockout_threshold():
+    """
+    Vérifie si la politique 'Account lockout threshold' est configurée à 5 tentatives ou moins,
+    mais pas à 0.
+    """
+    return security_policy_result("System Access", "LockoutBadCount", "range", (1, 5))
+
+
+@compliance_check("1.2.4", "Reset account lockout counter after", "L1",
+                  requires=[("secedit", "System Access", "ResetLockoutCount")])
+# Contrôle 1.2.4 : Vérifier la politique "Reset account lockout counter after"
+def check_reset_account_lockout_counter():
+    """
+    Vérifie si la politique 'Reset account lockout counter after' est configurée à 15 minutes ou plus.
+    """
+    return security_policy_result("System Access", "ResetLockoutCount", "ge", 15)
+
+
+# Catalogue des contrôles de registre : une ligne par recommandation CIS.
+# (identifiant, titre, ruche, clé, valeur, opérateur, attendu, niveau [, missing_ok])
+# missing_ok : une clé ou une valeur absente est conforme (valeur par défaut de Windows conforme).
+REGISTRY_RULES = [
+    # Section 1 : Account Policies
+    RegistryRule("1.1.6", "Relax minimum password length limits",
+                 HKLM, r"System\CurrentControlSet\Control\SAM", "RelaxMinimumPasswordLengthLimits", "eq", 1, "L1"),
+    RegistryRule("1.1.7", "Store passwords using reversible encryption",
+                 HKLM, r"System\CurrentControlSet\Control\Lsa", "LimitBlankPasswordUse", "eq", 0, "L1"),
+    RegistryRule("1.2.3", "Allow Administrator account lockout",
+                 HKLM, r"System\CurrentControlSet\Control\Lsa", "Accounts: Administrator account lockout", "eq", 1, "L1"),
+]
+
+
+# Fonctions de contrôle de la section (politique de sécurité, audit et contrôles composés)
+CHECK_FUNCTIONS = [
+    check_password_history,
+    check_maximum_password_age,
+    check_minimum_password_age,
+    check_minimum_password_length,
+    check_password_complexity, #controle 1.1.5
+    check_account_lockout_duration, # Ajout du contrôle 1.2.1
+    check_account_lockout_threshold, # Ajout du contrôle 1.2.2
+    check_reset_account_lockout_counter, # Ajout du contrôle 1.2.4
+]
@@ -0,0 +1,797 @@
+"""
+Sections 18 et 19 : Administrative Templates (ordinateur et utilisateur).
+"""
+from ..core import HKLM, HKU, compliance_check, registry_list_result, registry_values_result, RegistryRule
+
+
+# GUID des classes de périphériques IEEE 1394 (18.9.7.1.5)
+IEEE1394_DEVICE_CLASSES = [
+    "{d48179be-ec20-11d1-b6b8-00c04fa372a7}",  # IEEE 1394 devices that support SBP2 Protocol Class
+    "{7ebefbc0-3200-11d2-b4c2-00a0C9697d07}",  # IEEE 1394 devices that support IEC-61883 Protocol Class
+    "{c06ff265-ae09-48f0-812c-16753d7cba83}",  # IEEE 1394 devices that support AVC Protocol Class
+    "{6bdd1fc1-810f-11d0-bec7-08002be2092f}"   # IEEE 1394 Host Bus Controller Class
+]
+# Classes interdites par la stratégie : une valeur numérotée ("1", "2"...) par classe sous cette clé,
+# dont les dix premières sont lues
+DENY_DEVICE_CLASSES_KEY = r"SOFTWARE\Policies\Microsoft\Windows\DeviceInstall\Restrictions\DenyDeviceClasses"
+DENY_DEVICE_CLASSES_SLOTS = [str(index) for index in range(1, 11)]
+
+
+@compliance_check("18.6.9.1", "Turn on Mapper I/O (LLTDIO) driver", "L2", requires=[
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "AllowLLTDIOOnDomain"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "AllowLLTDIOOnPublicNet"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "EnableLLTDIO"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "ProhibitLLTDIOOnPrivateNet"),
+])
+# Contrôle 18.6.9.1 : Vérifier "Turn on Mapper I/O (LLTDIO) driver" via le registre
+def check_mapper_io_driver():
+    return registry_values_result([
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "AllowLLTDIOOnDomain", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "AllowLLTDIOOnPublicNet", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "EnableLLTDIO", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "ProhibitLLTDIOOnPrivateNet", "eq", 0),
+    ])
+
+
+@compliance_check("18.6.9.2", "Turn on Responder (RSPNDR) driver", "L2", requires=[
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "AllowRspndrOnDomain"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "AllowRspndrOnPublicNet"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "EnableRspndr"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "ProhibitRspndrOnPrivateNet"),
+])
+# Contrôle 18.6.9.2 : Vérifier "Turn on Responder (RSPNDR) driver" via le registre
+def check_responder_driver():
+    return registry_values_result([
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "AllowRspndrOnDomain", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "AllowRspndrOnPublicNet", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "EnableRspndr", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LLTD", "ProhibitRspndrOnPrivateNet", "eq", 0),
+    ])
+
+
+@compliance_check("18.6.14.1", "Hardened UNC Paths", "L1", requires=[
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\NetworkProvider\HardenedPaths\\*\NETLOGON", "RequireMutualAuthentication"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\NetworkProvider\HardenedPaths\\*\NETLOGON", "RequireIntegrity"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\NetworkProvider\HardenedPaths\\*\NETLOGON", "RequirePrivacy"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\NetworkProvider\HardenedPaths\\*\SYSVOL", "RequireMutualAuthentication"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\NetworkProvider\HardenedPaths\\*\SYSVOL", "RequireIntegrity"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\NetworkProvider\HardenedPaths\\*\SYSVOL", "RequirePrivacy"),
+])
+# Contrôle 18.6.14.1 : Vérifier "Hardened UNC Paths" via le registre
+def check_hardened_unc_paths():
+    conditions = []
+    for share in ("NETLOGON", "SYSVOL"):
+        path = rf"SOFTWARE\Policies\Microsoft\Windows\NetworkProvider\HardenedPaths\\*\{share}"
+        for name in ("RequireMutualAuthentication", "RequireIntegrity", "RequirePrivacy"):
+            conditions.append((HKLM, path, name, "eq", 1))
+    return registry_values_result(conditions)
+
+
+@compliance_check("18.6.20.1", "Configuration of wireless settings using Windows Connect Now", "L2", requires=[
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "EnableRegistrars"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "DisableUPnPRegistrar"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "DisableInBand802DOT11Registrar"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "DisableFlashConfigRegistrar"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "DisableWPDRegistrar"),
+])
+# Contrôle 18.6.20.1 : Vérifier "Configuration of wireless settings using Windows Connect Now" via le registre
+def check_wireless_settings_windows_connect_now():
+    return registry_values_result([
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "EnableRegistrars", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "DisableUPnPRegistrar", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "DisableInBand802DOT11Registrar", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "DisableFlashConfigRegistrar", "eq", 0),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\Registrars", "DisableWPDRegistrar", "eq", 0),
+    ])
+
+
+@compliance_check("18.9.7.1.5", "Prevent Device Installation IEEE 1394", "BL",
+                  requires=[("registry", HKLM, DENY_DEVICE_CLASSES_KEY, slot) for slot in DENY_DEVICE_CLASSES_SLOTS])
+# Contrôle 18.9.7.1.5 : Vérifier si "Prevent installation of devices using drivers that match these device setup classes" contient les classes IEEE 1394
+def check_prevent_device_installation_ieee1394():
+    return registry_list_result(HKLM, DENY_DEVICE_CLASSES_KEY, DENY_DEVICE_CLASSES_SLOTS, "contains_all",
+                                IEEE1394_DEVICE_CLASSES)
+
+
+@compliance_check("18.9.20.1.14", "Turn off Windows Error Reporting", "L2", requires=[
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Error Reporting", "Disabled"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\PCHealth\ErrorReporting", "DoReport"),
+])
+# Contrôle 18.9.20.1.14 : Vérifier si "Turn off Windows Error Reporting" est activé
+def check_turn_off_windows_error_reporting():
+    return registry_values_result([
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Error Reporting", "Disabled", "eq", 1),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\PCHealth\ErrorReporting", "DoReport", "eq", 0),
+    ])
+
+
+@compliance_check("18.9.23.1", "Support device authentication using certificate", "L2", requires=[
+    ("registry", HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System\kerberos\parameters", "DevicePKInitBehavior"),
+    ("registry", HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System\kerberos\parameters", "DevicePKInitEnabled"),
+])
+# Contrôle 18.9.23.1 : Vérifier si "Support device authentication using certificate" est activé
+def check_support_device_authentication_using_certificate():
+    return registry_values_result([
+        (HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System\kerberos\parameters", "DevicePKInitBehavior", "eq", 0),
+        (HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System\kerberos\parameters", "DevicePKInitEnabled", "eq", 1),
+    ])
+
+
+# Règles ASR (Attack Surface Reduction) devant être en mode blocage (contrôle 18.10.42.6.1.2)
+ASR_RULES_KEY = r"SOFTWARE\Policies\Microsoft\Windows Defender\Windows Defender Exploit Guard\ASR\Rules"
+ASR_RULE_IDS = [
+    "26190899-1602-49e8-8b27-eb1d0a1ce869",
+    "3b576869-a4ec-4529-8536-b80a7769e899",
+    "56a863a9-875e-4185-98a7-b882c64b5ce5",
+    "5beb7efe-fd9a-4556-801d-275e5ffc04cc",
+    "75668c1f-73b5-4cf0-bb93-3ecf5cb7cc84",
+    "7674ba52-37eb-4a4f-a9a1-f0f9a1619a2c",
+    "92e97fa1-2edf-4476-bdd6-9dd0b4dddc7b",
+    "9e6c4e1f-7d60-472f-ba1a-a39ef669e4b2",
+    "b2b3f03d-6a65-4f7b-a9c7-1c7ef74a9ba4",
+    "be9ba2d9-53ea-4cdc-84e5-9b1eeee46550",
+    "d3e037e1-3eb8-44c8-a917-57927947596d",
+    "d4f940ab-401b-4efc-aadc-ad5f3c50688a",
+    "e6db77e5-3df2-4cf1-b95a-636979351e5b"
+]
+
+
+@compliance_check("18.10.42.6.1.2", "Configure Attack Surface Reduction rules: Set the state for each ASR rule", "L1",
+                  requires=[("registry", HKLM, ASR_RULES_KEY, rule_id) for rule_id in ASR_RULE_IDS])
+# Contrôle 18.10.42.6.1.2 : Vérifier "Set the state for each ASR rule" dans le registre
+def check_asr_rules():
+    return registry_values_result([(HKLM, ASR_RULES_KEY, rule_id, "eq", 1) for rule_id in ASR_RULE_IDS])
+
+
+@compliance_check("18.10.75.2.1", "Windows Defender SmartScreen", "L1", requires=[
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "EnableSmartScreen"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "ShellSmartScreenLevel"),
+])
+# Fonction pour vérifier la configuration de Windows Defender SmartScreen
+def check_defender_smartscreen():
+    return registry_values_result([
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "EnableSmartScreen", "eq", 1),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "ShellSmartScreenLevel", "eq", "Block"),
+    ])
+
+
+@compliance_check("18.10.92.4.2", "Defer Feature Updates", "L1", requires=[
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "DeferFeatureUpdates"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "DeferFeatureUpdatesPeriodInDays"),
+])
+# Contrôle 18.10.92.4.2 : Vérifier "Select when Preview Builds and Feature Updates are received" via le registre
+def check_select_when_preview_builds_and_feature_updates_are_received():
+    return registry_values_result([
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "DeferFeatureUpdates", "eq", 1),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "DeferFeatureUpdatesPeriodInDays", "eq", 180),
+    ])
+
+
+@compliance_check("18.10.92.4.3", "Defer Quality Updates", "L1", requires=[
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "DeferQualityUpdates"),
+    ("registry", HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "DeferQualityUpdatesPeriodInDays"),
+])
+# Contrôle 18.10.92.4.3 : Vérifier "Select when Quality Updates are received" via le registre
+def check_select_when_quality_updates_are_received():
+    return registry_values_result([
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "DeferQualityUpdates", "eq", 1),
+        (HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "DeferQualityUpdatesPeriodInDays", "eq", 0),
+    ])
+
+
+# Catalogue des contrôles de registre : une ligne par recommandation CIS.
+# (identifiant, titre, ruche, clé, valeur, opérateur, attendu, niveau [, missing_ok])
+# missing_ok : une clé ou une valeur absente est conforme (valeur par défaut de Windows conforme).
+REGISTRY_RULES = [
+    # Section 18 : Administrative Templates (Computer)
+    RegistryRule("18.1.1.1", "Prevent enabling lock screen camera",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Personalization", "NoLockScreenCamera", "eq", 1, "L1"),
+    RegistryRule("18.1.1.2", "Prevent enabling lock screen slide show",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Personalization", "NoLockScreenSlideshow", "eq", 1, "L1"),
+    RegistryRule("18.1.2.2", "Allow users to enable online speech recognition services",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\InputPersonalization", "AllowInputPersonalization", "eq", 0, "L1"),
+    RegistryRule("18.1.3", "Allow Online Tips",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "AllowOnlineTips", "eq", 0, "L2"),
+    RegistryRule("18.4.1", "Configure RPC packet level privacy setting for incoming connections",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Print", "RpcAuthnLevelPrivacyEnabled", "eq", 1, "L1"),
+    RegistryRule("18.4.2", "Configure SMB v1 client driver",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\mrxsmb10", "Start", "eq", 4, "L1"),
+    RegistryRule("18.4.3", "Configure SMB v1 server",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanmanServer\Parameters", "SMB1", "eq", 0, "L1"),
+    RegistryRule("18.4.4", "Enable Certificate Padding",
+                 HKLM, r"SOFTWARE\Microsoft\Cryptography\Wintrust\Config", "EnableCertPaddingCheck", "eq", 1, "L1"),
+    RegistryRule("18.4.5", "Enable SEHOP",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Session Manager\kernel", "DisableExceptionChainValidation", "eq", 0, "L1"),
+    RegistryRule("18.4.6", "NetBT NodeType configuration",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\NetBT\Parameters", "NodeType", "eq", 2, "L1"),
+    RegistryRule("18.4.7", "WDigest Authentication",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\SecurityProviders\WDigest", "UseLogonCredential", "eq", 0, "L1"),
+    RegistryRule("18.5.1", "MSS: (AutoAdminLogon) Enable Automatic Logon",
+                 HKLM, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Winlogon", "AutoAdminLogon", "eq", "0", "L1"),
+    RegistryRule("18.5.2", "MSS: (DisableIPSourceRouting IPv6) IP source routing protection level",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\Tcpip6\Parameters", "DisableIPSourceRouting", "eq", 2, "L1"),
+    RegistryRule("18.5.3", "MSS: (DisableIPSourceRouting) IP source routing protection level",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters", "DisableIPSourceRouting", "eq", 2, "L1"),
+    RegistryRule("18.5.4", "MSS: (DisableSavePassword) Prevent the dial-up password from being saved",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\RasMan\Parameters", "DisableSavePassword", "eq", 1, "L1"),
+    RegistryRule("18.5.5", "MSS: (EnableICMPRedirect) Allow ICMP redirects to override OSPF generated routes",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters", "EnableICMPRedirect", "eq", 0, "L1"),
+    RegistryRule("18.5.6", "MSS: (KeepAliveTime) How often keep-alive packets are sent",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters", "KeepAliveTime", "eq", 300000, "L2"),
+    RegistryRule("18.5.7", "MSS: (NoNameReleaseOnDemand) Allow the computer to ignore NetBIOS name release requests except from WINS servers",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\NetBT\Parameters", "NoNameReleaseOnDemand", "eq", 1, "L1"),
+    RegistryRule("18.5.8", "MSS: (PerformRouterDiscovery) Allow IRDP to detect and configure Default Gateway addresses",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters", "PerformRouterDiscovery", "eq", 0, "L2"),
+    RegistryRule("18.5.9", "MSS: (SafeDllSearchMode) Enable Safe DLL search mode",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Session Manager", "SafeDllSearchMode", "eq", 1, "L1"),
+    RegistryRule("18.5.10", "MSS: (ScreenSaverGracePeriod) The time before the screen saver grace period expires",
+                 HKLM, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Winlogon", "ScreenSaverGracePeriod", "le", 5, "L1"),
+    RegistryRule("18.5.11", "MSS: (TcpMaxDataRetransmissions IPv6) How many times unacknowledged data is retransmitted",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\TCPIP6\Parameters", "TcpMaxDataRetransmissions", "eq", 3, "L2"),
+    RegistryRule("18.5.12", "MSS: (TcpMaxDataRetransmissions) How many times unacknowledged data is retransmitted",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters", "TcpMaxDataRetransmissions", "eq", 3, "L2"),
+    RegistryRule("18.5.13", "MSS: (WarningLevel) Percentage threshold for the security event log",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\Eventlog\Security", "WarningLevel", "le", 90, "L1"),
+    RegistryRule("18.6.4.1", "Configure DNS over HTTPS (DoH) name resolution",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\DNSClient", "DoHPolicy", "in", [2, 3], "L1"),
+    RegistryRule("18.6.5.1", "Enable Font Providers",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "EnableFontProviders", "eq", 0, "L2"),
+    RegistryRule("18.6.8.1", "Enable insecure guest logons",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LanmanWorkstation", "AllowInsecureGuestAuth", "eq", 0, "L1"),
+    RegistryRule("18.6.10.2", "Turn off Microsoft Peer-to-Peer Networking Services",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Peernet", "Disabled", "eq", 1, "L2"),
+    RegistryRule("18.6.11.2", "Prohibit installation and configuration of Network Bridge",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\NetworkConnections", "NC_AllowNetBridge_NLA", "eq", 0, "L1"),
+    RegistryRule("18.6.11.3", "Prohibit use of Internet Connection Sharing",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\NetworkConnections", "NC_ShowSharedAccessUI", "eq", 0, "L1"),
+    RegistryRule("18.6.20.2", "Prohibit access of the Windows Connect Now wizards",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WCN\UI", "DisableWcnUi", "eq", 1, "L2"),
+    RegistryRule("18.6.21.1", "Minimize the number of simultaneous connections to the Internet or a Windows Domain",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WcmSvc\GroupPolicy", "fMinimizeConnections", "eq", 3, "L1"),
+    RegistryRule("18.6.23.2.1", "Allow Windows to automatically connect to suggested open hotspots",
+                 HKLM, r"SOFTWARE\Microsoft\WcmSvc\wifinetworkmanager\config", "AutoConnectAllowedOEM", "eq", 0, "L1"),
+    RegistryRule("18.7.1", "Allow Print Spooler to accept client connections",
+                 HKLM, r"Software\Policies\Microsoft\Windows NT\Printers", "RegisterSpoolerRemoteRpcEndPoint", "eq", 2, "L1"),
+    RegistryRule("18.7.2", "Configure Redirection Guard",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers", "RedirectionguardPolicy", "eq", 1, "L1"),
+    RegistryRule("18.7.3", "Configure RPC connection settings: Protocol to use for outgoing RPC connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers\RPC", "RpcUseNamedPipeProtocol", "eq", 0, "L1"),
+    RegistryRule("18.7.4", "Configure RPC connection settings: Use authentication for outgoing RPC connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers\RPC", "RpcAuthentication", "eq", 0, "L1"),
+    RegistryRule("18.7.5", "Configure RPC listener settings: Protocols to allow for incoming RPC connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers\RPC", "RpcProtocols", "eq", 5, "L1"),
+    RegistryRule("18.7.6", "Configure RPC listener settings: Authentication protocol to use for incoming RPC connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers\RPC", "ForceKerberosForRpc", "in", [0, 1], "L1"),
+    RegistryRule("18.7.7", "Configure RPC over TCP port",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers\RPC", "RpcTcpPort", "eq", 0, "L1"),
+    RegistryRule("18.7.8", "Limits print driver installation to Administrators",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers\PointAndPrint", "RestrictDriverInstallationToAdministrators", "eq", 1, "L1"),
+    RegistryRule("18.7.9", "Manage processing of Queue-specific files",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers", "CopyFilesPolicy", "eq", 1, "L1"),
+    RegistryRule("18.7.10", "Point and Print Restrictions",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers\PointAndPrint", "NoWarningNoElevationOnInstall", "eq", 0, "L1"),
+    RegistryRule("18.7.11", "Point and Print Restrictions",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers\PointAndPrint", "UpdatePromptSettings", "eq", 0, "L1"),
+    RegistryRule("18.8.1.1", "Turn off notifications network usage",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\CurrentVersion\PushNotifications", "NoCloudApplicationNotification", "eq", 1, "L2"),
+    RegistryRule("18.8.2", "Remove Personalized Website Recommendations",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Explorer", "HideRecommendedPersonalizedSites", "eq", 1, "L2"),
+    RegistryRule("18.9.3.1", "Include command line in process creation events",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System\Audit", "ProcessCreationIncludeCmdLine_Enabled", "eq", 1, "L1"),
+    RegistryRule("18.9.4.1", "Encryption Oracle Remediation",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System\CredSSP\Parameters", "AllowEncryptionOracle", "eq", 0, "L1"),
+    RegistryRule("18.9.4.2", "Remote Host Delegation",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\CredentialsDelegation", "AllowProtectedCreds", "eq", 1, "L1"),
+    RegistryRule("18.9.5.1", "Virtualization Based Security",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceGuard", "EnableVirtualizationBasedSecurity", "eq", 1, "L1"),
+    RegistryRule("18.9.5.2", "Platform Security Level",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceGuard", "RequirePlatformSecurityFeatures", "in", [1, 3], "L1"),
+    RegistryRule("18.9.5.3", "Code Integrity Protection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceGuard", "HypervisorEnforcedCodeIntegrity", "eq", 1, "L1"),
+    RegistryRule("18.9.5.4", "UEFI Memory Attributes Table",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceGuard", "HVCIMATRequired", "eq", 1, "L1"),
+    RegistryRule("18.9.5.5", "Credential Guard Configuration",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceGuard", "LsaCfgFlags", "eq", 1, "L1"),
+    RegistryRule("18.9.5.6", "Secure Launch Configuration",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceGuard", "ConfigureSystemGuardLaunch", "eq", 1, "L1"),
+    RegistryRule("18.9.5.7", "Kernel-mode Hardware-enforced Stack Protection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceGuard", "ConfigureKernelShadowStacksLaunch", "eq", 1, "L1"),
+    RegistryRule("18.9.7.1.1", "Prevent Device Installation",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceInstall\Restrictions", "DenyDeviceIDs", "eq", 1, "L1"),
+    RegistryRule("18.9.7.1.2", "Prevent Device Installation",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceInstall\Restrictions\DenyDeviceIDs", "1", "contains", "PCI\\CC_0C0A", "L1"),
+    RegistryRule("18.9.7.1.3", "Prevent Device Installation Retroactive",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceInstall\Restrictions", "DenyDeviceIDsRetroactive", "eq", 1, "L1"),
+    RegistryRule("18.9.7.1.4", "Prevent Device Installation by Class",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceInstall\Restrictions", "DenyDeviceClasses", "eq", 1, "L1"),
+    RegistryRule("18.9.7.1.6", "Prevent Device Installation Retroactive by Class",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceInstall\Restrictions", "DenyDeviceClassesRetroactive", "eq", 1, "BL"),
+    RegistryRule("18.9.7.2", "Prevent Device Metadata Retrieval",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeviceMetadata", "PreventDeviceMetadataFromNetwork", "eq", 1, "L1"),
+    RegistryRule("18.9.13.1", "Boot-Start Driver Initialization Policy",
+                 HKLM, r"SYSTEM\CurrentControlSet\Policies\EarlyLaunch", "DriverLoadPolicy", "eq", 3, "L1"),
+    RegistryRule("18.9.19.2", "Continue Experiences on this Device",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "EnableCdp", "eq", 0, "L1"),
+    RegistryRule("18.9.20.1.1", "Turn off access to the Store",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Explorer", "NoUseStoreOpenWith", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.2", "Turn off downloading of print drivers over HTTP",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers", "DisableWebPnPDownload", "eq", 1, "L1"),
+    RegistryRule("18.9.20.1.3", "Turn off Handwriting Personalization Data Sharing",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\TabletPC", "PreventHandwritingDataSharing", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.4", "Turn off Handwriting Recognition Error Reporting",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\HandwritingErrorReports", "PreventHandwritingErrorReports", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.5", "Turn off Internet Connection Wizard",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Internet Connection Wizard", "ExitOnMSICW", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.6", "Turn off Internet download for Web publishing and online ordering wizards",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "NoWebServices", "eq", 1, "L1"),
+    RegistryRule("18.9.20.1.7", "Turn off Printing over HTTP",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Printers", "DisableHTTPPrinting", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.8", "Turn off Registration if URL connection is referring to Microsoft.com",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Registration Wizard", "NoRegistration", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.9", "Turn off Search Companion Content File Updates",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\SearchCompanion", "DisableContentFileUpdates", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.10", "Turn off the 'Order Prints' Picture Task",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "NoOnlinePrintsWizard", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.11", "Turn off the 'Publish to Web' Task",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "NoPublishingWizard", "eq", 1, "L2"),
+    RegistryRule("18.9.20.1.12", "Turn off the Windows Messenger CEIP",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Messenger\Client", "CEIP", "eq", 2, "L2"),
+    RegistryRule("18.9.20.1.13", "Turn off Windows CEIP",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\SQMClient\Windows", "CEIPEnable", "eq", 0, "L2"),
+    RegistryRule("18.9.24.1", "Enumeration policy for external devices incompatible with Kernel DMA Protection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Kernel DMA Protection", "DeviceEnumerationPolicy", "eq", 0, "L1"),
+    RegistryRule("18.9.26.1", "Allow Custom SSPs and APs to be loaded into LSASS",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "AllowCustomSSPsAPs", "eq", 0, "L1"),
+    RegistryRule("18.9.26.2", "Configures LSASS to run as a protected process",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "RunAsPPL", "eq", 1, "L1"),
+    RegistryRule("18.9.27.1", "Disallow copying of user input methods to the system account for sign-in",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Control Panel\International", "BlockUserInputMethodsForSignIn", "eq", 1, "L1"),
+    RegistryRule("18.9.28.1", "Block user from showing account details on sign-in",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "BlockUserFromShowingAccountDetailsOnSignin", "eq", 1, "L1"),
+    RegistryRule("18.9.28.2", "Do not display network selection UI",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "DontDisplayNetworkSelectionUI", "eq", 1, "L1"),
+    RegistryRule("18.9.28.3", "Turn off app notifications on the lock screen",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "DisableLockScreenAppNotifications", "eq", 1, "L1"),
+    RegistryRule("18.9.28.4", "Turn on convenience PIN sign-in",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "AllowDomainPINLogon", "eq", 0, "L1"),
+    RegistryRule("18.9.31.1", "Allow Clipboard synchronization across devices",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "AllowCrossDeviceClipboard", "eq", 0, "L2"),
+    RegistryRule("18.9.31.2", "Allow upload of User Activities",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "UploadUserActivities", "eq", 0, "L2"),
+    RegistryRule("18.9.33.6.1", "Allow network connectivity during connected-standby (on battery)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Power\PowerSettings\f15576e8-98b7-4186-b944-eafa664402d9", "DCSettingIndex", "eq", 0, "L1"),
+    RegistryRule("18.9.33.6.2", "Allow network connectivity during connected-standby (plugged in)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Power\PowerSettings\f15576e8-98b7-4186-b944-eafa664402d9", "ACSettingIndex", "eq", 0, "L1"),
+    RegistryRule("18.9.33.6.3", "Allow standby states (S1-S3) when sleeping (on battery)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Power\PowerSettings\abfc2519-3608-4c2a-94ea171b0ed546ab", "DCSettingIndex", "eq", 0, "L1"),
+    RegistryRule("18.9.33.6.4", "Allow standby states (S1-S3) when sleeping (plugged in)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Power\PowerSettings\abfc2519-3608-4c2a-94ea171b0ed546ab", "ACSettingIndex", "eq", 0, "L1"),
+    RegistryRule("18.9.33.6.5", "Require a password when a computer wakes (on battery)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Power\PowerSettings\0e796bdb-100d-47d6-a2d5-f7d2daa51f51", "DCSettingIndex", "eq", 1, "L1"),
+    RegistryRule("18.9.33.6.6", "Require a password when a computer wakes (plugged in)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Power\PowerSettings\0e796bdb-100d-47d6-a2d5-f7d2daa51f51", "ACSettingIndex", "eq", 1, "L1"),
+    RegistryRule("18.9.35.1", "Configure Offer Remote Assistance",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fAllowUnsolicited", "eq", 0, "L1"),
+    RegistryRule("18.9.35.2", "Configure Solicited Remote Assistance",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fAllowToGetHelp", "eq", 0, "L1"),
+    RegistryRule("18.9.36.1", "Enable RPC Endpoint Mapper Client Authentication",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Rpc", "EnableAuthEpResolution", "eq", 1, "L1"),
+    RegistryRule("18.9.36.2", "Restrict Unauthenticated RPC clients",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Rpc", "RestrictRemoteClients", "eq", 1, "L1"),
+    RegistryRule("18.9.47.5.1", "Turn on MSDT interactive communication with support provider",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\ScriptedDiagnosticsProvider\Policy", "DisableQueryRemoteServer", "eq", 1, "L2"),
+    RegistryRule("18.9.47.11.1", "Enable/Disable PerfTrack",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WDI", "{9c5a40da-b965-4fc3-8781-88dd50a6299d}:ScenarioExecutionEnabled", "eq", 0, "L2"),
+    RegistryRule("18.9.49.1", "Turn off the advertising ID",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\AdvertisingInfo", "DisabledByGroupPolicy", "eq", 1, "L2"),
+    RegistryRule("18.9.51.1.1", "Enable Windows NTP Client",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\W32Time\TimeProviders\NtpClient", "Enabled", "eq", 1, "L2"),
+    RegistryRule("18.10.3.1", "Allow a Windows app to share application data between users",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\CurrentVersion\AppModel\StateManager", "AllowSharedLocalAppData", "eq", 0, "L2"),
+    RegistryRule("18.10.3.2", "Prevent non-admin users from installing packaged Windows apps",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Appx", "BlockNonAdminUserInstall", "eq", 1, "L1"),
+    RegistryRule("18.10.4.1", "Let Windows apps activate with voice while the system is locked",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\AppPrivacy", "LetAppsActivateWithVoiceAboveLock", "eq", 2, "L1"),
+    RegistryRule("18.10.5.1", "Allow Microsoft accounts to be optional",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "MSAOptional", "eq", 1, "L1"),
+    RegistryRule("18.10.5.2", "Block launching Universal Windows apps with Windows Runtime API access from hosted content",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "BlockHostedAppAccessWinRT", "eq", 1, "L1"),
+    RegistryRule("18.10.7.1", "Disallow Autoplay for non-volume devices",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Explorer", "NoAutoplayfornonVolume", "eq", 1, "L1"),
+    RegistryRule("18.10.7.2", "Set the default behavior for AutoRun",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "NoAutorun", "eq", 1, "L1"),
+    RegistryRule("18.10.7.3", "Turn off Autoplay",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "NoDriveTypeAutoRun", "eq", 255, "L1"),
+    RegistryRule("18.10.8.1.1", "Configure enhanced anti-spoofing",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Biometrics\FacialFeatures", "EnhancedAntiSpoofing", "eq", 1, "L1"),
+    RegistryRule("18.10.9.1.1", "Allow access to BitLocker-protected fixed data drives from earlier versions of Windows",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVDiscoveryVolumeType", "eq", "", "BL"),
+    RegistryRule("18.10.9.1.2", "Choose how BitLocker-protected fixed drives can be recovered",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVRecovery", "eq", 1, "BL"),
+    RegistryRule("18.10.9.1.3", "Allow data recovery agent",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVManageDRA", "eq", 1, "BL"),
+    RegistryRule("18.10.9.1.4", "Recovery Password",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVRecoveryPassword", "in", [2, 1], "BL"),
+    RegistryRule("18.10.9.1.5", "Recovery Key",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVRecoveryKey", "in", [2, 1], "BL"),
+    RegistryRule("18.10.9.1.6", "Omit recovery options from the BitLocker setup wizard",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVHideRecoveryPage", "eq", 1, "BL"),
+    RegistryRule("18.10.9.1.7", "Save BitLocker recovery information to AD DS for fixed data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVActiveDirectoryBackup", "eq", 0, "BL"),
+    RegistryRule("18.10.9.1.8", "Configure storage of BitLocker recovery information to AD DS",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVActiveDirectoryInfoToStore", "eq", 1, "BL"),
+    RegistryRule("18.10.9.1.9", "Do not enable BitLocker until recovery information is stored to AD DS for fixed data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVRequireActiveDirectoryBackup", "eq", 0, "BL"),
+    RegistryRule("18.10.9.1.10", "Configure use of hardware-based encryption for fixed data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVHardwareEncryption", "eq", 0, "BL"),
+    RegistryRule("18.10.9.1.11", "Configure use of passwords for fixed data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVPassphrase", "eq", 0, "BL"),
+    RegistryRule("18.10.9.1.12", "Configure use of smart cards on fixed data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVAllowUserCert", "eq", 1, "BL"),
+    RegistryRule("18.10.9.1.13", "Configure use of smart cards on fixed data drives: Require use of smart cards on fixed data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "FDVEnforceUserCert", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.1", "Allow enhanced PINs for startup",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "UseEnhancedPin", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.2", "Allow Secure Boot for integrity validation",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSAllowSecureBootForIntegrity", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.3", "Choose how BitLocker-protected operating system drives can be recovered",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSRecovery", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.4", "Choose how BitLocker-protected operating system drives can be recovered: Allow data recovery agent",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSManageDRA", "eq", 0, "BL"),
+    RegistryRule("18.10.9.2.5", "Choose how BitLocker-protected operating system drives can be recovered: Recovery Password",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSRecoveryPassword", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.6", "Choose how BitLocker-protected operating system drives can be recovered: Recovery Key",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSRecoveryKey", "eq", 0, "BL"),
+    RegistryRule("18.10.9.2.7", "Choose how BitLocker-protected operating system drives can be recovered: Omit recovery options from the BitLocker setup wizard",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSHideRecoveryPage", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.8", "Choose how BitLocker-protected operating system drives can be recovered: Save BitLocker recovery information to AD DS for operating system drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSActiveDirectoryBackup", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.9", "Choose how BitLocker-protected operating system drives can be recovered: Configure storage of BitLocker recovery information to AD DS",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSActiveDirectoryInfoToStore", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.10", "Choose how BitLocker-protected operating system drives can be recovered: Do not enable BitLocker until recovery information is stored to AD DS",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSRequireActiveDirectoryBackup", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.11", "Configure use of hardware-based encryption for operating system drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSHardwareEncryption", "eq", 0, "BL"),
+    RegistryRule("18.10.9.2.12", "Configure use of passwords for operating system drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "OSPassphrase", "eq", 0, "BL"),
+    RegistryRule("18.10.9.2.13", "Require additional authentication at startup",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "UseAdvancedStartup", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.14", "Allow BitLocker without a compatible TPM",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "EnableBDEWithNoTPM", "eq", 0, "BL"),
+    RegistryRule("18.10.9.2.15", "Configure TPM startup",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "UseTPM", "eq", 0, "BL"),
+    RegistryRule("18.10.9.2.16", "Configure TPM startup PIN",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "UseTPMPIN", "eq", 1, "BL"),
+    RegistryRule("18.10.9.2.17", "Configure TPM startup key",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "UseTPMKey", "eq", 0, "BL"),
+    RegistryRule("18.10.9.2.18", "Configure TPM startup key and PIN",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "UseTPMKeyPIN", "eq", 0, "BL"),
+    RegistryRule("18.10.9.3.1", "Allow access to BitLocker-protected removable data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVDiscoveryVolumeType", "eq", "", "BL"),
+    RegistryRule("18.10.9.3.2", "Choose how BitLocker-protected removable drives can be recovered",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVRecovery", "eq", 1, "BL"),
+    RegistryRule("18.10.9.3.3", "Choose how BitLocker-protected removable drives can be recovered: Allow data recovery agent",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVManageDRA", "eq", 1, "BL"),
+    RegistryRule("18.10.9.3.4", "Choose how BitLocker-protected removable drives can be recovered: Recovery Password",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVRecoveryPassword", "eq", 0, "BL"),
+    RegistryRule("18.10.9.3.5", "Choose how BitLocker-protected removable drives can be recovered: Recovery Key",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVRecoveryKey", "eq", 0, "BL"),
+    RegistryRule("18.10.9.3.6", "Choose how BitLocker-protected removable drives can be recovered: Omit recovery options",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVHideRecoveryPage", "eq", 1, "BL"),
+    RegistryRule("18.10.9.3.7", "Save BitLocker recovery information to AD DS for removable data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVActiveDirectoryBackup", "eq", 0, "BL"),
+    RegistryRule("18.10.9.3.8", "Configure storage of BitLocker recovery information to AD DS",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVActiveDirectoryInfoToStore", "eq", 1, "BL"),
+    RegistryRule("18.10.9.3.9", "Do not enable BitLocker until recovery information is stored to AD DS for removable data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVRequireActiveDirectoryBackup", "eq", 0, "BL"),
+    RegistryRule("18.10.9.3.10", "Configure use of hardware-based encryption for removable data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVHardwareEncryption", "eq", 0, "BL"),
+    RegistryRule("18.10.9.3.11", "Configure use of passwords for removable data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVPassphrase", "eq", 0, "BL"),
+    RegistryRule("18.10.9.3.12", "Configure use of smart cards on removable data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVAllowUserCert", "eq", 1, "BL"),
+    RegistryRule("18.10.9.3.13", "Configure use of smart cards on removable data drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVEnforceUserCert", "eq", 1, "BL"),
+    RegistryRule("18.10.9.3.14", "Deny write access to removable drives not protected by BitLocker",
+                 HKLM, r"SYSTEM\CurrentControlSet\Policies\Microsoft\FVE", "RDVDenyWriteAccess", "eq", 1, "BL"),
+    RegistryRule("18.10.9.3.15", "Deny write access to removable drives not protected by BitLocker: Do not allow write access to devices configured in another organization",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "RDVDenyCrossOrg", "eq", 0, "BL"),
+    RegistryRule("18.10.9.4", "Disable new DMA devices when this computer is locked",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\FVE", "DisableExternalDMAUnderLock", "eq", 1, "BL"),
+    RegistryRule("18.10.10.1", "Allow Use of Camera",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Camera", "AllowCamera", "eq", 0, "L2"),
+    RegistryRule("18.10.12.1", "Turn off cloud consumer account state content",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\CloudContent", "DisableConsumerAccountStateContent", "eq", 1, "L1"),
+    RegistryRule("18.10.12.2", "Turn off cloud optimized content",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\CloudContent", "DisableCloudOptimizedContent", "eq", 1, "L1"),
+    RegistryRule("18.10.12.3", "Turn off Microsoft consumer experiences",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\CloudContent", "DisableWindowsConsumerFeatures", "eq", 1, "L1"),
+    RegistryRule("18.10.13.1", "Require pin for pairing",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Connect", "RequirePinForPairing", "in", [1, 2], "L1"),
+    RegistryRule("18.10.14.1", "Do not display the password reveal button",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\CredUI", "DisablePasswordReveal", "eq", 1, "L1"),
+    RegistryRule("18.10.14.2", "Enumerate administrator accounts on elevation",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\CredUI", "EnumerateAdministrators", "eq", 0, "L1"),
+    RegistryRule("18.10.14.3", "Prevent the use of security questions for local accounts",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\System", "NoLocalPasswordResetQuestions", "eq", 1, "L1"),
+    RegistryRule("18.10.15.1", "Allow Diagnostic Data",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DataCollection", "AllowTelemetry", "in", [0, 1], "L1"),
+    RegistryRule("18.10.15.2", "Configure Authenticated Proxy usage for the Connected User Experience and Telemetry service",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DataCollection", "DisableEnterpriseAuthProxy", "eq", 1, "L1"),
+    RegistryRule("18.10.15.3", "Disable OneSettings Downloads",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DataCollection", "DisableOneSettingsDownloads", "eq", 1, "L1"),
+    RegistryRule("18.10.15.4", "Do not show feedback notifications",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DataCollection", "DoNotShowFeedbackNotifications", "eq", 1, "L1"),
+    RegistryRule("18.10.15.5", "Enable OneSettings Auditing",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DataCollection", "EnableOneSettingsAuditing", "eq", 1, "L1"),
+    RegistryRule("18.10.15.6", "Limit Diagnostic Log Collection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DataCollection", "LimitDiagnosticLogCollection", "eq", 1, "L1"),
+    RegistryRule("18.10.15.7", "Limit Dump Collection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DataCollection", "LimitDumpCollection", "eq", 1, "L1"),
+    RegistryRule("18.10.15.8", "Toggle user control over Insider builds",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\PreviewBuilds", "AllowBuildPreview", "eq", 0, "L1"),
+    RegistryRule("18.10.16.1", "Download Mode",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\DeliveryOptimization", "DODownloadMode", "ne", 3, "L1"),
+    RegistryRule("18.10.17.1", "Enable App Installer",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\AppInstaller", "EnableAppInstaller", "eq", 0, "L1"),
+    RegistryRule("18.10.17.2", "Enable App Installer Experimental Features",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\AppInstaller", "EnableExperimentalFeatures", "eq", 0, "L1"),
+    RegistryRule("18.10.17.3", "Enable App Installer Hash Override",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\AppInstaller", "EnableHashOverride", "eq", 0, "L1"),
+    RegistryRule("18.10.17.4", "Enable App Installer ms-appinstaller protocol",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\AppInstaller", "EnableMSAppInstallerProtocol", "eq", 0, "L1"),
+    RegistryRule("18.10.25.1.1", "Control Event Log behavior when the log file reaches its maximum size",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\EventLog\Application", "Retention", "eq", "0", "L1"),
+    RegistryRule("18.10.25.1.2", "Specify the maximum log file size (KB)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\EventLog\Application", "MaxSize", "ge", 32768, "L1"),
+    RegistryRule("18.10.25.2.1", "Control Event Log behavior when the log file reaches its maximum size",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\EventLog\Security", "Retention", "eq", "0", "L1"),
+    RegistryRule("18.10.25.2.2", "Specify the maximum log file size (KB)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\EventLog\Security", "MaxSize", "ge", 196608, "L1"),
+    RegistryRule("18.10.25.3.1", "Control Event Log behavior when the log file reaches its maximum size",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\EventLog\Setup", "Retention", "eq", "0", "L1"),
+    RegistryRule("18.10.25.3.2", "Specify the maximum log file size (KB)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\EventLog\Setup", "MaxSize", "ge", 32768, "L1"),
+    RegistryRule("18.10.25.4.1", "Control Event Log behavior when the log file reaches its maximum size",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\EventLog\System", "Retention", "eq", "0", "L1"),
+    RegistryRule("18.10.25.4.2", "Specify the maximum log file size (KB)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\EventLog\System", "MaxSize", "ge", 32768, "L1"),
+    RegistryRule("18.10.28.2", "Turn off account-based insights, recent, favorite, and recommended files in File Explorer",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Explorer", "DisableGraphRecentItems", "eq", 1, "L1"),
+    RegistryRule("18.10.28.3", "Turn off Data Execution Prevention for Explorer",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Explorer", "NoDataExecutionPrevention", "eq", 0, "L1"),
+    RegistryRule("18.10.28.4", "Turn off heap termination on corruption",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Explorer", "NoHeapTerminationOnCorruption", "eq", 0, "L1"),
+    RegistryRule("18.10.28.5", "Turn off shell protocol protected mode",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "PreXPSP2ShellProtocolBehavior", "eq", 0, "L1"),
+    RegistryRule("18.10.36.1", "Turn off location",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\LocationAndSensors", "DisableLocation", "eq", 1, "L2"),
+    RegistryRule("18.10.40.1", "Allow Message Service Cloud Sync",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Messaging", "AllowMessageSync", "eq", 0, "L2"),
+    RegistryRule("18.10.41.1", "Block all consumer Microsoft account user authentication",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\MicrosoftAccount", "DisableUserAuth", "eq", 1, "L1"),
+    RegistryRule("18.10.42.5.1", "Configure local setting override for reporting to Microsoft MAPS",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Spynet", "LocalSettingOverrideSpynetReporting", "eq", 0, "L2"),
+    RegistryRule("18.10.42.5.2", "Join Microsoft MAPS",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Spynet", "SpynetReporting", "eq", 0, "L2"),
+    RegistryRule("18.10.42.6.1.1", "Configure Attack Surface Reduction rules",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Windows Defender Exploit Guard\ASR", "ExploitGuard_ASR_Rules", "eq", 1, "L1"),
+    RegistryRule("18.10.42.6.3.1", "Prevent users and apps from accessing dangerous websites",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Windows Defender Exploit Guard\Network Protection", "EnableNetworkProtection", "eq", 1, "L1"),
+    RegistryRule("18.10.42.7.1", "Enable file hash computation feature",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\MpEngine", "EnableFileHashComputation", "eq", 1, "L1"),
+    RegistryRule("18.10.42.10.1", "Scan all downloaded files and attachments",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Real-Time Protection", "DisableIOAVProtection", "eq", 0, "L1"),
+    RegistryRule("18.10.42.10.2", "Turn off real-time protection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Real-Time Protection", "DisableRealtimeMonitoring", "eq", 0, "L1"),
+    RegistryRule("18.10.42.10.3", "Turn on behavior monitoring",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Real-Time Protection", "DisableBehaviorMonitoring", "eq", 0, "L1"),
+    RegistryRule("18.10.42.10.4", "Turn on script scanning",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Real-Time Protection", "DisableScriptScanning", "eq", 0, "L1"),
+    RegistryRule("18.10.42.12.1", "Configure Watson events",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Reporting", "DisableGenericRePorts", "eq", 1, "L1"),
+    RegistryRule("18.10.42.13.1", "Scan packed executables",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Scan", "DisablePackedExeScanning", "eq", 0, "L1"),
+    RegistryRule("18.10.42.13.2", "Scan removable drives",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Scan", "DisableRemovableDriveScanning", "eq", 0, "L1"),
+    RegistryRule("18.10.42.13.3", "Turn on e-mail scanning",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender\Scan", "DisableEmailScanning", "eq", 0, "L1"),
+    RegistryRule("18.10.42.16", "Configure detection for potentially unwanted applications",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender", "PUAProtection", "eq", 1, "L1"),
+    RegistryRule("18.10.42.17", "Turn off Microsoft Defender AntiVirus",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender", "DisableAntiSpyware", "eq", 0, "L1"),
+    RegistryRule("18.10.43.1", "Allow auditing events in Microsoft Defender Application Guard",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\AppHVSI", "AuditApplicationGuard", "eq", 1, "L1"),
+    RegistryRule("18.10.43.2", "Allow camera and microphone access in Microsoft Defender Application Guard",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\AppHVSI", "AllowCameraMicrophoneRedirection", "eq", 0, "L1"),
+    RegistryRule("18.10.43.3", "Allow data persistence for Microsoft Defender Application Guard",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\AppHVSI", "AllowPersistence", "eq", 0, "L1"),
+    RegistryRule("18.10.43.4", "Allow files to download and save to the host operating system from Microsoft Defender Application Guard",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\AppHVSI", "SaveFilesToHost", "eq", 0, "L1"),
+    RegistryRule("18.10.43.5", "Configure Microsoft Defender Application Guard clipboard settings: Clipboard behavior setting",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\AppHVSI", "AppHVSIClipboardSettings", "eq", 1, "L1"),
+    RegistryRule("18.10.43.6", "Turn on Microsoft Defender Application Guard in Managed Mode",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\AppHVSI", "AllowAppHVSI_ProviderSet", "eq", 1, "L1"),
+    RegistryRule("18.10.49.1", "Enable news and interests on the taskbar",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Feeds", "EnableFeeds", "eq", 0, "L1"),
+    RegistryRule("18.10.50.1", "Prevent the usage of OneDrive for file storage",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\OneDrive", "DisableFileSyncNGSC", "eq", 1, "L1"),
+    RegistryRule("18.10.55.1", "Turn off Push To Install service",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\PushToInstall", "DisablePushToInstall", "eq", 1, "L1"),
+    RegistryRule("18.10.56.2.2", "Disable Cloud Clipboard integration for server-to-client data transfer",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services\Client", "DisableCloudClipboardIntegration", "eq", 1, "L1"),
+    RegistryRule("18.10.56.2.3", "Do not allow passwords to be saved",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "DisablePasswordSaving", "eq", 1, "L1"),
+    RegistryRule("18.10.56.3.2.1", "Allow users to connect remotely by using Remote Desktop Services",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fDenyTSConnections", "eq", 1, "L1"),
+    RegistryRule("18.10.56.3.3.1", "Allow UI Automation redirection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "EnableUiaRedirection", "eq", 0, "L1"),
+    RegistryRule("18.10.56.3.3.2", "Do not allow COM port redirection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fDisableCcm", "eq", 1, "L2"),
+    RegistryRule("18.10.56.3.3.3", "Do not allow drive redirection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fDisableCdm", "eq", 1, "L1"),
+    RegistryRule("18.10.56.3.3.4", "Do not allow location redirection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fDisableLocationRedir", "eq", 1, "L2"),
+    RegistryRule("18.10.56.3.3.5", "Do not allow LPT port redirection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fDisableLPT", "eq", 1, "L2"),
+    RegistryRule("18.10.56.3.3.6", "Do not allow supported Plug and Play device redirection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fDisablePNPRedir", "eq", 1, "L2"),
+    RegistryRule("18.10.56.3.3.7", "Do not allow WebAuthn redirection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fDisableWebAuthn", "eq", 1, "L1"),
+    RegistryRule("18.10.56.3.9.1", "Always prompt for password upon connection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fPromptForPassword", "eq", 1, "L1"),
+    RegistryRule("18.10.56.3.9.2", "Require secure RPC communication",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "fEncryptRPCTraffic", "eq", 1, "L1"),
+    RegistryRule("18.10.56.3.9.3", "Require use of specific security layer for RDP connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "SecurityLayer", "eq", 2, "L1"),
+    RegistryRule("18.10.56.3.9.4", "Require user authentication for remote connections by using Network Level Authentication",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "UserAuthentication", "eq", 1, "L1"),
+    RegistryRule("18.10.56.3.9.5", "Set client connection encryption level",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "MinEncryptionLevel", "eq", 3, "L1"),
+    RegistryRule("18.10.56.3.10.1", "Set time limit for active but idle Remote Desktop Services sessions",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "MaxIdleTime", "range", (1, 900000), "L2"),
+    RegistryRule("18.10.56.3.10.2", "Set time limit for disconnected sessions",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "MaxDisconnectionTime", "eq", 60000, "L2"),
+    RegistryRule("18.10.56.3.11.1", "Do not delete temp folders upon exit",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\Terminal Services", "DeleteTempDirsOnExit", "eq", 0, "L1"),
+    RegistryRule("18.10.57.1", "Prevent downloading of enclosures",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Internet Explorer\Feeds", "DisableEnclosureDownload", "eq", 1, "L1"),
+    RegistryRule("18.10.58.2", "Allow Cloud Search",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Search", "AllowCloudSearch", "eq", 0, "L1"),
+    RegistryRule("18.10.58.3", "Allow Cortana",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Search", "AllowCortana", "eq", 0, "L1"),
+    RegistryRule("18.10.58.4", "Allow Cortana above lock screen",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Search", "AllowCortanaAboveLock", "eq", 0, "L1"),
+    RegistryRule("18.10.58.5", "Allow indexing of encrypted files",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Search", "AllowIndexingEncryptedStoresOrItems", "eq", 0, "L1"),
+    RegistryRule("18.10.58.6", "Allow search and Cortana to use location",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Search", "AllowSearchToUseLocation", "eq", 0, "L1"),
+    RegistryRule("18.10.58.7", "Allow search highlights",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Windows Search", "EnableDynamicContentInWSB", "eq", 0, "L1"),
+    RegistryRule("18.10.62.1", "Turn off KMS Client Online AVS Validation",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows NT\CurrentVersion\Software Protection Platform", "NoGenTicket", "eq", 1, "L2"),
+    RegistryRule("18.10.65.1", "Disable all apps from Microsoft Store",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsStore", "DisableStoreApps", "eq", 1, "L2"),
+    RegistryRule("18.10.65.2", "Only display the private store within the Microsoft Store",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsStore", "RequirePrivateStoreOnly", "eq", 1, "L2"),
+    RegistryRule("18.10.65.3", "Turn off Automatic Download and Install of updates",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsStore", "AutoDownload", "eq", 4, "L1"),
+    RegistryRule("18.10.65.4", "Turn off the offer to update to the latest version of Windows",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsStore", "DisableOSUpgrade", "eq", 1, "L2"),
+    RegistryRule("18.10.65.5", "Turn off the Store application",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsStore", "RemoveWindowsStore", "eq", 1, "L2"),
+    RegistryRule("18.10.71.1", "Allow widgets",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Dsh", "AllowNewsAndInterests", "eq", 0, "L1"),
+    RegistryRule("18.10.75.1.1", "Automatic Data Collection",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WTDS\Components", "CaptureThreatWindow", "eq", 1, "L1"),
+    RegistryRule("18.10.75.1.2", "Notify Malicious",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WTDS\Components", "NotifyMalicious", "eq", 1, "L1"),
+    RegistryRule("18.10.75.1.3", "Notify Password Reuse",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WTDS\Components", "NotifyPasswordReuse", "eq", 1, "L1"),
+    RegistryRule("18.10.75.1.4", "Notify Unsafe App",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WTDS\Components", "NotifyUnsafeApp", "eq", 1, "L1"),
+    RegistryRule("18.10.75.1.5", "Service Enabled",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WTDS\Components", "ServiceEnabled", "eq", 1, "L1"),
+    RegistryRule("18.10.77.1", "Windows Game Recording and Broadcasting",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\GameDVR", "AllowGameDVR", "eq", 0, "L1"),
+    RegistryRule("18.10.78.1", "ESS avec périphériques pris en charge",
+                 HKLM, r"SOFTWARE\Microsoft\Policies\PassportForWork\Biometrics", "EnableESSwithSupportedPeripherals", "eq", 1, "L1"),
+    RegistryRule("18.10.79.1", "Suggestions d'applications dans Windows Ink Workspace",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsInkWorkspace", "AllowSuggestedAppsInWindowsInkWorkspace", "eq", 0, "L2"),
+    RegistryRule("18.10.79.2", "Allow Windows Ink Workspace",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsInkWorkspace", "AllowWindowsInkWorkspace", "in", [0, 1], "L1"),
+    RegistryRule("18.10.80.1", "Allow user control over installs",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Installer", "EnableUserControl", "eq", 0, "L1"),
+    RegistryRule("18.10.80.2", "Always install with elevated privileges",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Installer", "AlwaysInstallElevated", "eq", 0, "L1"),
+    RegistryRule("18.10.80.3", "Prevent Internet Explorer security prompt for Windows Installer scripts",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Installer", "SafeForScripting", "eq", 0, "L1"),
+    RegistryRule("18.10.81.1", "Enable MPR notifications for the system",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "EnableMPR", "eq", 0, "L1"),
+    RegistryRule("18.10.81.2", "Sign-in and lock last interactive user automatically after a restart",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "DisableAutomaticRestartSignOn", "eq", 1, "L1"),
+    RegistryRule("18.10.86.1", "Turn on PowerShell Script Block Logging",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\PowerShell\ScriptBlockLogging", "EnableScriptBlockLogging", "eq", 1, "L1"),
+    RegistryRule("18.10.86.2", "Turn on PowerShell Transcription",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\PowerShell\Transcription", "EnableTranscripting", "eq", 1, "L1"),
+    RegistryRule("18.10.88.1.1", "Allow Basic authentication",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WinRM\Client", "AllowBasic", "eq", 0, "L1"),
+    RegistryRule("18.10.88.1.2", "Allow unencrypted traffic",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WinRM\Client", "AllowUnencryptedTraffic", "eq", 0, "L1"),
+    RegistryRule("18.10.88.1.3", "Disallow Digest authentication",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WinRM\Client", "AllowDigest", "eq", 0, "L1"),
+    RegistryRule("18.10.88.2.1", "Allow Basic authentication (WinRM Service)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WinRM\Service", "AllowBasic", "eq", 0, "L1"),
+    RegistryRule("18.10.88.2.2", "Allow remote server management through WinRM",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WinRM\Service", "AllowAutoConfig", "eq", 0, "L2"),
+    RegistryRule("18.10.88.2.3", "Allow unencrypted traffic (WinRM Service)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WinRM\Service", "AllowUnencryptedTraffic", "eq", 0, "L1"),
+    RegistryRule("18.10.88.2.4", "Disallow WinRM from storing RunAs credentials",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WinRM\Service", "DisableRunAs", "eq", 1, "L1"),
+    RegistryRule("18.10.89.1", "Allow Remote Shell Access",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WinRM\Service\WinRS", "AllowRemoteShellAccess", "eq", 0, "L2"),
+    RegistryRule("18.10.90.1", "Allow clipboard sharing with Windows Sandbox",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Sandbox", "AllowClipboardRedirection", "eq", 0, "L1"),
+    RegistryRule("18.10.90.2", "Allow networking in Windows Sandbox",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\Sandbox", "AllowNetworking", "eq", 0, "L1"),
+    RegistryRule("18.10.91.2.1", "Prevent users from modifying settings",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows Defender Security Center\App and Browser protection", "DisallowExploitProtectionOverride", "eq", 1, "L1"),
+    RegistryRule("18.10.92.1.1", "No auto-restart with logged on users",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate\AU", "NoAutoRebootWithLoggedOnUsers", "eq", 0, "L1"),
+    RegistryRule("18.10.92.2.1", "Configure Automatic Updates",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate\AU", "NoAutoUpdate", "eq", 0, "L1"),
+    RegistryRule("18.10.92.2.2", "Configure Automatic Updates: Scheduled install day",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate\AU", "ScheduledInstallDay", "eq", 0, "L1"),
+    RegistryRule("18.10.92.2.3", "Enable features introduced via servicing that are off by default",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "AllowTemporaryEnterpriseFeatureControl", "eq", 0, "L1"),
+    RegistryRule("18.10.92.2.4", "Remove access to 'Pause updates' feature",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "SetDisablePauseUXAccess", "eq", 1, "L1"),
+    RegistryRule("18.10.92.4.1", "Manage preview builds",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "ManagePreviewBuildsPolicyValue", "eq", 1, "L1"),
+    RegistryRule("18.10.92.4.4", "Enable optional updates",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate", "AllowOptionalContent", "eq", 0, "L1"),
+
+    # Section 19 : Administrative Templates (User)
+    RegistryRule("19.5.1.1", "Turn off toast notifications on the lock screen",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Windows\CurrentVersion\PushNotifications", "NoToastApplicationNotificationOnLockScreen", "eq", 1, "L1"),
+    RegistryRule("19.6.6.1.1", "Turn off Help Experience Improvement Program",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Assistance\Client\1.0", "NoImplicitFeedback", "eq", 1, "L2"),
+    RegistryRule("19.7.5.1", "Do not preserve zone information in file attachments",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Attachments", "SaveZoneInformation", "eq", 2, "L1"),
+    RegistryRule("19.7.5.2", "Notify antivirus programs when opening attachments",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Attachments", "ScanWithAntiVirus", "eq", 3, "L1"),
+    RegistryRule("19.7.8.1", "Configure Windows spotlight on lock screen",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Windows\CloudContent", "ConfigureWindowsSpotlight", "eq", 2, "L2"),
+    RegistryRule("19.7.8.2", "Do not suggest third-party content in Windows spotlight",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Windows\CloudContent", "DisableThirdPartySuggestions", "eq", 1, "L1"),
+    RegistryRule("19.7.8.3", "Do not use diagnostic data for tailored experiences",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Windows\CloudContent", "DisableTailoredExperiencesWithDiagnosticData", "eq", 1, "L2"),
+    RegistryRule("19.7.8.4", "Turn off all Windows spotlight features",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Windows\CloudContent", "DisableWindowsSpotlightFeatures", "eq", 1, "L2"),
+    RegistryRule("19.7.8.5", "Turn off Spotlight collection on Desktop",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Windows\CloudContent", "DisableSpotlightCollectionOnDesktop", "eq", 1, "L1"),
+    RegistryRule("19.7.26.1", "Prevent users from sharing files within their profile",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "NoInplaceSharing", "eq", 1, "L1"),
+    RegistryRule("19.7.38.1", "Turn off Windows Copilot",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Windows\WindowsCopilot", "TurnOffWindowsCopilot", "eq", 1, "L1"),
+    RegistryRule("19.7.42.1", "Always install with elevated privileges",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\Windows\Installer", "AlwaysInstallElevated", "eq", 0, "L1"),
+    RegistryRule("19.7.44.2.1", "Prevent Codec Download",
+                 HKU, r"S-1-5-21-1234567890-123456789-1234567890\SOFTWARE\Policies\Microsoft\WindowsMediaPlayer", "PreventCodecDownload", "eq", 1, "L2"),
+]
+
+
+# Fonctions de contrôle de la section (politique de sécurité, audit et contrôles composés)
+CHECK_FUNCTIONS = [
+    check_mapper_io_driver, # Exécuter le contrôle 18.6.9.1
+    check_responder_driver, # Exécuter le contrôle 18.6.9.2
+    check_hardened_unc_paths, # Exécuter le contrôle 18.6.14.1
+    check_wireless_settings_windows_connect_now, # Exécuter le contrôle 18.6.20.1
+    check_prevent_device_installation_ieee1394,   # Contrôle 18.9.7.1.5
+    check_turn_off_windows_error_reporting,   # Contrôle 18.9.20.1.14
+    check_support_device_authentication_using_certificate,   # Contrôle 18.9.23.1
+    check_asr_rules,  # Contrôle 18.10.42.6.1.2
+    check_defender_smartscreen,   # Contrôle 18.10.75.2.1
+    check_select_when_preview_builds_and_feature_updates_are_received,   # Contrôle 18.10.92.4.2
+    check_select_when_quality_updates_are_received,   # Contrôle 18.10.92.4.3
+]
@@ -0,0 +1,294 @@
+"""
+Section 17 : Advanced Audit Policy Configuration (sous-catégories d'audit).
+"""
+from ..core import (
+    AUDIT_FAILURE, AUDIT_SUCCESS, AUDIT_SUCCESS_AND_FAILURE, audit_policy_result, compliance_check,
+)
+
+
+@compliance_check("17.1.1", "Audit Credential Validation", "L1", requires=[("auditpol", "Credential Validation")])
+# Contrôle 17.1.1 : Vérifier la politique "Audit Credential Validation" via auditpol
+def check_audit_credential_validation():
+    """
+    Vérifie si la politique 'Audit Credential Validation' est configurée à 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Credential Validation", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.2.1", "Audit Application Group Management", "L1",
+                  requires=[("auditpol", "Application Group Management")])
+# Contrôle 17.2.1 : Vérifier la politique "Audit Application Group Management" via auditpol
+def check_audit_application_group_management():
+    """
+    Vérifie si la politique 'Audit Application Group Management' est configurée à 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Application Group Management", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.2.2", "Audit Security Group Management", "L1",
+                  requires=[("auditpol", "Security Group Management")])
+# Contrôle 17.2.2 : Vérifier la politique "Audit Security Group Management" via auditpol
+def check_audit_security_group_management():
+    """
+    Vérifie si la politique 'Audit Security Group Management' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Security Group Management", AUDIT_SUCCESS)
+
+
+@compliance_check("17.2.3", "Audit User Account Management", "L1", requires=[("auditpol", "User Account Management")])
+# Contrôle 17.2.3 : Vérifier la politique "Audit User Account Management" via auditpol
+def check_audit_user_account_management():
+    """
+    Vérifie si la politique 'Audit User Account Management' est configurée à 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("User Account Management", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.3.1", "Audit PNP Activity", "L1", requires=[("auditpol", "PNP Activity")])
+# Contrôle 17.3.1 : Vérifier la politique "Audit PNP Activity" via auditpol
+def check_audit_pnp_activity():
+    """
+    Vérifie si la politique 'Audit PNP Activity' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("PNP Activity", AUDIT_SUCCESS)
+
+
+@compliance_check("17.3.2", "Audit Process Creation", "L1", requires=[("auditpol", "Process Creation")])
+# Contrôle 17.3.2 : Vérifier la politique "Audit Process Creation" via auditpol
+def check_audit_process_creation():
+    """
+    Vérifie si la politique 'Audit Process Creation' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Process Creation", AUDIT_SUCCESS)
+
+
+@compliance_check("17.5.1", "Audit Account Lockout", "L1", requires=[("auditpol", "Account Lockout")])
+# Contrôle 17.5.1 : Vérifier la politique "Audit Account Lockout" via auditpol
+def check_audit_account_lockout():
+    """
+    Vérifie si la politique 'Audit Account Lockout' est configurée pour inclure 'Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Account Lockout", AUDIT_FAILURE)
+
+
+@compliance_check("17.5.2", "Audit Group Membership", "L1", requires=[("auditpol", "Group Membership")])
+# Contrôle 17.5.2 : Vérifier la politique "Audit Group Membership" via auditpol
+def check_audit_group_membership():
+    """
+    Vérifie si la politique 'Audit Group Membership' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Group Membership", AUDIT_SUCCESS)
+
+
+@compliance_check("17.5.3", "Audit Logoff", "L1", requires=[("auditpol", "Logoff")])
+# Contrôle 17.5.3 : Vérifier la politique "Audit Logoff" via auditpol
+def check_audit_logoff():
+    """
+    Vérifie si la politique 'Audit Logoff' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Logoff", AUDIT_SUCCESS)
+
+
+@compliance_check("17.5.4", "Audit Logon", "L1", requires=[("auditpol", "Logon")])
+# Contrôle 17.5.4 : Vérifier la politique "Audit Logon" via auditpol
+def check_audit_logon():
+    """
+    Vérifie si la politique 'Audit Logon' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Logon", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.5.5", "Audit Other Logon/Logoff Events", "L1",
+                  requires=[("auditpol", "Other Logon/Logoff Events")])
+# Contrôle 17.5.5 : Vérifier la politique "Audit Other Logon/Logoff Events" via auditpol
+def check_audit_other_logon_logoff_events():
+    """
+    Vérifie si la politique 'Audit Other Logon/Logoff Events' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Other Logon/Logoff Events", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.5.6", "Audit Special Logon", "L1", requires=[("auditpol", "Special Logon")])
+# Contrôle 17.5.6 : Vérifier la politique "Audit Special Logon" via auditpol
+def check_audit_special_logon():
+    """
+    Vérifie si la politique 'Audit Special Logon' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Special Logon", AUDIT_SUCCESS)
+
+
+@compliance_check("17.6.1", "Audit Detailed File Share", "L1", requires=[("auditpol", "Detailed File Share")])
+# Contrôle 17.6.1 : Vérifier la politique "Audit Detailed File Share" via auditpol
+def check_audit_detailed_file_share():
+    """
+    Vérifie si la politique 'Audit Detailed File Share' est configurée pour inclure 'Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Detailed File Share", AUDIT_FAILURE)
+
+
+@compliance_check("17.6.2", "Audit File Share", "L1", requires=[("auditpol", "File Share")])
+# Contrôle 17.6.2 : Vérifier la politique "Audit File Share" via auditpol
+def check_audit_file_share():
+    """
+    Vérifie si la politique 'Audit File Share' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("File Share", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.6.3", "Audit Other Object Access Events", "L1",
+                  requires=[("auditpol", "Other Object Access Events")])
+# Contrôle 17.6.3 : Vérifier la politique "Audit Other Object Access Events" via auditpol
+def check_audit_other_object_access_events():
+    """
+    Vérifie si la politique 'Audit Other Object Access Events' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Other Object Access Events", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.6.4", "Audit Removable Storage", "L1", requires=[("auditpol", "Removable Storage")])
+# Contrôle 17.6.4 : Vérifier la politique "Audit Removable Storage" via auditpol
+def check_audit_removable_storage():
+    """
+    Vérifie si la politique 'Audit Removable Storage' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Removable Storage", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.7.1", "Audit Audit Policy Change", "L1", requires=[("auditpol", "Audit Policy Change")])
+# Contrôle 17.7.1 : Vérifier la politique "Audit Audit Policy Change" via auditpol
+def check_audit_audit_policy_change():
+    """
+    Vérifie si la politique 'Audit Audit Policy Change' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Audit Policy Change", AUDIT_SUCCESS)
+
+
+@compliance_check("17.7.2", "Audit Authentication Policy Change", "L1",
+                  requires=[("auditpol", "Authentication Policy Change")])
+# Contrôle 17.7.2 : Vérifier la politique "Audit Authentication Policy Change" via auditpol
+def check_audit_authentication_policy_change():
+    """
+    Vérifie si la politique 'Audit Authentication Policy Change' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Authentication Policy Change", AUDIT_SUCCESS)
+
+
+@compliance_check("17.7.3", "Audit Authorization Policy Change", "L1",
+                  requires=[("auditpol", "Authorization Policy Change")])
+# Contrôle 17.7.3 : Vérifier la politique "Audit Authorization Policy Change" via auditpol
+def check_audit_authorization_policy_change():
+    """
+    Vérifie si la politique 'Audit Authorization Policy Change' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Authorization Policy Change", AUDIT_SUCCESS)
+
+
+@compliance_check("17.7.4", "Audit MPSSVC Rule-Level Policy Change", "L1",
+                  requires=[("auditpol", "MPSSVC Rule-Level Policy Change")])
+# Contrôle 17.7.4 : Vérifier la politique "Audit MPSSVC Rule-Level Policy Change" via auditpol
+def check_audit_mpssvc_rule_level_policy_change():
+    """
+    Vérifie si la politique 'Audit MPSSVC Rule-Level Policy Change' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("MPSSVC Rule-Level Policy Change", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.7.5", "Audit Other Policy Change Events", "L1",
+                  requires=[("auditpol", "Other Policy Change Events")])
+# Contrôle 17.7.5 : Vérifier la politique "Audit Other Policy Change Events" via auditpol
+def check_audit_other_policy_change_events():
+    """
+    Vérifie si la politique 'Audit Other Policy Change Events' est configurée pour inclure 'Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Other Policy Change Events", AUDIT_FAILURE)
+
+
+@compliance_check("17.8.1", "Audit Sensitive Privilege Use", "L1", requires=[("auditpol", "Sensitive Privilege Use")])
+# Contrôle 17.8.1 : Vérifier la politique "Audit Sensitive Privilege Use" via auditpol
+def check_audit_sensitive_privilege_use():
+    """
+    Vérifie si la politique 'Audit Sensitive Privilege Use' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Sensitive Privilege Use", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.9.1", "Audit IPsec Driver", "L1", requires=[("auditpol", "IPsec Driver")])
+# Contrôle 17.9.1 : Vérifier la politique "Audit IPsec Driver" via auditpol
+def check_audit_ipsec_driver():
+    """
+    Vérifie si la politique 'Audit IPsec Driver' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("IPsec Driver", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.9.2", "Audit Other System Events", "L1", requires=[("auditpol", "Other System Events")])
+# Contrôle 17.9.2 : Vérifier la politique "Audit Other System Events" via auditpol
+def check_audit_other_system_events():
+    """
+    Vérifie si la politique 'Audit Other System Events' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Other System Events", AUDIT_SUCCESS_AND_FAILURE)
+
+
+@compliance_check("17.9.3", "Audit Security State Change", "L1", requires=[("auditpol", "Security State Change")])
+# Contrôle 17.9.3 : Vérifier la politique "Audit Security State Change" via auditpol
+def check_audit_security_state_change():
+    """
+    Vérifie si la politique 'Audit Security State Change' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Security State Change", AUDIT_SUCCESS)
+
+
+@compliance_check("17.9.4", "Audit Security System Extension", "L1",
+                  requires=[("auditpol", "Security System Extension")])
+# Contrôle 17.9.4 : Vérifier la politique "Audit Security System Extension" via auditpol
+def check_audit_security_system_extension():
+    """
+    Vérifie si la politique 'Audit Security System Extension' est configurée pour inclure 'Success' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("Security System Extension", AUDIT_SUCCESS)
+
+
+@compliance_check("17.9.5", "Audit System Integrity", "L1", requires=[("auditpol", "System Integrity")])
+# Contrôle 17.9.5 : Vérifier la politique "Audit System Integrity" via auditpol
+def check_audit_system_integrity():
+    """
+    Vérifie si la politique 'Audit System Integrity' est configurée pour inclure 'Success and Failure' d'après l'export auditpol partagé.
+    """
+    return audit_policy_result("System Integrity", AUDIT_SUCCESS_AND_FAILURE)
+
+
+# Aucune règle de registre dans cette section
+REGISTRY_RULES = []
+
+
+# Fonctions de contrôle de la section (politique de sécurité, audit et contrôles composés)
+CHECK_FUNCTIONS = [
+    check_audit_credential_validation,   # Contrôle 17.1.1
+    check_audit_application_group_management,   # Contrôle 17.2.1
+    check_audit_security_group_management,   # Contrôle 17.2.2
+    check_audit_user_account_management,   # Contrôle 17.2.3
+    check_audit_pnp_activity,   # Contrôle 17.3.1
+    check_audit_process_creation,   # Contrôle 17.3.2
+    check_audit_account_lockout,   # Contrôle 17.5.1
+    check_audit_group_membership,   # Contrôle 17.5.2
+    check_audit_logoff,   # Contrôle 17.5.3
+    check_audit_logon,   # Contrôle 17.5.4
+    check_audit_other_logon_logoff_events,   # Contrôle 17.5.5
+    check_audit_special_logon,   # Contrôle 17.5.6
+    check_audit_detailed_file_share,   # Contrôle 17.6.1
+    check_audit_file_share,   # Contrôle 17.6.2
+    check_audit_other_object_access_events,   # Contrôle 17.6.3
+    check_audit_removable_storage,   # Contrôle 17.6.4
+    check_audit_audit_policy_change,   # Contrôle 17.7.1
+    check_audit_authentication_policy_change,   # Contrôle 17.7.2
+    check_audit_authorization_policy_change,   # Contrôle 17.7.3
+    check_audit_mpssvc_rule_level_policy_change,   # Contrôle 17.7.4
+    check_audit_other_policy_change_events,   # Contrôle 17.7.5
+    check_audit_sensitive_privilege_use,   # Contrôle 17.8.1
+    check_audit_ipsec_driver,   # Contrôle 17.9.1
+    check_audit_other_system_events,   # Contrôle 17.9.2
+    check_audit_security_state_change,   # Contrôle 17.9.3
+    check_audit_security_system_extension,   # Contrôle 17.9.4
+    check_audit_system_integrity,   # Contrôle 17.9.5
+]
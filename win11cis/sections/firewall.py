@@ -0,0 +1,48 @@
+"""
+Section 9 : Windows Defender Firewall with Advanced Security (profils du pare-feu).
+"""
+from ..core import HKLM, RegistryRule
+
+
+# Catalogue des contrôles de registre : une ligne par recommandation CIS.
+# (identifiant, titre, ruche, clé, valeur, opérateur, attendu, niveau [, missing_ok])
+# missing_ok : une clé ou une valeur absente est conforme (valeur par défaut de Windows conforme).
+REGISTRY_RULES = [
+    # Section 9 : Windows Defender Firewall with Advanced Security
+    RegistryRule("9.2.1", "Windows Firewall: Private: Firewall state",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PrivateProfile", "EnableFirewall", "eq", 1, "L1", missing_ok=True),
+    RegistryRule("9.2.2", "Windows Firewall: Private: Inbound connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PrivateProfile", "DefaultInboundAction", "eq", 1, "L1", missing_ok=True),
+    RegistryRule("9.2.3", "Windows Firewall: Private: Settings: Display a notification",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PrivateProfile", "DisableNotifications", "eq", 1, "L1", missing_ok=True),
+    RegistryRule("9.2.4", "Windows Firewall: Private: Logging: Name",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PrivateProfile\Logging", "LogFilePath", "eq", "%SystemRoot%\\System32\\logfiles\\firewall\\privatefw.log", "L1"),
+    RegistryRule("9.2.5", "Windows Firewall: Private: Logging: Size limit (KB)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PrivateProfile\Logging", "LogFileSize", "ge", 16384, "L1"),
+    RegistryRule("9.2.6", "Windows Firewall: Private: Logging: Log dropped packets",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PrivateProfile\Logging", "LogDroppedPackets", "eq", 1, "L1"),
+    RegistryRule("9.2.7", "Windows Firewall: Private: Logging: Log successful connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PrivateProfile\Logging", "LogSuccessfulConnections", "eq", 1, "L1"),
+    RegistryRule("9.3.1", "Windows Firewall: Public: Firewall state",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile", "EnableFirewall", "eq", 1, "L1"),
+    RegistryRule("9.3.2", "Windows Firewall: Public: Inbound connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile", "DefaultInboundAction", "eq", 1, "L1"),
+    RegistryRule("9.3.3", "Windows Firewall: Public: Settings: Display a notification",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile", "DisableNotifications", "eq", 1, "L1"),
+    RegistryRule("9.3.4", "Windows Firewall: Public: Settings: Apply local firewall rules",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile", "AllowLocalPolicyMerge", "eq", 0, "L1"),
+    RegistryRule("9.3.5", "Windows Firewall: Public: Settings: Apply local connection security rules",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile", "AllowLocalIPsecPolicyMerge", "eq", 0, "L1"),
+    RegistryRule("9.3.6", "Windows Firewall: Public: Logging: Name",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile\Logging", "LogFilePath", "eq", "%SystemRoot%\\System32\\logfiles\\firewall\\publicfw.log", "L1"),
+    RegistryRule("9.3.7", "Windows Firewall: Public: Logging: Size limit (KB)",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile\Logging", "LogFileSize", "ge", 16384, "L1"),
+    RegistryRule("9.3.8", "Windows Firewall: Public: Logging: Log dropped packets",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile\Logging", "LogDroppedPackets", "eq", 1, "L1"),
+    RegistryRule("9.3.9", "Windows Firewall: Public: Logging: Log successful connections",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\WindowsFirewall\PublicProfile\Logging", "LogSuccessfulConnections", "eq", 1, "L1"),
+]
+
+
+# Aucune fonction de contrôle : la section ne contient que des règles du catalogue
+CHECK_FUNCTIONS = []
@@ -0,0 +1,667 @@
+"""
+Section 2 : Local Policies (attribution des droits utilisateur et options de sécurité).
+"""
+from ..core import (
+    HKLM, NO_ONE, SID_ADMINISTRATORS, SID_GUESTS, SID_LOCAL_ACCOUNT, SID_LOCAL_SERVICE, SID_NETWORK_SERVICE,
+    SID_REMOTE_DESKTOP_USERS, SID_SERVICE, SID_USERS, SID_VIRTUAL_MACHINES, SID_WDI_SERVICE_HOST,
+    SID_WINDOW_MANAGER_GROUP, compliance_check, registry_value_result, RegistryRule, user_right_result,
+)
+
+
+# Titulaires attendus des droits utilisateur (section 2.2) : ensembles de SID construits
+# une seule fois, comparés aux droits analysés depuis l'export secedit
+ADMINISTRATORS = frozenset({SID_ADMINISTRATORS})
+ADMINISTRATORS_USERS = frozenset({SID_ADMINISTRATORS, SID_USERS})
+ADMINISTRATORS_RDP_USERS = frozenset({SID_ADMINISTRATORS, SID_REMOTE_DESKTOP_USERS})
+ADMINISTRATORS_LOCAL_SERVICE = frozenset({SID_ADMINISTRATORS, SID_LOCAL_SERVICE})
+ADMINISTRATORS_LOCAL_SERVICE_USERS = frozenset({SID_ADMINISTRATORS, SID_LOCAL_SERVICE, SID_USERS})
+ADMINISTRATORS_SERVICE_ACCOUNTS = frozenset({SID_ADMINISTRATORS, SID_LOCAL_SERVICE, SID_NETWORK_SERVICE})
+ADMINISTRATORS_ALL_SERVICES = frozenset({SID_ADMINISTRATORS, SID_LOCAL_SERVICE, SID_NETWORK_SERVICE, SID_SERVICE})
+ADMINISTRATORS_VIRTUAL_MACHINES = frozenset({SID_ADMINISTRATORS, SID_VIRTUAL_MACHINES})
+ADMINISTRATORS_WINDOW_MANAGER = frozenset({SID_ADMINISTRATORS, SID_WINDOW_MANAGER_GROUP})
+ADMINISTRATORS_WDI_SERVICE_HOST = frozenset({SID_ADMINISTRATORS, SID_WDI_SERVICE_HOST})
+SERVICE_ACCOUNTS = frozenset({SID_LOCAL_SERVICE, SID_NETWORK_SERVICE})
+VIRTUAL_MACHINES = frozenset({SID_VIRTUAL_MACHINES})
+GUESTS = frozenset({SID_GUESTS})
+GUESTS_LOCAL_ACCOUNT = frozenset({SID_GUESTS, SID_LOCAL_ACCOUNT})
+
+# Chemins de registre accessibles à distance attendus (2.3.10.7 et 2.3.10.8, valeurs REG_MULTI_SZ)
+REMOTELY_ACCESSIBLE_EXACT_PATHS = [
+    "System\\CurrentControlSet\\Control\\ProductOptions",
+    "System\\CurrentControlSet\\Control\\Server Applications",
+    "SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion"
+]
+REMOTELY_ACCESSIBLE_PATHS = [
+    "System\\CurrentControlSet\\Control\\Print\\Printers",
+    "System\\CurrentControlSet\\Services\\Eventlog",
+    "Software\\Microsoft\\OLAP Server",
+    "Software\\Microsoft\\Windows NT\\CurrentVersion\\Print",
+    "Software\\Microsoft\\Windows NT\\CurrentVersion\\Windows",
+    "System\\CurrentControlSet\\Control\\ContentIndex",
+    "System\\CurrentControlSet\\Control\\Terminal Server",
+    "System\\CurrentControlSet\\Control\\Terminal Server\\UserConfig",
+    "System\\CurrentControlSet\\Control\\Terminal Server\\DefaultUserConfiguration",
+    "Software\\Microsoft\\Windows NT\\CurrentVersion\\Perflib",
+    "System\\CurrentControlSet\\Services\\SysmonLog"
+]
+
+
+@compliance_check("2.2.1", "Access Credential Manager as a trusted caller", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeTrustedCredManAccessPrivilege")])
+# Contrôle 2.2.1 : Vérifier la politique "Access Credential Manager as a trusted caller"
+def check_access_credential_manager():
+    """
+    Vérifie si la politique 'Access Credential Manager as a trusted caller' est configurée à 'No One'.
+    """
+    return user_right_result("SeTrustedCredManAccessPrivilege", "eq", NO_ONE)
+
+
+@compliance_check("2.2.2", "Access this computer from the network", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeNetworkLogonRight")])
+# Contrôle 2.2.2 : Vérifier la politique "Access this computer from the network"
+def check_access_computer_from_network():
+    """
+    Vérifie si la politique 'Access this computer from the network' est configurée à
+    'Administrators, Remote Desktop Users'.
+    """
+    return user_right_result("SeNetworkLogonRight", "eq", ADMINISTRATORS_RDP_USERS)
+
+
+@compliance_check("2.2.3", "Act as part of the operating system", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeTcbPrivilege")])
+# Contrôle 2.2.3 : Vérifier la politique "Act as part of the operating system"
+def check_act_as_part_of_os():
+    """
+    Vérifie si la politique 'Act as part of the operating system' est configurée à 'No One'.
+    """
+    return user_right_result("SeTcbPrivilege", "eq", NO_ONE)
+
+
+@compliance_check("2.2.4", "Adjust memory quotas for a process", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeIncreaseQuotaPrivilege")])
+# Contrôle 2.2.4 : Vérifier la politique "Adjust memory quotas for a process"
+def check_adjust_memory_quotas():
+    """
+    Vérifie si la politique 'Adjust memory quotas for a process' est configurée à
+    'Administrators, LOCAL SERVICE, NETWORK SERVICE'.
+    """
+    return user_right_result("SeIncreaseQuotaPrivilege", "eq", ADMINISTRATORS_SERVICE_ACCOUNTS)
+
+
+@compliance_check("2.2.5", "Allow log on locally", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeInteractiveLogonRight")])
+# Contrôle 2.2.5 : Vérifier la politique "Allow log on locally"
+def check_allow_log_on_locally():
+    """
+    Vérifie si la politique 'Allow log on locally' est configurée à 'Administrators, Users'.
+    """
+    return user_right_result("SeInteractiveLogonRight", "eq", ADMINISTRATORS_USERS)
+
+
+@compliance_check("2.2.6", "Allow log on through Remote Desktop Services", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeRemoteInteractiveLogonRight")])
+# Contrôle 2.2.6 : Vérifier la politique "Allow log on through Remote Desktop Services"
+def check_allow_log_on_remote_desktop():
+    """
+    Vérifie si la politique 'Allow log on through Remote Desktop Services' est configurée à
+    'Administrators, Remote Desktop Users'.
+    """
+    return user_right_result("SeRemoteInteractiveLogonRight", "eq", ADMINISTRATORS_RDP_USERS)
+
+
+@compliance_check("2.2.7", "Back up files and directories", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeBackupPrivilege")])
+# Contrôle 2.2.7 : Vérifier la politique "Back up files and directories"
+def check_back_up_files_and_directories():
+    """
+    Vérifie si la politique 'Back up files and directories' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeBackupPrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.8", "Change the system time", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeSystemtimePrivilege")])
+# Contrôle 2.2.8 : Vérifier la politique "Change the system time"
+def check_change_system_time():
+    """
+    Vérifie si la politique 'Change the system time' est configurée à 'Administrators, LOCAL SERVICE'.
+    """
+    return user_right_result("SeSystemtimePrivilege", "eq", ADMINISTRATORS_LOCAL_SERVICE)
+
+
+@compliance_check("2.2.9", "Change the time zone", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeTimeZonePrivilege")])
+# Contrôle 2.2.9 : Vérifier la politique "Change the time zone"
+def check_change_time_zone():
+    """
+    Vérifie si la politique 'Change the time zone' est configurée à 'Administrators, LOCAL SERVICE, Users'.
+    """
+    return user_right_result("SeTimeZonePrivilege", "eq", ADMINISTRATORS_LOCAL_SERVICE_USERS)
+
+
+@compliance_check("2.2.10", "Create a pagefile", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeCreatePagefilePrivilege")])
+# Contrôle 2.2.10 : Vérifier la politique "Create a pagefile"
+def check_create_pagefile():
+    """
+    Vérifie si la politique 'Create a pagefile' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeCreatePagefilePrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.11", "Create a token object", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeCreateTokenPrivilege")])
+# Contrôle 2.2.11 : Vérifier la politique "Create a token object"
+def check_create_token_object():
+    """
+    Vérifie si la politique 'Create a token object' est configurée à 'No One'.
+    """
+    return user_right_result("SeCreateTokenPrivilege", "eq", NO_ONE)
+
+
+@compliance_check("2.2.12", "Create global objects", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeCreateGlobalPrivilege")])
+# Contrôle 2.2.12 : Vérifier la politique "Create global objects"
+def check_create_global_objects():
+    """
+    Vérifie si la politique 'Create global objects' est configurée à
+    'Administrators, LOCAL SERVICE, NETWORK SERVICE, SERVICE'.
+    """
+    return user_right_result("SeCreateGlobalPrivilege", "eq", ADMINISTRATORS_ALL_SERVICES)
+
+
+@compliance_check("2.2.13", "Create permanent shared objects", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeCreatePermanentPrivilege")])
+# Contrôle 2.2.13 : Vérifier la politique "Create permanent shared objects"
+def check_create_permanent_shared_objects():
+    """
+    Vérifie si la politique 'Create permanent shared objects' est configurée à 'No One'.
+    """
+    return user_right_result("SeCreatePermanentPrivilege", "eq", NO_ONE)
+
+
+@compliance_check("2.2.14", "Create symbolic links", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeCreateSymbolicLinkPrivilege")])
+# Contrôle 2.2.14 : Vérifier la politique "Create symbolic links"
+def check_create_symbolic_links():
+    r"""
+    Vérifie si la politique 'Create symbolic links' est configurée à
+    'Administrators' et (si Hyper-V est installé) 'NT VIRTUAL MACHINE\Virtual Machines'.
+    """
+    return user_right_result("SeCreateSymbolicLinkPrivilege", "in",
+                             [ADMINISTRATORS, ADMINISTRATORS_VIRTUAL_MACHINES])
+
+
+@compliance_check("2.2.15", "Debug programs", "L1", requires=[("secedit", "Privilege Rights", "SeDebugPrivilege")])
+# Contrôle 2.2.15 : Vérifier la politique "Debug programs"
+def check_debug_programs():
+    """
+    Vérifie si la politique 'Debug programs' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeDebugPrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.16", "Deny access to this computer from the network", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeDenyNetworkLogonRight")])
+# Contrôle 2.2.16 : Vérifier la politique "Deny access to this computer from the network"
+def check_deny_access_to_network():
+    """
+    Vérifie si la politique 'Deny access to this computer from the network' inclut 'Guests, Local account'.
+    """
+    return user_right_result("SeDenyNetworkLogonRight", "contains_all", GUESTS_LOCAL_ACCOUNT)
+
+
+@compliance_check("2.2.17", "Deny log on as a batch job", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeDenyBatchLogonRight")])
+# Contrôle 2.2.17 : Vérifier la politique "Deny log on as a batch job"
+def check_deny_log_on_as_batch_job():
+    """
+    Vérifie si la politique 'Deny log on as a batch job' inclut 'Guests'.
+    """
+    return user_right_result("SeDenyBatchLogonRight", "contains_all", GUESTS)
+
+
+@compliance_check("2.2.18", "Deny log on as a service", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeDenyServiceLogonRight")])
+# Contrôle 2.2.18 : Vérifier la politique "Deny log on as a service"
+def check_deny_log_on_as_service():
+    """
+    Vérifie si la politique 'Deny log on as a service' inclut 'Guests'.
+    """
+    return user_right_result("SeDenyServiceLogonRight", "contains_all", GUESTS)
+
+
+@compliance_check("2.2.19", "Deny log on locally", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeDenyInteractiveLogonRight")])
+# Contrôle 2.2.19 : Vérifier la politique "Deny log on locally"
+def check_deny_log_on_locally():
+    """
+    Vérifie si la politique 'Deny log on locally' inclut 'Guests'.
+    """
+    return user_right_result("SeDenyInteractiveLogonRight", "contains_all", GUESTS)
+
+
+@compliance_check("2.2.20", "Deny log on through Remote Desktop Services", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeDenyRemoteInteractiveLogonRight")])
+# Contrôle 2.2.20 : Vérifier la politique "Deny log on through Remote Desktop Services"
+def check_deny_log_on_remote_desktop():
+    """
+    Vérifie si la politique 'Deny log on through Remote Desktop Services' inclut 'Guests, Local account'.
+    """
+    return user_right_result("SeDenyRemoteInteractiveLogonRight", "contains_all", GUESTS_LOCAL_ACCOUNT)
+
+
+@compliance_check("2.2.21", "Enable computer and user accounts to be trusted for delegation", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeEnableDelegationPrivilege")])
+# Contrôle 2.2.21 : Vérifier la politique "Enable computer and user accounts to be trusted for delegation"
+def check_trusted_for_delegation():
+    """
+    Vérifie si la politique 'Enable computer and user accounts to be trusted for delegation' est configurée à
+    'No One'.
+    """
+    return user_right_result("SeEnableDelegationPrivilege", "eq", NO_ONE)
+
+
+@compliance_check("2.2.22", "Force shutdown from a remote system", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeRemoteShutdownPrivilege")])
+# Contrôle 2.2.22 : Vérifier la politique "Force shutdown from a remote system"
+def check_force_shutdown_remote():
+    """
+    Vérifie si la politique 'Force shutdown from a remote system' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeRemoteShutdownPrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.23", "Generate security audits", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeAuditPrivilege")])
+# Contrôle 2.2.23 : Vérifier la politique "Generate security audits"
+def check_generate_security_audits():
+    """
+    Vérifie si la politique 'Generate security audits' est configurée à 'LOCAL SERVICE, NETWORK SERVICE'.
+    """
+    return user_right_result("SeAuditPrivilege", "eq", SERVICE_ACCOUNTS)
+
+
+@compliance_check("2.2.24", "Impersonate a client after authentication", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeImpersonatePrivilege")])
+# Contrôle 2.2.24 : Vérifier la politique "Impersonate a client after authentication"
+def check_impersonate_client_after_authentication():
+    """
+    Vérifie si la politique 'Impersonate a client after authentication' est configurée à
+    'Administrators, LOCAL SERVICE, NETWORK SERVICE, SERVICE'.
+    """
+    return user_right_result("SeImpersonatePrivilege", "eq", ADMINISTRATORS_ALL_SERVICES)
+
+
+@compliance_check("2.2.25", "Increase scheduling priority", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeIncreaseBasePriorityPrivilege")])
+# Contrôle 2.2.25 : Vérifier la politique "Increase scheduling priority"
+def check_increase_scheduling_priority():
+    r"""
+    Vérifie si la politique 'Increase scheduling priority' est configurée à
+    'Administrators, Window Manager\Window Manager Group'.
+    """
+    return user_right_result("SeIncreaseBasePriorityPrivilege", "eq", ADMINISTRATORS_WINDOW_MANAGER)
+
+
+@compliance_check("2.2.26", "Load and unload device drivers", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeLoadDriverPrivilege")])
+# Contrôle 2.2.26 : Vérifier la politique "Load and unload device drivers"
+def check_load_and_unload_device_drivers():
+    """
+    Vérifie si la politique 'Load and unload device drivers' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeLoadDriverPrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.27", "Lock pages in memory", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeLockMemoryPrivilege")])
+# Contrôle 2.2.27 : Vérifier la politique "Lock pages in memory"
+def check_lock_pages_in_memory():
+    """
+    Vérifie si la politique 'Lock pages in memory' est configurée à 'No One'.
+    """
+    return user_right_result("SeLockMemoryPrivilege", "eq", NO_ONE)
+
+
+@compliance_check("2.2.28", "Log on as a batch job", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeBatchLogonRight")])
+# Contrôle 2.2.28 : Vérifier la politique "Log on as a batch job"
+def check_log_on_as_batch_job():
+    """
+    Vérifie si la politique 'Log on as a batch job' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeBatchLogonRight", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.29", "Log on as a service", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeServiceLogonRight")])
+# Contrôle 2.2.29 : Vérifier la politique "Log on as a service"
+def check_log_on_as_a_service():
+    r"""
+    Vérifie si la politique 'Log on as a service' est configurée à
+    'No One' ou (si Hyper-V est installé) 'NT VIRTUAL MACHINE\Virtual Machines'.
+    """
+    return user_right_result("SeServiceLogonRight", "in", [NO_ONE, VIRTUAL_MACHINES])
+
+
+@compliance_check("2.2.30", "Manage auditing and security log", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeSecurityPrivilege")])
+# Contrôle 2.2.30 : Vérifier la politique "Manage auditing and security log"
+def check_manage_auditing_and_security_log():
+    """
+    Vérifie si la politique 'Manage auditing and security log' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeSecurityPrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.31", "Modify an object label", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeRelabelPrivilege")])
+# Contrôle 2.2.31 : Vérifier la politique "Modify an object label"
+def check_modify_object_label():
+    """
+    Vérifie si la politique 'Modify an object label' est configurée à 'No One'.
+    """
+    return user_right_result("SeRelabelPrivilege", "eq", NO_ONE)
+
+
+@compliance_check("2.2.32", "Modify firmware environment values", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeSystemEnvironmentPrivilege")])
+# Contrôle 2.2.32 : Vérifier la politique "Modify firmware environment values"
+def check_modify_firmware_environment_values():
+    """
+    Vérifie si la politique 'Modify firmware environment values' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeSystemEnvironmentPrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.33", "Perform volume maintenance tasks", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeManageVolumePrivilege")])
+def check_perform_volume_maintenance_tasks():
+    """
+    Vérifie si la politique 'Perform volume maintenance tasks' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeManageVolumePrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.34", "Profile single process", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeProfileSingleProcessPrivilege")])
+# Contrôle 2.2.34 : Vérifier la politique "Profile single process"
+def check_profile_single_process():
+    """
+    Vérifie si la politique 'Profile single process' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeProfileSingleProcessPrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.35", "Profile system performance", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeSystemProfilePrivilege")])
+# Contrôle 2.2.35 : Vérifier la politique "Profile system performance"
+def check_profile_system_performance():
+    r"""
+    Vérifie si la politique 'Profile system performance' est configurée à
+    'Administrators, NT SERVICE\WdiServiceHost'.
+    """
+    return user_right_result("SeSystemProfilePrivilege", "eq", ADMINISTRATORS_WDI_SERVICE_HOST)
+
+
+@compliance_check("2.2.36", "Replace a process level token", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeAssignPrimaryTokenPrivilege")])
+# Contrôle 2.2.36 : Vérifier la politique "Replace a process level token"
+def check_replace_process_level_token():
+    """
+    Vérifie si la politique 'Replace a process level token' est configurée à 'LOCAL SERVICE, NETWORK SERVICE'.
+    """
+    return user_right_result("SeAssignPrimaryTokenPrivilege", "eq", SERVICE_ACCOUNTS)
+
+
+@compliance_check("2.2.37", "Restore files and directories", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeRestorePrivilege")])
+# Contrôle 2.2.37 : Vérifier la politique "Restore files and directories"
+def check_restore_files_and_directories():
+    """
+    Vérifie si la politique 'Restore files and directories' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeRestorePrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.2.38", "Shut down the system", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeShutdownPrivilege")])
+# Contrôle 2.2.38 : Vérifier la politique "Shut down the system"
+def check_shut_down_the_system():
+    """
+    Vérifie si la politique 'Shut down the system' est configurée à 'Administrators, Users'.
+    """
+    return user_right_result("SeShutdownPrivilege", "eq", ADMINISTRATORS_USERS)
+
+
+@compliance_check("2.2.39", "Take ownership of files or other objects", "L1",
+                  requires=[("secedit", "Privilege Rights", "SeTakeOwnershipPrivilege")])
+# Contrôle 2.2.39 : Vérifier la politique "Take ownership of files or other objects"
+def check_take_ownership_of_files_or_other_objects():
+    """
+    Vérifie si la politique 'Take ownership of files or other objects' est configurée à 'Administrators'.
+    """
+    return user_right_result("SeTakeOwnershipPrivilege", "eq", ADMINISTRATORS)
+
+
+@compliance_check("2.3.1.4", "Accounts: Rename administrator account", "L1",
+                  requires=[("registry", HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "LegalNoticeCaption")])
+# Contrôle 2.3.1.4 : Vérifier la politique "Rename administrator account"
+def check_rename_administrator_account():
+    r"""
+    Vérifie si la politique 'Rename administrator account' est configurée avec un nom personnalisé autre que 'Administrator' ou 'Administrateur' (en français).
+    """
+    # Le nom doit être personnalisé (différent des noms par défaut, en anglais et en français)
+    return registry_value_result(HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "LegalNoticeCaption", "not_in", ["Administrator", "Administrateur"])
+
+
+@compliance_check("2.3.7.3", "Interactive logon: Machine account lockout threshold", "BL",
+                  requires=[("registry", HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "MaxDevicePasswordFailedAttempts")])
+# Contrôle 2.3.7.3 : Vérifier la politique "Interactive logon: Machine account lockout threshold"
+def check_machine_account_lockout_threshold():
+    r"""
+    Vérifie si la politique 'Interactive logon: Machine account lockout threshold'
+    est configurée à '10 ou moins tentatives de connexion invalides, mais pas 0'.
+    """
+    # 10 tentatives ou moins, mais pas 0
+    return registry_value_result(HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "MaxDevicePasswordFailedAttempts", "range", (1, 10))
+
+
+@compliance_check("2.3.7.4", "Interactive logon: Machine inactivity limit", "L1",
+                  requires=[("registry", HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "InactivityTimeoutSecs")])
+# Contrôle 2.3.7.4 : Vérifier la politique "Interactive logon: Machine inactivity limit"
+def check_machine_inactivity_limit():
+    r"""
+    Vérifie si la politique 'Interactive logon: Machine inactivity limit'
+    est configurée à '900 ou moins secondes, mais pas 0'.
+    """
+    # 900 secondes ou moins, mais pas 0
+    return registry_value_result(HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "InactivityTimeoutSecs", "range", (1, 900))
+
+
+@compliance_check("2.3.10.7", "Network access: Remotely accessible registry paths", "L1",
+                  requires=[("registry", HKLM, r"SYSTEM\CurrentControlSet\Control\SecurePipeServers\Winreg", "AllowedExactPaths")])
+# Contrôle 2.3.10.7 : Vérifier la politique "Network access: Remotely accessible registry paths"
+def check_remotely_accessible_registry_paths():
+    r"""
+    Vérifie si la politique 'Network access: Remotely accessible registry paths' 
+    est configurée avec les chemins de registre appropriés.
+    """
+    return registry_value_result(HKLM, r"SYSTEM\CurrentControlSet\Control\SecurePipeServers\Winreg", "AllowedExactPaths", "contains_all", REMOTELY_ACCESSIBLE_EXACT_PATHS)
+
+
+@compliance_check("2.3.10.8", "Network access: Remotely accessible registry paths and sub-paths", "L1",
+                  requires=[("registry", HKLM, r"SYSTEM\CurrentControlSet\Control\SecurePipeServers\Winreg", "AllowedPaths")])
+# Contrôle 2.3.10.8 : Vérifier la politique "Network access: Remotely accessible registry paths and sub-paths"
+def check_remotely_accessible_registry_paths_and_sub_paths():
+    r"""
+    Vérifie si la politique 'Network access: Remotely accessible registry paths and sub-paths' 
+    est configurée avec les chemins de registre et sous-chemins appropriés.
+    """
+    return registry_value_result(HKLM, r"SYSTEM\CurrentControlSet\Control\SecurePipeServers\Winreg", "AllowedPaths", "contains_all", REMOTELY_ACCESSIBLE_PATHS)
+
+
+# Catalogue des contrôles de registre : une ligne par recommandation CIS.
+# (identifiant, titre, ruche, clé, valeur, opérateur, attendu, niveau [, missing_ok])
+# missing_ok : une clé ou une valeur absente est conforme (valeur par défaut de Windows conforme).
+REGISTRY_RULES = [
+    # Section 2 : Local Policies
+    RegistryRule("2.3.1.1", "Accounts: Block Microsoft accounts",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "NoConnectedUser", "eq", 3, "L1"),
+    RegistryRule("2.3.1.2", "Accounts: Guest account status",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "AccountsGuest", "eq", 0, "L1"),
+    RegistryRule("2.3.1.3", "Accounts: Limit local account use of blank passwords to console logon only",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "LimitBlankPasswordUse", "eq", 1, "L1"),
+    RegistryRule("2.3.1.5", "Accounts: Rename guest account",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "AccountsGuest", "ne", "Guest", "L1"),
+    RegistryRule("2.3.2.1", "Audit: Force audit policy subcategory settings",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "SCENoApplyLegacyAuditPolicy", "eq", 1, "L1"),
+    RegistryRule("2.3.2.2", "Audit: Shut down system immediately if unable to log security audits",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "CrashOnAuditFail", "eq", 0, "L1"),
+    RegistryRule("2.3.4.1", "Devices: Prevent users from installing printer drivers",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Print\Providers\LanMan Print Services\Servers", "AddPrinterDrivers", "eq", 1, "L1"),
+    RegistryRule("2.3.7.1", "Interactive logon: Do not require CTRL+ALT+DEL",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "DisableCAD", "eq", 0, "L1"),
+    RegistryRule("2.3.7.2", "Interactive logon: Don't display last signed-in",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "DontDisplayLastUserName", "eq", 1, "L1"),
+    RegistryRule("2.3.7.5", "Interactive logon: Message text for users attempting to log on",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "LegalNoticeText", "truthy", None, "L1"),
+    RegistryRule("2.3.7.6", "Interactive logon: Message title for users attempting to log on",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "LegalNoticeCaption", "truthy", None, "L1"),
+    RegistryRule("2.3.7.7", "Interactive logon: Prompt user to change password before expiration",
+                 HKLM, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Winlogon", "PasswordExpiryWarning", "range", (5, 14), "L1"),
+    RegistryRule("2.3.7.8", "Interactive logon: Smart card removal behavior",
+                 HKLM, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Winlogon", "ScRemoveOption", "in", [1, 2, 3], "L1"),
+    RegistryRule("2.3.8.1", "Microsoft network client: Digitally sign communications (always)",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanmanWorkstation\Parameters", "RequireSecuritySignature", "eq", 1, "L1"),
+    RegistryRule("2.3.8.2", "Microsoft network client: Digitally sign communications (if server agrees)",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanmanWorkstation\Parameters", "EnableSecuritySignature", "eq", 1, "L1"),
+    RegistryRule("2.3.8.3", "Microsoft network client: Send unencrypted password to third-party SMB servers",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanmanWorkstation\Parameters", "EnablePlainTextPassword", "eq", 0, "L1"),
+    RegistryRule("2.3.9.1", "Microsoft network server: Amount of idle time required before suspending session",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanManServer\Parameters", "AutoDisconnect", "le", 15, "L1"),
+    RegistryRule("2.3.9.2", "Microsoft network server: Digitally sign communications (always)",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanManServer\Parameters", "RequireSecuritySignature", "eq", 1, "L1"),
+    RegistryRule("2.3.9.3", "Microsoft network server: Digitally sign communications (if client agrees)",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanManServer\Parameters", "EnableSecuritySignature", "eq", 1, "L1"),
+    RegistryRule("2.3.9.4", "Microsoft network server: Disconnect clients when logon hours expire",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanManServer\Parameters", "enableforcedlogoff", "eq", 1, "L1"),
+    RegistryRule("2.3.9.5", "Microsoft network server: Server SPN target name validation level",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanManServer\Parameters", "SMBServerNameHardeningLevel", "ge", 1, "L1"),
+    RegistryRule("2.3.10.1", "Network access: Allow anonymous SID/Name translation",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "AllowAnonymousSIDNameTranslation", "eq", 0, "L1"),
+    RegistryRule("2.3.10.2", "Network access: Do not allow anonymous enumeration of SAM accounts",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "RestrictAnonymousSAM", "eq", 1, "L1"),
+    RegistryRule("2.3.10.3", "Network access: Do not allow anonymous enumeration of SAM accounts and shares",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "RestrictAnonymous", "eq", 1, "L1"),
+    RegistryRule("2.3.10.4", "Network access: Do not allow storage of passwords and credentials for network authentication",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "DisableDomainCreds", "eq", 1, "L1"),
+    RegistryRule("2.3.10.5", "Network access: Let Everyone permissions apply to anonymous users",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "EveryoneIncludesAnonymous", "eq", 0, "L1"),
+    RegistryRule("2.3.10.6", "Network access: Named Pipes that can be accessed anonymously",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanManServer\Parameters", "NullSessionPipes", "falsy", None, "L1"),
+    RegistryRule("2.3.10.9", "Network access: Restrict anonymous access to Named Pipes and Shares",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanManServer\Parameters", "RestrictNullSessAccess", "eq", 1, "L1"),
+    RegistryRule("2.3.10.10", "Network access: Restrict clients allowed to make remote calls to SAM",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "restrictremotesam", "eq", "O:BAG:BAD:(A;;RC;;;BA)", "L1"),
+    RegistryRule("2.3.10.11", "Network access: Shares that can be accessed anonymously",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LanManServer\Parameters", "NullSessionShares", "eq", [], "L1"),
+    RegistryRule("2.3.10.12", "Network access: Sharing and security model for local accounts",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "ForceGuest", "eq", 0, "L1"),
+    RegistryRule("2.3.11.1", "Network security: Allow Local System to use computer identity for NTLM",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "UseMachineId", "eq", 1, "L1"),
+    RegistryRule("2.3.11.2", "Network security: Allow LocalSystem NULL session fallback",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa\MSV1_0", "AllowNullSessionFallback", "eq", 0, "L1"),
+    RegistryRule("2.3.11.3", "Network Security: Allow PKU2U authentication requests to this computer to use online identities",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa\pku2u", "AllowOnlineID", "eq", 0, "L1"),
+    RegistryRule("2.3.11.4", "Kerberos Encryption",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System\Kerberos\Parameters", "SupportedEncryptionTypes", "eq", 2147483640, "L1"),
+    RegistryRule("2.3.11.5", "Network security: Do not store LAN Manager hash value on next password change",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "NoLMHash", "eq", 1, "L1"),
+    RegistryRule("2.3.11.6", "Network security: Force logoff when logon hours expire",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "ForceLogoffWhenLogonHoursExpire", "eq", 1, "L1"),
+    RegistryRule("2.3.11.7", "Network security: LAN Manager authentication level",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa", "LmCompatibilityLevel", "eq", 5, "L1"),
+    RegistryRule("2.3.11.8", "Network security: LDAP client signing requirements",
+                 HKLM, r"SYSTEM\CurrentControlSet\Services\LDAP", "LDAPClientIntegrity", "eq", 1, "L1"),
+    RegistryRule("2.3.11.9", "Network security: Minimum session security for NTLM SSP based (including secure RPC) clients",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa\MSV1_0", "NTLMMinClientSec", "eq", 537395200, "L1"),
+    RegistryRule("2.3.11.10", "Network security: Minimum session security for NTLM SSP based (including secure RPC) servers",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa\MSV1_0", "NTLMMinServerSec", "eq", 537395200, "L1"),
+    RegistryRule("2.3.11.11", "Network security: Restrict NTLM: Audit Incoming NTLM Traffic",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa\MSV1_0", "AuditReceivingNTLMTraffic", "eq", 2, "L1"),
+    RegistryRule("2.3.11.12", "Network security: Restrict NTLM: Outgoing NTLM traffic to remote servers",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Lsa\MSV1_0", "RestrictSendingNTLMTraffic", "in", [1, 2], "L1"),
+    RegistryRule("2.3.14.1", "System cryptography: Force strong key protection for user keys",
+                 HKLM, r"SOFTWARE\Policies\Microsoft\Cryptography", "ForceKeyProtection", "eq", 1, "L1"),
+    RegistryRule("2.3.15.1", "System objects: Require case insensitivity for non-Windows subsystems",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Session Manager\Kernel", "ObCaseInsensitive", "eq", 1, "L1"),
+    RegistryRule("2.3.15.2", "System objects: Strengthen default permissions of internal system objects",
+                 HKLM, r"SYSTEM\CurrentControlSet\Control\Session Manager", "ProtectionMode", "eq", 1, "L1"),
+    RegistryRule("2.3.17.1", "User Account Control: Admin Approval Mode for the Built-in Administrator account",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "FilterAdministratorToken", "eq", 1, "L1"),
+    RegistryRule("2.3.17.2", "User Account Control: Behavior of the elevation prompt for administrators in Admin Approval Mode",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "ConsentPromptBehaviorAdmin", "in", [1, 2], "L1"),
+    RegistryRule("2.3.17.3", "User Account Control: Behavior of the elevation prompt for standard users",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "ConsentPromptBehaviorUser", "eq", 0, "L1"),
+    RegistryRule("2.3.17.4", "User Account Control: Detect application installations and prompt for elevation",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "EnableInstallerDetection", "eq", 1, "L1"),
+    RegistryRule("2.3.17.5", "User Account Control: Only elevate UIAccess applications that are installed in secure locations",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "EnableSecureUIAccessPaths", "eq", 1, "L1"),
+    RegistryRule("2.3.17.6", "User Account Control: Run all administrators in Admin Approval Mode",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "EnableLUA", "eq", 1, "L1"),
+    RegistryRule("2.3.17.7", "User Account Control: Switch to the secure desktop when prompting for elevation",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "PromptOnSecureDesktop", "eq", 1, "L1"),
+    RegistryRule("2.3.17.8", "User Account Control: Virtualize file and registry write failures to per-user locations",
+                 HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "EnableVirtualization", "eq", 1, "L1"),
+]
+
+
+# Fonctions de contrôle de la section (politique de sécurité, audit et contrôles composés)
+CHECK_FUNCTIONS = [
+    check_access_credential_manager, # Ajout du contrôle 2.2.1
+    check_access_computer_from_network, # Ajout du contrôle 2.2.2
+    check_act_as_part_of_os, #2.2.3
+    check_adjust_memory_quotas, #2.2.4
+    check_allow_log_on_locally, #2.2.5
+    check_allow_log_on_remote_desktop, #2.2.6
+    check_back_up_files_and_directories, #2.2.7
+    check_change_system_time, #2.2.8
+    check_change_time_zone, #2.2.9
+    check_create_pagefile, # Contrôle 2.2.10
+    check_create_token_object, # Contrôle 2.2.11
+    check_create_global_objects, #2.2.12
+    check_create_permanent_shared_objects,  #2.2.13
+    check_create_symbolic_links,  #2.2.14
+    check_debug_programs,  #2.2.15
+    check_deny_access_to_network, #2.2.16
+    check_deny_log_on_as_batch_job,  #2.2.17
+    check_deny_log_on_as_service, #2.2.18
+    check_deny_log_on_locally, #2.2.19
+    check_deny_log_on_remote_desktop, #2.2.20
+    check_trusted_for_delegation, #2.2.21
+    check_force_shutdown_remote, #2.2.22
+    check_generate_security_audits, #2.2.23
+    check_impersonate_client_after_authentication, #2.2.24
+    check_increase_scheduling_priority, #2.2.25
+    check_load_and_unload_device_drivers, #2.2.26
+    check_lock_pages_in_memory, #2.2.27
+    check_log_on_as_batch_job, #2.2.28
+    check_log_on_as_a_service, #2.2.29
+    check_manage_auditing_and_security_log, #2.2.30
+    check_modify_object_label, #2.2.31
+    check_modify_firmware_environment_values, #2.2.32
+    check_perform_volume_maintenance_tasks, #2.2.33
+    check_profile_single_process, #2.2.34
+    check_profile_system_performance, #2.2.35
+    check_replace_process_level_token, #2.2.36
+    check_restore_files_and_directories, #2.2.37
+    check_shut_down_the_system, #2.2.38
+    check_take_ownership_of_files_or_other_objects, #2.2.39
+    check_rename_administrator_account, #2.3.1.4
+    check_machine_account_lockout_threshold, #2.3.7.3
+    check_machine_inactivity_limit, #2.3.7.4
+    check_remotely_accessible_registry_paths, #2.3.10.7
+    check_remotely_accessible_registry_paths_and_sub_paths, #2.3.10.8
+]
@@ -0,0 +1,104 @@
+"""
+Section 5 : System Services (type de démarrage des services).
+"""
+from ..core import ServiceRule
+
+
+# Catalogue des contrôles de registre : une ligne par recommandation CIS.
+# (identifiant, titre, service, opérateur, type de démarrage attendu, niveau)
+# Les types de démarrage sont lus dans l'inventaire des services ; un service non installé est conforme.
+REGISTRY_RULES = [
+    # Section 5 : System Services
+    ServiceRule("5.1", "Bluetooth Audio Gateway Service (BTAGService)",
+                "BTAGService", "eq", 4, "L2"),
+    ServiceRule("5.2", "Bluetooth Support Service (bthserv)",
+                "bthserv", "eq", 4, "L2"),
+    ServiceRule("5.3", "Computer Browser (Browser)",
+                "Browser", "eq", 4, "L1"),
+    ServiceRule("5.4", "Downloaded Maps Manager (MapsBroker)",
+                "MapsBroker", "eq", 4, "L2"),
+    ServiceRule("5.5", "Geolocation Service (lfsvc)",
+                "lfsvc", "eq", 4, "L2"),
+    ServiceRule("5.6", "IIS Admin Service (IISADMIN)",
+                "IISADMIN", "eq", 4, "L1"),
+    ServiceRule("5.7", "Infrared monitor service (irmon)",
+                "irmon", "eq", 4, "L1"),
+    ServiceRule("5.8", "Link-Layer Topology Discovery Mapper (lltdsvc)",
+                "lltdsvc", "eq", 4, "L2"),
+    ServiceRule("5.9", "LxssManager (LxssManager)",
+                "LxssManager", "eq", 4, "L1"),
+    ServiceRule("5.10", "Microsoft FTP Service (FTPSVC)",
+                "FTPSVC", "eq", 4, "L1"),
+    ServiceRule("5.11", "Microsoft iSCSI Initiator Service (MSiSCSI)",
+                "MSiSCSI", "eq", 4, "L2"),
+    ServiceRule("5.12", "OpenSSH SSH Server (sshd)",
+                "sshd", "eq", 4, "L1"),
+    ServiceRule("5.13", "Peer Name Resolution Protocol (PNRPsvc)",
+                "PNRPsvc", "eq", 4, "L2"),
+    ServiceRule("5.14", "Peer Networking Grouping (p2psvc)",
+                "p2psvc", "eq", 4, "L2"),
+    ServiceRule("5.15", "Peer Networking Identity Manager (p2pimsvc)",
+                "p2pimsvc", "eq", 4, "L2"),
+    ServiceRule("5.16", "PNRP Machine Name Publication Service (PNRPAutoReg)",
+                "PNRPAutoReg", "eq", 4, "L2"),
+    ServiceRule("5.17", "Print Spooler (Spooler)",
+                "Spooler", "eq", 4, "L2"),
+    ServiceRule("5.18", "Problem Reports and Solutions Control Panel Support (wercplsupport)",
+                "wercplsupport", "eq", 4, "L2"),
+    ServiceRule("5.19", "Remote Access Auto Connection Manager (RasAuto)",
+                "RasAuto", "eq", 4, "L2"),
+    ServiceRule("5.20", "Remote Desktop Configuration (SessionEnv)",
+                "SessionEnv", "eq", 4, "L2"),
+    ServiceRule("5.21", "Remote Desktop Services (TermService)",
+                "TermService", "eq", 4, "L2"),
+    ServiceRule("5.22", "Remote Desktop Services UserMode Port Redirector (UmRdpService)",
+                "UmRdpService", "eq", 4, "L2"),
+    ServiceRule("5.23", "Remote Procedure Call (RPC) Locator (RpcLocator)",
+                "RpcLocator", "eq", 4, "L1"),
+    ServiceRule("5.24", "Remote Registry (RemoteRegistry)",
+                "RemoteRegistry", "eq", 4, "L2"),
+    ServiceRule("5.25", "Routing and Remote Access (RemoteAccess)",
+                "RemoteAccess", "eq", 4, "L1"),
+    ServiceRule("5.26", "Server (LanmanServer)",
+                "LanmanServer", "eq", 4, "L2"),
+    ServiceRule("5.27", "Simple TCP/IP Services (simptcp)",
+                "simptcp", "eq", 4, "L1"),
+    ServiceRule("5.28", "SNMP Service (SNMP)",
+                "SNMP", "eq", 4, "L2"),
+    ServiceRule("5.29", "Special Administration Console Helper (sacsvr)",
+                "sacsvr", "eq", 4, "L1"),
+    ServiceRule("5.30", "SSDP Discovery (SSDPSRV)",
+                "SSDPSRV", "eq", 4, "L1"),
+    ServiceRule("5.31", "UPnP Device Host (upnphost)",
+                "upnphost", "eq", 4, "L1"),
+    ServiceRule("5.32", "Web Management Service (WMSvc)",
+                "WMSvc", "eq", 4, "L1"),
+    ServiceRule("5.33", "Windows Error Reporting Service (WerSvc)",
+                "WerSvc", "eq", 4, "L2"),
+    ServiceRule("5.34", "Windows Event Collector (Wecsvc)",
+                "Wecsvc", "eq", 4, "L2"),
+    ServiceRule("5.35", "Windows Media Player Network Sharing Service (WMPNetworkSvc)",
+                "WMPNetworkSvc", "eq", 4, "L1"),
+    ServiceRule("5.36", "Windows Mobile Hotspot Service (icssvc)",
+                "icssvc", "eq", 4, "L1"),
+    ServiceRule("5.37", "Windows Push Notifications System Service (WpnService)",
+                "WpnService", "eq", 4, "L2"),
+    ServiceRule("5.38", "Windows PushToInstall Service (PushToInstall)",
+                "PushToInstall", "eq", 4, "L2"),
+    ServiceRule("5.39", "Windows Remote Management (WinRM)",
+                "WinRM", "eq", 4, "L2"),
+    ServiceRule("5.40", "World Wide Web Publishing Service (W3SVC)",
+                "W3SVC", "eq", 4, "L1"),
+    ServiceRule("5.41", "Xbox Accessory Management Service (XboxGipSvc)",
+                "XboxGipSvc", "eq", 4, "L1"),
+    ServiceRule("5.42", "Xbox Live Auth Manager (XblAuthManager)",
+                "XblAuthManager", "eq", 4, "L1"),
+    ServiceRule("5.43", "Xbox Live Game Save (XblGameSave)",
+                "XblGameSave", "eq", 4, "L1"),
+    ServiceRule("5.44", "Xbox Live Networking Service (XboxNetApiSvc)",
+                "XboxNetApiSvc", "eq", 4, "L1"),
+]
+
+
+# Aucune fonction de contrôle : la section ne contient que des règles du catalogue
+CHECK_FUNCTIONS = []